@@ -1,5 +1,29 @@
-from .path import Path
-from .process import Process
-from .rsync import auto_rsync
-from .session import Session
-from .watch import Watch
+import importlib
+
+# The public API is imported lazily (on first access), so that importing oxen (eg: for
+# the CLI or to validate a config) doesn't pull in tornado, watchdog or ptyprocess.
+_name_to_modules = {
+    'OutputRetention': '.output',
+    'Path': '.path',
+    'Process': '.process',
+    'RemoteProcess': '.remote',
+    'Session': '.session',
+    'Watch': '.watch',
+    'auto_rsync': '.rsync',
+}
+
+__all__ = sorted(_name_to_modules)
+
+
+def __getattr__(name):
+    module_name = _name_to_modules.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache it, so that subsequent accesses bypass this hook
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
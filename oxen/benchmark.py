@@ -0,0 +1,455 @@
+"""
+A benchmark harness for oxen's output, fan-out and watch pipelines.
+
+Each scenario runs in a fresh interpreter (so that peak RSS is attributable to it) and
+reports throughput, end-to-end latency percentiles, event loop lag and peak RSS as JSON.
+Run `oxen benchmark --help` for the available scenarios and parameters.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import re
+import resource
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+from .metrics import LoopLagProbe
+from .task import BufferedTask, TaskEvent, TaskStatus
+
+SCENARIOS = ('output', 'sessions', 'fanout', 'watch')
+
+# A child process that writes fixed-size lines at a given rate (in bytes/sec, or 0 for
+# unlimited) for a given duration. The first line of each batch is stamped with the time
+# at which it was written, which the receiving end uses to measure latency.
+EMITTER_SOURCE = '''
+import sys, time
+rate, line_size, duration = float(sys.argv[1]), int(sys.argv[2]), float(sys.argv[3])
+padding = 'x' * max(line_size - 20, 1)
+batch_lines = max(16384 // line_size, 1)
+start = time.time()
+written = 0
+while time.time() - start < duration:
+    if rate and written > rate * (time.time() - start):
+        time.sleep(0.001)
+        continue
+    batch = 'T%.6f %s\\n' % (time.time(), padding) + ('x%s\\n' % padding) * (batch_lines - 1)
+    sys.stdout.write(batch)
+    sys.stdout.flush()
+    written += len(batch)
+'''
+
+TIMESTAMP_PATTERN = re.compile(r'T(\d+\.\d{6}) ')
+
+
+def percentile(values, fraction):
+    """
+    Returns the given percentile (0-1) of the values using the nearest-rank method.
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+def summarize(values, scale=1000.0):
+    """
+    Summarizes durations (in seconds) as milliseconds.
+    """
+    return {
+        'count': len(values),
+        'p50_ms': None if not values else percentile(values, 0.5) * scale,
+        'p99_ms': None if not values else percentile(values, 0.99) * scale,
+        'max_ms': None if not values else max(values) * scale,
+    }
+
+
+def get_peak_rss():
+    # ru_maxrss is in kilobytes on Linux (but bytes on macOS)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class RecordingLagProbe(LoopLagProbe):
+    """
+    A loop lag probe that retains every observation (for percentiles).
+    """
+
+    def __init__(self, interval=0.01):
+        super().__init__(interval)
+        self.lags = []
+
+    def on_probe(self, expected):
+        self.lags.append(max(self.loop.time() - expected, 0.0))
+        super().on_probe(expected)
+
+
+class LatencyRecorder:
+    """
+    Extracts the emitter's timestamps from a stream of text fragments and records
+    the time elapsed since they were written.
+    """
+
+    def __init__(self):
+        self.latencies = []
+        self.partial = ''
+        self.received = 0
+
+    def feed(self, text):
+        now = time.time()
+        self.received += len(text)
+        text = self.partial + text
+        end = text.rfind('\n') + 1
+        self.partial = text[end:]
+        for match in TIMESTAMP_PATTERN.finditer(text, 0, end):
+            self.latencies.append(now - float(match.group(1)))
+
+
+class NullTask(BufferedTask):
+    """
+    A handler task that completes on the next iteration of the event loop.
+    """
+
+    def __init__(self):
+        super().__init__(name='null')
+        self.status = TaskStatus.PENDING
+
+    def start(self):
+        self.status = TaskStatus.ACTIVE
+        self.events.publish(TaskEvent.STATUS_CHANGED)
+        self.loop.call_soon(self.finish)
+
+    def finish(self):
+        self.status = TaskStatus.FINISHED
+        self.events.publish(TaskEvent.STATUS_CHANGED)
+
+    def stop(self):
+        pass
+
+    def get_status(self):
+        return self.status
+
+
+def create_emitter(params, name):
+    from .process import Process
+    return Process(
+        sys.executable,
+        '-c',
+        EMITTER_SOURCE,
+        params['rate'],
+        params['line_size'],
+        params['duration'],
+        name=name,
+        pty=not params['pipe']
+    )
+
+
+def follow_output(task, recorder):
+    cursor = task.output.cursor()
+
+    def on_task_event(event):
+        if event == TaskEvent.OUTPUT_UPDATED:
+            fragment = cursor.read()
+            if fragment is not None:
+                recorder.feed(fragment)
+
+    task.events.subscribe(on_task_event)
+
+
+async def wait_for_tasks(tasks):
+    while any(task.get_status() in (TaskStatus.PENDING, TaskStatus.ACTIVE) for task in tasks):
+        await asyncio.sleep(0.01)
+
+
+async def run_sessions(params):
+    """
+    Runs N sessions of M emitter processes each, measuring the output throughput and
+    the latency from the emitter writing output to it being appended to the task's log.
+    """
+    from .session import Session
+    loop = asyncio.get_event_loop()
+    recorder = LatencyRecorder()
+    sessions = []
+    for session_index in range(params['sessions']):
+        session = Session(name=f'benchmark-{session_index}')
+        for task_index in range(params['tasks']):
+            task = create_emitter(params, name=f'emitter-{session_index}-{task_index}')
+            follow_output(task, recorder)
+            session.add_task(task)
+        sessions.append(session)
+    started_at = time.perf_counter()
+    for session in sessions:
+        session.start_tasks(loop)
+    tasks = [task for session in sessions for task in session.tasks]
+    await wait_for_tasks(tasks)
+    elapsed = time.perf_counter() - started_at
+    total_bytes = sum(task.output.byte_length for task in tasks)
+    return {
+        'elapsed_s': elapsed,
+        'total_bytes': total_bytes,
+        'throughput_bytes_per_s': total_bytes / elapsed,
+        'latency': summarize(recorder.latencies),
+    }
+
+
+async def run_fanout(params):
+    """
+    Streams the output of emitter processes to K in-process WebSocket clients per task,
+    measuring the latency from the emitter writing output to a client receiving it.
+    """
+    import tornado.httpserver
+    import tornado.netutil
+    import tornado.websocket
+    from .session import Session
+    from .webserver import WebApp
+
+    loop = asyncio.get_event_loop()
+    session = Session(name='benchmark')
+    for task_index in range(params['tasks']):
+        session.add_task(create_emitter(params, name=f'emitter-{task_index}'))
+    sockets = tornado.netutil.bind_sockets(0, '127.0.0.1', family=socket.AF_INET)
+    port = sockets[0].getsockname()[1]
+    server = tornado.httpserver.HTTPServer(WebApp(session, compress_output=params['compress']))
+    server.add_sockets(sockets)
+
+    recorders = []
+
+    async def consume(task_id):
+        recorder = LatencyRecorder()
+        recorders.append(recorder)
+        connection = await tornado.websocket.websocket_connect(
+            f'ws://127.0.0.1:{port}/task-output/{task_id}',
+            compression_options={} if params['compress'] else None
+        )
+        while True:
+            message = await connection.read_message()
+            if message is None:
+                break
+            recorder.feed(message)
+
+    consumers = [
+        asyncio.ensure_future(consume(task.id))
+        for task in session.tasks for _ in range(params['clients'])
+    ]
+    # Let the clients connect before any output is produced
+    await asyncio.sleep(0.5)
+    started_at = time.perf_counter()
+    session.start_tasks(loop)
+    await wait_for_tasks(list(session.tasks))
+    # Allow the clients to receive the remaining output
+    expected = sum(len(task.output) for task in session.tasks) * params['clients']
+    deadline = time.perf_counter() + 30
+    while sum(recorder.received for recorder in recorders) < expected:
+        if time.perf_counter() > deadline:
+            break
+        await asyncio.sleep(0.01)
+    elapsed = time.perf_counter() - started_at
+    server.stop()
+    for consumer in consumers:
+        consumer.cancel()
+    received = sum(recorder.received for recorder in recorders)
+    return {
+        'elapsed_s': elapsed,
+        'received_chars': received,
+        'expected_chars': expected,
+        'throughput_chars_per_s': received / elapsed,
+        'latency': summarize([value for recorder in recorders for value in recorder.latencies]),
+    }
+
+
+async def run_watch(params):
+    """
+    Subjects a Watch (or auto_rsync) to bursts of file creations/modifications, measuring
+    the latency from the last write in a burst to the completion of the handler's task
+    (which includes the debounce delay).
+    """
+    from .rsync import auto_rsync
+    from .watch import Watch
+
+    loop = asyncio.get_event_loop()
+    source = tempfile.mkdtemp(prefix='oxen-benchmark-')
+    dest = tempfile.mkdtemp(prefix='oxen-benchmark-')
+    try:
+        if params['rsync']:
+            if shutil.which('rsync') is None:
+                raise RuntimeError('rsync is not available')
+            watch = auto_rsync(source + os.sep, dest, name='benchmark', verbose=False)
+        else:
+            watch = Watch(source, handler=lambda changes: NullTask(), name='benchmark', recursive=True)
+        watch.delay = params['delay']
+        watch.loop = loop
+        watch.start()
+        # Wait for the initial sync (if any)
+        await asyncio.sleep(0.5)
+        while watch.active_tasks or watch.pending_consume:
+            await asyncio.sleep(0.001)
+        latencies = []
+        file_writes = 0
+        started_at = time.perf_counter()
+        for burst in range(params['bursts']):
+            completed = watch.handler_latency.count
+            for index in range(params['files']):
+                path = os.path.join(source, f'dir-{index % 16}', f'file-{index}')
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, 'a') as output_file:
+                    output_file.write(f'{burst}\n')
+                file_writes += 1
+            burst_end = time.perf_counter()
+            deadline = burst_end + params['delay'] + 10
+            while watch.handler_latency.count == completed or watch.active_tasks or watch.pending_consume:
+                if time.perf_counter() > deadline:
+                    break
+                await asyncio.sleep(0.001)
+            else:
+                latencies.append(time.perf_counter() - burst_end)
+        elapsed = time.perf_counter() - started_at
+        watch.stop()
+        return {
+            'elapsed_s': elapsed,
+            'file_writes': file_writes,
+            'throughput_writes_per_s': file_writes / elapsed,
+            'handler_runs': watch.handler_latency.count,
+            'debounce_delay_s': params['delay'],
+            'latency': summarize(latencies),
+        }
+    finally:
+        shutil.rmtree(source, ignore_errors=True)
+        shutil.rmtree(dest, ignore_errors=True)
+
+
+def run_scenario(scenario, params):
+    """
+    Runs a single scenario in the current process and returns its result.
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    probe = RecordingLagProbe()
+    probe.start(loop)
+    if scenario == 'output':
+        coroutine = run_sessions(dict(params, sessions=1))
+    elif scenario == 'sessions':
+        coroutine = run_sessions(params)
+    elif scenario == 'fanout':
+        coroutine = run_fanout(params)
+    elif scenario == 'watch':
+        coroutine = run_watch(params)
+    else:
+        raise ValueError(f'Unsupported scenario: {scenario}')
+    result = loop.run_until_complete(coroutine)
+    result['loop_lag'] = summarize(probe.lags)
+    result['peak_rss_bytes'] = get_peak_rss()
+    return result
+
+
+def get_commit():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(scenarios, params):
+    """
+    Runs each scenario in a fresh interpreter and returns the combined report.
+    """
+    results = []
+    for scenario in scenarios:
+        print(f'Running {scenario}...', file=sys.stderr)
+        output = subprocess.check_output([
+            sys.executable,
+            '-m',
+            'oxen.benchmark',
+            '--run-scenario',
+            scenario,
+            '--params',
+            json.dumps(params),
+        ])
+        results.append({
+            'scenario': scenario,
+            'params': params,
+            'result': json.loads(output.decode().strip().splitlines()[-1]),
+        })
+    return {
+        'commit': get_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'timestamp': time.time(),
+        'results': results,
+    }
+
+
+def add_arguments(parser):
+    parser.add_argument(
+        'scenarios',
+        nargs='*',
+        metavar='scenario',
+        help=f'The scenarios to run ({", ".join(SCENARIOS)}). Defaults to all of them.'
+    )
+    parser.add_argument('--duration', type=float, default=3.0, help='Seconds of output per emitter')
+    parser.add_argument('--rate', type=float, default=0, help='Bytes/sec per emitter (0 for unlimited)')
+    parser.add_argument('--line-size', type=int, default=100, help='Bytes per line of output')
+    parser.add_argument('--pipe', action='store_true', help='Run emitters without a pty')
+    parser.add_argument('--sessions', type=int, default=4, help='Sessions (sessions scenario)')
+    parser.add_argument('--tasks', type=int, default=4, help='Emitters per session')
+    parser.add_argument('--clients', type=int, default=10, help='WebSocket clients per task (fanout)')
+    parser.add_argument('--no-compress', action='store_true', help='Disable permessage-deflate (fanout)')
+    parser.add_argument('--files', type=int, default=1000, help='Files written per burst (watch)')
+    parser.add_argument('--bursts', type=int, default=10, help='Bursts of file writes (watch)')
+    parser.add_argument('--delay', type=float, default=0.05, help='Watch debounce delay in seconds')
+    parser.add_argument('--rsync', action='store_true', help='Watch using auto_rsync (watch)')
+    parser.add_argument('--output', help='Write the JSON report to this path (default: stdout)')
+
+
+def run(args):
+    for scenario in args.scenarios:
+        if scenario not in SCENARIOS:
+            raise SystemExit(f'Unsupported scenario: {scenario}')
+    params = {
+        'duration': args.duration,
+        'rate': args.rate,
+        'line_size': args.line_size,
+        'pipe': args.pipe,
+        'sessions': args.sessions,
+        'tasks': args.tasks,
+        'clients': args.clients,
+        'compress': not args.no_compress,
+        'files': args.files,
+        'bursts': args.bursts,
+        'delay': args.delay,
+        'rsync': args.rsync,
+    }
+    report = json.dumps(run_benchmarks(args.scenarios or list(SCENARIOS), params), indent=2)
+    if args.output is None:
+        print(report)
+    else:
+        with open(args.output, 'w') as report_file:
+            report_file.write(report + '\n')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='oxen.benchmark')
+    parser.add_argument('--run-scenario', choices=SCENARIOS)
+    parser.add_argument('--params')
+    args, remaining = parser.parse_known_args(argv)
+    if args.run_scenario is not None:
+        # Invoked by run_benchmarks
+        print(json.dumps(run_scenario(args.run_scenario, json.loads(args.params))))
+        return
+    parser = argparse.ArgumentParser(prog='oxen.benchmark', description=__doc__)
+    add_arguments(parser)
+    run(parser.parse_args(remaining))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,319 @@
+import enum
+import os
+import re
+
+# Patterns for common sources of filesystem noise (VCS metadata, caches and editor files)
+DEFAULT_EXCLUDE = (
+    '.git/',
+    '.hg/',
+    '.svn/',
+    '__pycache__/',
+    '*.py[cod]',
+    '.*.sw[a-p]',
+    '*~',
+    '.#*',
+    '4913',
+    '.DS_Store',
+)
+
+
+def translate_pattern(pattern):
+    """
+    Translates a gitignore-style glob pattern into a regular expression that matches
+    paths relative to the root (using '/' as the separator).
+
+    Patterns containing a (non-trailing) '/' are anchored to the root. Otherwise, they can
+    match at any depth. '**' matches across directories while '*' and '?' don't.
+    """
+    anchored = '/' in pattern
+    pattern = pattern.lstrip('/')
+    regex = ''
+    index = 0
+    while index < len(pattern):
+        if pattern.startswith('**/', index):
+            regex += '(?:.*/)?'
+            index += 3
+        elif pattern.startswith('**', index):
+            regex += '.*'
+            index += 2
+        elif pattern[index] == '*':
+            regex += '[^/]*'
+            index += 1
+        elif pattern[index] == '?':
+            regex += '[^/]'
+            index += 1
+        elif pattern[index] == '[':
+            end = pattern.find(']', index + 1)
+            if end == -1:
+                regex += re.escape('[')
+                index += 1
+            else:
+                regex += '[' + pattern[index + 1:end].replace('!', '^', 1) + ']'
+                index = end + 1
+        else:
+            regex += re.escape(pattern[index])
+            index += 1
+    return re.compile(('^' if anchored else '^(?:.*/)?') + regex + '$')
+
+
+class PathRule:
+    def __init__(self, pattern):
+        self.is_negated = pattern.startswith('!')
+        pattern = pattern[1:] if self.is_negated else pattern
+        self.is_directory_only = pattern.endswith('/')
+        self.regex = translate_pattern(pattern.rstrip('/'))
+
+    def matches(self, relative_path, is_directory):
+        if self.is_directory_only and not is_directory:
+            return False
+        return self.regex.match(relative_path) is not None
+
+
+class PathFilter:
+    """
+    Decides whether paths (relative to a root directory) are of interest, based on
+    gitignore-style include and exclude patterns.
+
+    * include
+      Optional list of patterns. If provided, only paths matching at least one are accepted.
+    * exclude
+      List of patterns for paths that are ignored. As with gitignore, later patterns take
+      precedence, a '!' prefix re-includes a path, a trailing '/' only matches directories,
+      and everything within an excluded directory is excluded too.
+    * ignore_file
+      Optional path (relative to the root) of a gitignore-style file with further exclude patterns.
+    """
+
+    def __init__(self, root, *, include=None, exclude=DEFAULT_EXCLUDE, ignore_file=None):
+        self.root = os.path.abspath(root)
+        self.include = [PathRule(pattern) for pattern in include] if include else None
+        patterns = list(exclude or ())
+        if ignore_file is not None:
+            patterns.extend(self.read_patterns(os.path.join(self.root, ignore_file)))
+        self.exclude = [PathRule(pattern) for pattern in patterns]
+
+    @staticmethod
+    def read_patterns(path):
+        try:
+            with open(path) as ignore_file:
+                lines = [line.strip() for line in ignore_file]
+        except FileNotFoundError:
+            return []
+        return [line for line in lines if line and not line.startswith('#')]
+
+    def is_excluded(self, relative_path, is_directory):
+        is_excluded = False
+        for rule in self.exclude:
+            if rule.matches(relative_path, is_directory):
+                is_excluded = not rule.is_negated
+        return is_excluded
+
+    def accepts(self, path, is_directory=False):
+        relative_path = os.path.relpath(path, self.root)
+        if relative_path == os.curdir:
+            return True
+        if relative_path == os.pardir or relative_path.startswith(os.pardir + os.sep):
+            return False
+        relative_path = relative_path.replace(os.sep, '/')
+        # A path within an excluded directory is excluded as well
+        parts = relative_path.split('/')
+        for depth in range(1, len(parts)):
+            if self.is_excluded('/'.join(parts[:depth]), is_directory=True):
+                return False
+        if self.is_excluded(relative_path, is_directory):
+            return False
+        if self.include is None or is_directory:
+            return True
+        return any(rule.matches(relative_path, is_directory) for rule in self.include)
+
+
+class FilteredEvent:
+    """
+    Stands in for a watchdog event whose paths were only partially accepted by a filter.
+    """
+
+    def __init__(self, event_type, src_path, is_directory):
+        self.event_type = event_type
+        self.src_path = src_path
+        self.dest_path = ''
+        self.is_directory = is_directory
+
+
+def filter_event(path_filter, event):
+    """
+    Returns the event (or a substitute) if it's accepted by the given filter, otherwise None.
+
+    Moves that cross the filter's boundary are reduced to their accepted half: for instance,
+    an editor moving an ignored swap file over a tracked file is reported as its creation.
+    """
+    is_directory = event.is_directory
+    is_src_accepted = path_filter.accepts(os.fsdecode(event.src_path), is_directory)
+    if event.event_type != 'moved':
+        return event if is_src_accepted else None
+    is_dest_accepted = path_filter.accepts(os.fsdecode(event.dest_path), is_directory)
+    if is_src_accepted and is_dest_accepted:
+        return event
+    if is_src_accepted:
+        return FilteredEvent('deleted', event.src_path, is_directory)
+    if is_dest_accepted:
+        return FilteredEvent('created', event.dest_path, is_directory)
+    return None
+
+
+class ChangeType(enum.Enum):
+    CREATED = 'created'
+    MODIFIED = 'modified'
+    DELETED = 'deleted'
+    MOVED = 'moved'
+
+
+class Change:
+    """
+    The net change to a single path.
+
+    The attributes mirror those of watchdog's events: for moves, `src_path` is the
+    original path and `dest_path` is the new one. For all other changes, `src_path`
+    is the changed path.
+    """
+
+    def __init__(self, change_type, path, *, is_directory=False, src_path=None):
+        self.change_type = change_type
+        # The current path
+        self.path = path
+        self.is_directory = is_directory
+        self.original_path = src_path
+
+    @property
+    def event_type(self):
+        return self.change_type.value
+
+    @property
+    def src_path(self):
+        return self.original_path if self.change_type == ChangeType.MOVED else self.path
+
+    @property
+    def dest_path(self):
+        return self.path if self.change_type == ChangeType.MOVED else ''
+
+    def __repr__(self):
+        if self.change_type == ChangeType.MOVED:
+            return f'Change(moved, {self.original_path} -> {self.path})'
+        return f'Change({self.change_type.value}, {self.path})'
+
+
+class ChangeSet:
+    """
+    Coalesces a stream of watchdog events into the net change for each path.
+
+    For instance, a file that's created then modified is reported as created, while a file
+    that's created then deleted is dropped altogether. Modifications of directories (which
+    merely reflect changes to their entries) and open events are ignored.
+    Iterating over a change set yields Change instances.
+
+    Once more than `max_paths` paths have changed, the change set overflows: the individual
+    changes are discarded and consumers should assume that anything may have changed.
+    The same applies to a change set for which `is_forced` is set (eg: when a Watch is
+    triggered unconditionally).
+    """
+
+    MAX_PATHS = 10000
+
+    def __init__(self, max_paths=MAX_PATHS):
+        self.max_paths = max_paths
+        self.path_to_change = {}
+        self.overflowed = False
+        self.is_forced = False
+
+    def __iter__(self):
+        return iter(self.path_to_change.values())
+
+    def __len__(self):
+        return len(self.path_to_change)
+
+    def __bool__(self):
+        return self.overflowed or bool(self.path_to_change)
+
+    def __repr__(self):
+        if self.overflowed:
+            return 'ChangeSet(overflowed)'
+        return f'ChangeSet({list(self)})'
+
+    @property
+    def paths(self):
+        return list(self.path_to_change.keys())
+
+    def update(self, events):
+        for event in events:
+            self.add(event)
+
+    def merge(self, other):
+        """
+        Applies the (subsequent) changes in another change set to this one.
+        """
+        self.is_forced = self.is_forced or other.is_forced
+        if other.overflowed:
+            self.overflowed = True
+            self.path_to_change.clear()
+        else:
+            self.update(other)
+
+    def add(self, event):
+        if self.overflowed:
+            return
+        if len(self.path_to_change) >= self.max_paths:
+            self.overflowed = True
+            self.path_to_change.clear()
+            return
+        event_type = event.event_type
+        path = os.fsdecode(event.src_path)
+        is_directory = event.is_directory
+        if event_type == 'created':
+            self.on_created(path, is_directory)
+        elif event_type in ('modified', 'closed'):
+            if not is_directory:
+                self.on_modified(path)
+        elif event_type == 'deleted':
+            self.on_deleted(path, is_directory)
+        elif event_type == 'moved':
+            self.on_moved(path, os.fsdecode(event.dest_path), is_directory)
+
+    def on_created(self, path, is_directory):
+        existing = self.path_to_change.get(path)
+        if existing is not None and existing.change_type == ChangeType.DELETED:
+            # Replaced
+            self.path_to_change[path] = Change(ChangeType.MODIFIED, path, is_directory=is_directory)
+        else:
+            self.path_to_change[path] = Change(ChangeType.CREATED, path, is_directory=is_directory)
+
+    def on_modified(self, path):
+        if path not in self.path_to_change:
+            self.path_to_change[path] = Change(ChangeType.MODIFIED, path)
+        # Otherwise, a created, moved or modified path remains so.
+
+    def on_deleted(self, path, is_directory):
+        existing = self.path_to_change.pop(path, None)
+        if existing is not None and existing.change_type == ChangeType.CREATED:
+            # Transient
+            return
+        if existing is not None and existing.change_type == ChangeType.MOVED:
+            # The original path is what's gone
+            path = existing.original_path
+        self.path_to_change[path] = Change(ChangeType.DELETED, path, is_directory=is_directory)
+
+    def on_moved(self, src_path, dest_path, is_directory):
+        existing = self.path_to_change.pop(src_path, None)
+        if existing is not None and existing.change_type == ChangeType.CREATED:
+            self.path_to_change[dest_path] = Change(
+                ChangeType.CREATED, dest_path, is_directory=is_directory
+            )
+            return
+        if existing is not None and existing.change_type == ChangeType.MOVED:
+            src_path = existing.original_path
+        if src_path == dest_path:
+            self.path_to_change[dest_path] = Change(
+                ChangeType.MODIFIED, dest_path, is_directory=is_directory
+            )
+            return
+        self.path_to_change[dest_path] = Change(
+            ChangeType.MOVED, dest_path, is_directory=is_directory, src_path=src_path
+        )
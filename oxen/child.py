@@ -0,0 +1,88 @@
+import logging
+import os
+import signal
+import weakref
+
+
+class ChildExitMonitor:
+    """
+    Notifies callbacks when child processes exit, without polling.
+
+    Where supported (Linux 5.3+), a pidfd for each child is registered with the event loop
+    and becomes readable once the child exits. Otherwise, a single SIGCHLD handler checks
+    the registered children. In both cases the child is not reaped: that's left to the owner,
+    so that its exit status remains available (eg: via PtyProcess.isalive).
+    """
+
+    # The polling interval (in seconds) used as a last resort when SIGCHLD can't be handled
+    # (eg: when the event loop isn't running in the main thread).
+    FALLBACK_POLL_INTERVAL = 0.5
+
+    _monitors = weakref.WeakKeyDictionary()
+
+    def __init__(self, loop):
+        self.loop = loop
+        self.pid_to_callback = {}
+        self.is_sigchld_installed = False
+        self.is_polling = False
+
+    @classmethod
+    def for_loop(cls, loop):
+        monitor = cls._monitors.get(loop)
+        if monitor is None:
+            monitor = cls._monitors[loop] = cls(loop)
+        return monitor
+
+    def add(self, pid, callback):
+        """
+        Invokes `callback` (from the event loop) once the child with the given pid exits.
+        """
+        try:
+            pidfd = os.pidfd_open(pid)
+        except (AttributeError, OSError):
+            # Either pidfds aren't supported or the child has already been reaped
+            self.add_without_pidfd(pid, callback)
+            return
+
+        def on_pidfd_readable():
+            self.loop.remove_reader(pidfd)
+            os.close(pidfd)
+            callback()
+        self.loop.add_reader(pidfd, on_pidfd_readable)
+
+    def add_without_pidfd(self, pid, callback):
+        self.pid_to_callback[pid] = callback
+        if not self.is_sigchld_installed:
+            try:
+                self.loop.add_signal_handler(signal.SIGCHLD, self.on_sigchld)
+                self.is_sigchld_installed = True
+            except (RuntimeError, ValueError):
+                if not self.is_polling:
+                    logging.warning('Unable to handle SIGCHLD. Falling back to polling for exits.')
+                    self.is_polling = True
+                    self.loop.call_later(self.FALLBACK_POLL_INTERVAL, self.poll)
+        # The child may have exited before it was registered
+        self.on_sigchld()
+
+    def poll(self):
+        self.on_sigchld()
+        self.is_polling = bool(self.pid_to_callback)
+        if self.is_polling:
+            self.loop.call_later(self.FALLBACK_POLL_INTERVAL, self.poll)
+
+    def on_sigchld(self):
+        # SIGCHLDs may be coalesced, so all registered children are checked.
+        for pid, callback in list(self.pid_to_callback.items()):
+            if self.has_exited(pid):
+                del self.pid_to_callback[pid]
+                callback()
+
+    @staticmethod
+    def has_exited(pid):
+        try:
+            # WNOWAIT leaves the child in a waitable state
+            result = os.waitid(os.P_PID, pid, os.WEXITED | os.WNOHANG | os.WNOWAIT)
+        except ChildProcessError:
+            # Already reaped
+            return True
+        return result is not None
@@ -0,0 +1,80 @@
+import argparse
+import asyncio
+import logging
+
+
+def run_worker(args):
+    from .worker import Worker
+    worker = Worker(args.address, slots=args.slots, name=args.name)
+    try:
+        asyncio.get_event_loop().run_until_complete(worker.run())
+    except KeyboardInterrupt:
+        pass
+
+
+def run_session(args):
+    from .config import ConfigError, SessionConfig
+    try:
+        config = SessionConfig.load(args.config)
+    except ConfigError as err:
+        raise SystemExit(f'Invalid config: {err}')
+    for warning in config.warnings:
+        logging.warning(warning)
+    if args.check:
+        print(config.describe())
+        return
+    if args.port is not None:
+        config.port = args.port
+    if args.address is not None:
+        config.address = args.address
+    try:
+        config.start()
+    except KeyboardInterrupt:
+        pass
+
+
+def run_benchmark(args):
+    from .benchmark import run
+    run(args)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='oxen', description='Task runner with a web-based frontend')
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    worker_parser = commands.add_parser('worker', help='Execute tasks on behalf of a session')
+    worker_parser.add_argument(
+        'address',
+        help="The session's worker address (host:port or unix:/path/to/socket)"
+    )
+    worker_parser.add_argument(
+        '--slots',
+        type=int,
+        help='The number of tasks to run concurrently (defaults to the number of CPUs)'
+    )
+    worker_parser.add_argument('--name', help='The name of this worker')
+    worker_parser.set_defaults(handler=run_worker)
+
+    run_parser = commands.add_parser('run', help='Start a session described by a config file')
+    run_parser.add_argument('config', help='The session config (.toml or .json)')
+    run_parser.add_argument(
+        '--check',
+        action='store_true',
+        help='Validate the config and list its tasks, without starting the session'
+    )
+    run_parser.add_argument('--port', type=int, help='Overrides the port given by the config')
+    run_parser.add_argument('--address', help='Overrides the address given by the config')
+    run_parser.set_defaults(handler=run_session)
+
+    from .benchmark import add_arguments as add_benchmark_arguments
+    benchmark_parser = commands.add_parser(
+        'benchmark',
+        help='Measure output throughput, fan-out and watch latency'
+    )
+    add_benchmark_arguments(benchmark_parser)
+    benchmark_parser.set_defaults(handler=run_benchmark)
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    args.handler(args)
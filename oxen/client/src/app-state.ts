@@ -19,10 +19,15 @@ export class AppStateManager {
             tasks: [],
             selectedTask: null
         };
-        this.webSocket = new WebSocket(`ws://${window.location.host}/tasks`);
+        this.webSocket = new WebSocket(`ws://${window.location.host}/tasks?deltas=1`);
         this.webSocket.onmessage = msg => {
             const payload = JSON.parse(msg.data);
-            this.setTasks(payload.tasks);
+            if (payload.tasks) {
+                // Full snapshot
+                this.setTasks(payload.tasks);
+            } else {
+                this.updateTasks(payload.updated);
+            }
         };
     }
 
@@ -57,6 +62,13 @@ export class AppStateManager {
         this.setState(newState);
     }
 
+    updateTasks(updated: Array<Task>) {
+        const idToTask = new Map(updated.map(task => [task.id, task] as [number, Task]));
+        const tasks = this.lastKnownState.tasks.map(task => idToTask.get(task.id) || task);
+        const knownIds = new Set(tasks.map(task => task.id));
+        this.setTasks(tasks.concat(updated.filter(task => !knownIds.has(task.id))));
+    }
+
     selectTask(task: Task) {
         this.setState(Object.assign({}, this.lastKnownState, { selectedTask: task }));
     }
@@ -1,5 +1,5 @@
 import * as React from 'react';
-import { Task } from './task';
+import { ResourceUsage, Task } from './task';
 import { AppState, appStateManager } from './app-state';
 
 interface TaskListViewItemProps {
@@ -7,6 +7,20 @@ interface TaskListViewItemProps {
     isSelected: boolean;
 }
 
+function formatBytes(size: number) {
+    const units = ['B', 'KB', 'MB', 'GB'];
+    let unit = 0;
+    while (size >= 1024 && unit < units.length - 1) {
+        size /= 1024;
+        unit++;
+    }
+    return `${size.toFixed(unit ? 1 : 0)} ${units[unit]}`;
+}
+
+function formatResourceUsage(usage: ResourceUsage) {
+    return `${usage.cpu_percent.toFixed(0)}% CPU · ${formatBytes(usage.rss_bytes)}`;
+}
+
 class TaskListViewItem extends React.PureComponent<TaskListViewItemProps> {
     activateTask() {
         appStateManager.selectTask(this.props.task);
@@ -17,6 +31,11 @@ class TaskListViewItem extends React.PureComponent<TaskListViewItemProps> {
             <button className="task-item" onClick={() => this.activateTask()}>
                 <span className={`status-indicator status-${this.props.task.status}`} />
                 <span className="title">{this.props.task.name}</span>
+                {this.props.task.status === 'active' && this.props.task.resources && (
+                    <span className="task-resources">
+                        {formatResourceUsage(this.props.task.resources)}
+                    </span>
+                )}
             </button>
         );
     }
@@ -8,12 +8,29 @@ interface TaskViewProps {
 
 type TaskViewState = {
     connectedTask: Task;
+    // The index of the first line loaded into the view
+    firstLine: number;
 };
 
+interface TaskLines {
+    start: number;
+    stop: number;
+    line_count: number;
+    offset: number;
+    text: string;
+}
+
+// The number of lines loaded initially, and per page when scrolling back
+const PAGE_SIZE = 1000;
+
 export class TaskView extends React.Component<TaskViewProps, TaskViewState> {
     taskOutputContainer: HTMLElement;
     webSocket: WebSocket;
     ansiMarkup: AnsiUp;
+    // Incremented on every (re)connection, so that stale responses can be discarded
+    generation = 0;
+    // True while the initial output is being fetched
+    isConnecting = false;
 
     componentDidMount() {
         this.connect();
@@ -24,10 +41,12 @@ export class TaskView extends React.Component<TaskViewProps, TaskViewState> {
     }
 
     componentDidUpdate(prevProps: TaskViewProps, prevState: TaskViewState) {
+        // Task updates (eg: status changes) replace the task object, which doesn't
+        // require reconnecting (and reloading the output) unless a different task is selected
         if (
             this.state &&
             this.state.connectedTask != null &&
-            this.state.connectedTask !== this.task
+            this.state.connectedTask.id !== this.task.id
         ) {
             this.disconnect();
             this.connect();
@@ -35,31 +54,68 @@ export class TaskView extends React.Component<TaskViewProps, TaskViewState> {
     }
 
     connect() {
-        if (this.webSocket) {
+        if (this.isConnected) {
             return;
         }
-        const webSocket = new WebSocket(`ws://${window.location.host}/task-output/${this.task.id}`);
-        webSocket.onopen = () => {
+        this.isConnecting = true;
+        const generation = ++this.generation;
+        this.fetchLines(`tail=${PAGE_SIZE}`).then(lines => {
+            if (generation !== this.generation) {
+                return;
+            }
             this.taskOutputContainer.innerHTML = '';
             this.ansiMarkup = new AnsiUp();
-        };
-        webSocket.onmessage = msg => {
-            this.taskOutputContainer.insertAdjacentHTML(
-                'beforeend',
-                this.ansiMarkup.ansi_to_html(msg.data)
-            );
-            this.taskOutputContainer.scrollTop = this.taskOutputContainer.scrollHeight;
-        };
+            this.appendOutput(lines.text);
+            this.isConnecting = false;
+            this.setState({ firstLine: lines.start });
+            this.follow(lines.offset);
+        });
+        this.setState({ connectedTask: this.task });
+    }
+
+    follow(offset: number) {
+        const webSocket = new WebSocket(
+            `ws://${window.location.host}/task-output/${this.task.id}?offset=${offset}`
+        );
+        webSocket.onmessage = msg => this.appendOutput(msg.data);
         webSocket.onclose = msg => {
             if (this.webSocket === webSocket) {
                 this.disconnect();
             }
         };
         this.webSocket = webSocket;
-        this.setState({ connectedTask: this.task });
+    }
+
+    fetchLines(query: string): Promise<TaskLines> {
+        return fetch(`/task-lines/${this.task.id}?${query}`).then(response => response.json());
+    }
+
+    appendOutput(text: string) {
+        this.taskOutputContainer.insertAdjacentHTML('beforeend', this.ansiMarkup.ansi_to_html(text));
+        this.taskOutputContainer.scrollTop = this.taskOutputContainer.scrollHeight;
+    }
+
+    loadEarlierOutput() {
+        const generation = this.generation;
+        const stop = this.state.firstLine;
+        const start = Math.max(stop - PAGE_SIZE, 0);
+        this.fetchLines(`start=${start}&stop=${stop}`).then(lines => {
+            if (generation !== this.generation) {
+                return;
+            }
+            // Preserve the scroll position relative to the existing output
+            const container = this.taskOutputContainer;
+            const scrollHeight = container.scrollHeight;
+            // Formatting state doesn't carry over from the earlier output
+            container.insertAdjacentHTML('afterbegin', new AnsiUp().ansi_to_html(lines.text));
+            container.scrollTop += container.scrollHeight - scrollHeight;
+            this.setState({ firstLine: lines.start });
+        });
     }
 
     disconnect() {
+        this.generation++;
+        this.isConnecting = false;
         if (this.webSocket && this.webSocket.readyState != this.webSocket.CLOSED) {
             this.webSocket.close();
         }
@@ -67,12 +123,12 @@ export class TaskView extends React.Component<TaskViewProps, TaskViewState> {
             this.webSocket = null;
         }
         if (this.state.connectedTask != null) {
-            this.setState({ connectedTask: null });
+            this.setState({ connectedTask: null, firstLine: 0 });
         }
     }
 
     get isConnected() {
-        return this.webSocket != null;
+        return this.webSocket != null || this.isConnecting;
     }
 
     get task() {
@@ -100,6 +156,11 @@ export class TaskView extends React.Component<TaskViewProps, TaskViewState> {
                     <span className="info">{this.task.name}</span>
                     <span className="status"> &mdash; {this.task.status}</span>
                 </div>
+                {this.isConnected && this.state.firstLine > 0 && (
+                    <button className="task-output-more" onClick={() => this.loadEarlierOutput()}>
+                        Load earlier output ({this.state.firstLine} lines)
+                    </button>
+                )}
                 <pre
                     key={this.task.id}
                     ref={elem => (this.taskOutputContainer = elem)}
@@ -1,6 +1,17 @@
+export interface ResourceUsage {
+    time: number;
+    cpu_percent: number;
+    rss_bytes: number;
+    read_bytes: number;
+    write_bytes: number;
+    threads: number;
+}
+
 export interface Task {
     id: number;
     name: string;
     status: string;
     actions: Array<string>;
+    // The latest resource usage sample (null if the task isn't sampled)
+    resources: ResourceUsage | null;
 }
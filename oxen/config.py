@@ -0,0 +1,332 @@
+"""
+Builds sessions from declarative config files (TOML or JSON), as an alternative to scripts:
+
+    [session]
+    name = 'Sample'
+    port = 4242
+
+    [[tasks]]
+    name = 'Counter'
+    command = ['python', '-c', 'import time; [print(i) or time.sleep(0.5) for i in range(10)]']
+
+    [[tasks]]
+    type = 'watch'
+    name = 'Watch Echo'
+    path = '/tmp/oxen-test/dest'
+    handler = {command = 'echo Modification detected.'}
+
+    [[tasks]]
+    type = 'rsync'
+    name = 'Auto Sync'
+    source = '/tmp/oxen-test/source'
+    dest = '/tmp/oxen-test/dest'
+    depends_on = ['Counter']
+
+The [session] table accepts the arguments of Session (along with the `port` and `address`
+to listen on). Each task accepts the arguments of its type:
+
+- 'process' (the default): Process, with the `command` given as a list or a string.
+- 'remote': RemoteProcess, with the `command` given as for 'process'.
+- 'watch': Watch, with the `handler` given as a (nested) task.
+- 'rsync': auto_rsync.
+
+Any task may also declare the `resources` it requires and the (previously listed) tasks
+it `depends_on`, by name. An output `retention` (for the session or a task) is given as a
+table of OutputRetention arguments, and a process's `output_limit` as a table of OutputLimit
+arguments. Relative paths are resolved against the config file's directory (apart from remote
+rsync locations, eg: `host:/srv/app`).
+"""
+
+import functools
+import inspect
+import json
+import os
+import shlex
+import shutil
+
+from .output import OutputRetention
+from .process import Process
+from .ratelimit import OutputLimit
+from .remote import RemoteProcess
+from .rsync import auto_rsync
+from .session import Session
+from .watch import Watch
+
+
+class ConfigError(ValueError):
+    """
+    Raised for config files that can't be read or describe an invalid session.
+    """
+
+
+def read_config(path):
+    """
+    Returns the contents of the given TOML or JSON config file.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in ('.toml', '.json'):
+        raise ConfigError(f'{path}: Unsupported config format (expected .toml or .json)')
+    if extension == '.toml':
+        try:
+            import tomllib
+        except ImportError:
+            # Prior to Python 3.11
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise ConfigError(f'{path}: Reading TOML requires Python 3.11+ or tomli')
+    try:
+        with open(path, 'rb') as config_file:
+            if extension == '.toml':
+                return tomllib.load(config_file)
+            return json.load(config_file)
+    except (OSError, ValueError) as err:
+        raise ConfigError(f'{path}: {err}') from err
+
+
+def get_accepted_options(factory):
+    """
+    Returns the (accepted, required) keyword arguments of the given callable.
+    """
+    accepted = set()
+    required = set()
+    for name, parameter in inspect.signature(factory).parameters.items():
+        if parameter.kind in (parameter.POSITIONAL_OR_KEYWORD, parameter.KEYWORD_ONLY):
+            accepted.add(name)
+            if parameter.default is parameter.empty:
+                required.add(name)
+    return accepted, required
+
+
+def is_remote_path(path):
+    """
+    Returns true if rsync would treat the given path as a remote location: a `[user@]host:`
+    prefix (or an rsync:// URL), which rsync recognizes by a colon preceding any slash.
+    """
+    path = str(path)
+    colon = path.find(':')
+    return colon > 0 and '/' not in path[:colon]
+
+
+class SessionConfig:
+    """
+    A session described by a config file (see the module docs for the format).
+
+    Building the session validates the config, without side effects: no tasks, threads or
+    webserver are started, and no prior output is removed (until the session is started).
+
+    * config
+      The parsed config (see read_config).
+    * base_dir
+      The directory against which relative paths are resolved.
+    """
+
+    TASK_TYPES = ('process', 'remote', 'watch', 'rsync')
+    # The task options that are interpreted by the session, rather than the task
+    SESSION_TASK_OPTIONS = ('depends_on', 'resources')
+    # The options that accept (relative) paths, for each task type
+    PATH_OPTIONS = {
+        'process': ('cwd',),
+        'remote': (),
+        'watch': ('path', 'ignore_file'),
+        'rsync': ('source', 'dest'),
+    }
+    DEFAULT_PORT = 4242
+
+    def __init__(self, config, *, base_dir):
+        self.base_dir = base_dir
+        # Problems that don't prevent the session from starting (eg: a missing executable)
+        self.warnings = []
+        self.is_loaded = False
+        if not isinstance(config, dict):
+            raise ConfigError('The config must be a table')
+        self.check_options('config', config, accepted={'session', 'tasks'})
+        self.session, self.port, self.address = self.build_session(
+            self.get_table(config, 'session', 'config')
+        )
+        tasks = config.get('tasks', [])
+        if not isinstance(tasks, list):
+            raise ConfigError('tasks: Expected a list of tables')
+        # The (task, type, dependency names) for each task, in order
+        self.tasks = []
+        name_to_tasks = {}
+        for index, spec in enumerate(tasks):
+            location = f'tasks[{index}]'
+            if not isinstance(spec, dict):
+                raise ConfigError(f'{location}: Expected a table')
+            spec = dict(spec)
+            depends_on = spec.pop('depends_on', [])
+            if isinstance(depends_on, str):
+                depends_on = [depends_on]
+            resources = spec.pop('resources', None)
+            task = self.build_task(spec, location)
+            location = f'{location} ({task.name})'
+            dependencies = []
+            for dependency_name in depends_on:
+                candidates = name_to_tasks.get(dependency_name, [])
+                if not candidates:
+                    raise ConfigError(
+                        f'{location}: Depends on {dependency_name!r}, '
+                        'which must be a task listed before it'
+                    )
+                if len(candidates) > 1:
+                    raise ConfigError(
+                        f'{location}: Depends on {dependency_name!r}, '
+                        'which is ambiguous (multiple tasks share that name)'
+                    )
+                dependencies.append(candidates[0])
+            try:
+                self.session.add_task(task, depends_on=dependencies, resources=resources)
+            except (TypeError, ValueError) as err:
+                raise ConfigError(f'{location}: {err}') from err
+            name_to_tasks.setdefault(task.name, []).append(task)
+            self.tasks.append((task, spec.get('type', 'process'), depends_on))
+        self.is_loaded = True
+
+    @classmethod
+    def load(cls, path):
+        return cls(read_config(path), base_dir=os.path.dirname(os.path.abspath(path)))
+
+    @staticmethod
+    def get_table(spec, key, location):
+        table = spec.get(key, {})
+        if not isinstance(table, dict):
+            raise ConfigError(f'{location}: {key!r} must be a table')
+        return dict(table)
+
+    @staticmethod
+    def check_options(location, options, *, accepted, required=()):
+        unknown = sorted(set(options) - set(accepted))
+        if unknown:
+            raise ConfigError(f'{location}: Unknown option(s): {", ".join(unknown)}')
+        missing = sorted(set(required) - set(options))
+        if missing:
+            raise ConfigError(f'{location}: Missing option(s): {", ".join(missing)}')
+
+    def resolve_path(self, path):
+        return os.path.join(self.base_dir, os.path.expanduser(str(path)))
+
+    def build(self, factory, location, *args, **options):
+        """
+        Invokes the factory with the given options, once they've been validated against its signature.
+        """
+        accepted, required = get_accepted_options(factory)
+        self.check_options(location, options, accepted=accepted, required=required)
+        try:
+            return factory(*args, **options)
+        except (TypeError, ValueError) as err:
+            raise ConfigError(f'{location}: {err}') from err
+
+    def build_retention(self, options, location):
+        if 'retention' not in options:
+            return
+        retention = self.get_table(options, 'retention', location)
+        if 'spill_dir' in retention:
+            retention['spill_dir'] = self.resolve_path(retention['spill_dir'])
+        options['retention'] = self.build(OutputRetention, f'{location}.retention', **retention)
+
+    def build_session(self, options):
+        port = options.pop('port', self.DEFAULT_PORT)
+        address = options.pop('address', '')
+        if 'store_dir' in options:
+            options['store_dir'] = self.resolve_path(options['store_dir'])
+        self.build_retention(options, 'session')
+        return self.build(Session, 'session', **options), port, address
+
+    def get_command(self, options, location):
+        if 'command' not in options:
+            raise ConfigError(f'{location}: Missing option(s): command')
+        command = options.pop('command')
+        if isinstance(command, str):
+            command = shlex.split(command)
+        if not isinstance(command, list) or not command:
+            raise ConfigError(f'{location}: The command must be a non-empty list or string')
+        return command
+
+    def build_task(self, spec, location):
+        options = dict(spec)
+        task_type = options.pop('type', 'process')
+        if task_type not in self.TASK_TYPES:
+            raise ConfigError(
+                f'{location}: Unsupported task type {task_type!r} '
+                f'(expected one of: {", ".join(self.TASK_TYPES)})'
+            )
+        for key in self.PATH_OPTIONS[task_type]:
+            if key in options:
+                if task_type == 'rsync' and is_remote_path(options[key]):
+                    continue
+                options[key] = self.resolve_path(options[key])
+        self.build_retention(options, location)
+        if 'output_limit' in options:
+            output_limit = self.get_table(options, 'output_limit', location)
+            options['output_limit'] = self.build(
+                OutputLimit,
+                f'{location}.output_limit',
+                **output_limit
+            )
+
+        if task_type in ('process', 'remote'):
+            command = self.get_command(options, location)
+            if task_type == 'process':
+                self.check_executable(command[0], options.get('cwd'), location)
+            factory = Process if task_type == 'process' else RemoteProcess
+            return self.build(factory, location, *command, **options)
+
+        if task_type == 'watch':
+            self.check_path(options.get('path'), location)
+            if isinstance(options.get('fingerprint'), str):
+                options['fingerprint'] = self.resolve_path(options['fingerprint'])
+            handler_spec = self.get_table(options, 'handler', location)
+            if not handler_spec:
+                raise ConfigError(f'{location}: Missing option(s): handler')
+            handler_location = f'{location}.handler'
+            for key in self.SESSION_TASK_OPTIONS:
+                if key in handler_spec:
+                    raise ConfigError(f'{handler_location}: Unsupported option: {key}')
+            # Validates the handler up front, even if it's only invoked on changes
+            handler = self.build_task(handler_spec, handler_location)
+            if options.get('policy') == 'parallel':
+                # Every invocation requires a new task
+                handler = functools.partial(self.build_handler, handler_spec, handler_location)
+            options['handler'] = handler
+            return self.build(Watch, location, **options)
+
+        if not is_remote_path(options.get('source', '')):
+            self.check_path(options.get('source'), location)
+        return self.build(auto_rsync, location, **options)
+
+    def build_handler(self, spec, location, changes):
+        return self.build_task(spec, location)
+
+    def warn(self, message):
+        # Handlers built on demand (for the parallel watch policy) were already checked
+        if not self.is_loaded:
+            self.warnings.append(message)
+
+    def check_executable(self, executable, cwd, location):
+        if os.sep in executable:
+            path = os.path.join(cwd or self.base_dir, executable)
+            found = os.access(path, os.X_OK)
+        else:
+            found = shutil.which(executable) is not None
+        if not found:
+            self.warn(f'{location}: Executable not found: {executable}')
+
+    def check_path(self, path, location):
+        if path is not None and not os.path.exists(path):
+            self.warn(f'{location}: Path does not exist (yet): {path}')
+
+    def describe(self):
+        """
+        Returns a summary of the session, one line per task.
+        """
+        lines = [f'Session {self.session.name or "(unnamed)"!r}: {len(self.tasks)} task(s)']
+        for task, task_type, depends_on in self.tasks:
+            line = f'  {task.name} [{task_type}]'
+            if depends_on:
+                line += f', depends on: {", ".join(depends_on)}'
+            lines.append(line)
+        return '\n'.join(lines)
+
+    def start(self):
+        self.session.start(port=self.port, address=self.address)
@@ -1,19 +1,175 @@
+import asyncio
+import logging
+import time
+
+from collections import deque
+
+
+def describe_subscriber(subscriber):
+    """
+    Returns a human readable name for a subscriber (eg: 'TaskOutputHandler.on_task_event').
+    """
+    subscriber = getattr(subscriber, 'func', subscriber)
+    return getattr(subscriber, '__qualname__', None) or repr(subscriber)
+
+
+class SubscriberStats:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.last = 0.0
+        self.max = 0.0
+
+
+class DispatchProfiler:
+    """
+    Times every subscriber callback, to identify the subscribers that stall the event loop.
+
+    Timings are aggregated by subscriber name. Callbacks that take longer than the
+    given threshold (in seconds) are also logged as they happen.
+    """
+
+    # Callbacks slower than this (in seconds) are logged
+    SLOW_CALLBACK_THRESHOLD = 0.05
+
+    def __init__(self, slow_callback_threshold=SLOW_CALLBACK_THRESHOLD):
+        self.slow_callback_threshold = slow_callback_threshold
+        self.name_to_stats = {}
+
+    def record(self, subscriber, event, duration):
+        name = describe_subscriber(subscriber)
+        stats = self.name_to_stats.get(name)
+        if stats is None:
+            stats = self.name_to_stats[name] = SubscriberStats()
+        stats.count += 1
+        stats.total += duration
+        stats.last = duration
+        stats.max = max(stats.max, duration)
+        if duration >= self.slow_callback_threshold:
+            logging.warning(f'Slow event subscriber: {name} took {duration:.3f}s for {event}')
+
+
+class QueuedSubscriber:
+    """
+    Delivers events to a subscriber asynchronously (on a later iteration of the event loop),
+    through a bounded queue.
+
+    * max_size
+      The maximum number of undelivered events.
+    * policy
+      - 'merge': an event that's equal to one already queued is dropped. This suits
+        notifications that only signal that something changed (eg: OUTPUT_UPDATED).
+        If the queue is still full, the oldest event is dropped.
+      - 'drop': the oldest queued event is dropped when the queue is full.
+    """
+
+    POLICIES = ('merge', 'drop')
+
+    def __init__(self, subscriber, emitter, *, max_size, policy, loop):
+        if policy not in self.POLICIES:
+            raise ValueError(f'Unsupported policy: {policy}')
+        self.subscriber = subscriber
+        self.emitter = emitter
+        self.max_size = max_size
+        self.policy = policy
+        self.loop = loop
+        self.queue = deque()
+        self.dropped = 0
+        self.is_scheduled = False
+
+    def __call__(self, event):
+        queue = self.queue
+        if self.policy == 'merge' and event in queue:
+            return
+        if len(queue) >= self.max_size:
+            queue.popleft()
+            self.dropped += 1
+        queue.append(event)
+        if not self.is_scheduled:
+            self.is_scheduled = True
+            self.loop.call_soon(self.deliver)
+
+    def deliver(self):
+        self.is_scheduled = False
+        queue = self.queue
+        # Events published during delivery wait for the next iteration
+        for _ in range(len(queue)):
+            if not queue:
+                # Unsubscribed during delivery
+                break
+            self.emitter.dispatch(self.subscriber, queue.popleft())
+
+
 class EventEmitter:
     """
     A simple pub-sub helper.
+
+    Subscribers are kept in an immutable tuple that's replaced whenever the subscriptions
+    change (copy-on-write), so publishing never has to copy it and subscribers can safely
+    (un)subscribe while an event is being published.
+
+    By default, subscribers are invoked synchronously. Subscribing with a `queue_size` instead
+    delivers events asynchronously through a bounded queue (see QueuedSubscriber), which
+    decouples slow subscribers from the publisher.
+
+    Setting a `profiler` (a DispatchProfiler, which may be shared by several emitters)
+    times every subscriber callback.
     """
 
     def __init__(self):
-        self.subscribers = set()
+        self.subscribers = ()
+        # Maps subscribers to their queues (for those subscribed with a queue)
+        self.subscriber_to_queue = {}
+        # If set, every subscriber callback is timed
+        self.profiler = None
 
-    def subscribe(self, subscriber):
-        self.subscribers.add(subscriber)
+    def subscribe(self, subscriber, *, queue_size=None, policy='merge', loop=None):
+        if subscriber in self.subscribers or subscriber in self.subscriber_to_queue:
+            return
+        if queue_size is None:
+            self.subscribers += (subscriber,)
+            return
+        queued = QueuedSubscriber(
+            subscriber,
+            self,
+            max_size=queue_size,
+            policy=policy,
+            loop=loop or asyncio.get_event_loop()
+        )
+        self.subscriber_to_queue[subscriber] = queued
+        self.subscribers += (queued,)
 
     def unsubscribe(self, subscriber):
-        self.subscribers.remove(subscriber)
+        queued = self.subscriber_to_queue.pop(subscriber, None)
+        if queued is not None:
+            # Discard any undelivered events
+            queued.queue.clear()
+            subscriber = queued
+        elif subscriber not in self.subscribers:
+            raise KeyError(subscriber)
+        self.subscribers = tuple(entry for entry in self.subscribers if entry != subscriber)
 
     def publish(self, event):
-        # Clone the current subscribers since a subscriber
-        # might mutate the subscription in response to a published event.
-        for subscriber in set(self.subscribers):
+        # The tuple isn't modified in place, so this iterates over a consistent snapshot
+        # even if subscribers (un)subscribe in response to the event.
+        if self.profiler is None:
+            for subscriber in self.subscribers:
+                subscriber(event)
+        else:
+            for subscriber in self.subscribers:
+                if isinstance(subscriber, QueuedSubscriber):
+                    # Timed upon delivery
+                    subscriber(event)
+                else:
+                    self.dispatch(subscriber, event)
+
+    def dispatch(self, subscriber, event):
+        profiler = self.profiler
+        if profiler is None:
+            subscriber(event)
+            return
+        started_at = time.perf_counter()
+        try:
             subscriber(event)
+        finally:
+            profiler.record(subscriber, event, time.perf_counter() - started_at)
@@ -0,0 +1,117 @@
+import hashlib
+import json
+import logging
+import os
+
+from .changes import ChangeSet, ChangeType
+
+# The default directory for persisted fingerprint caches
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'oxen', 'fingerprints')
+
+
+def hash_file(path, block_size=1024 * 1024):
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, 'rb') as infile:
+        for block in iter(lambda: infile.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class FingerprintCache:
+    """
+    A persistent cache mapping file paths to content hashes.
+
+    Each entry records the (size, mtime) of the file when it was hashed. A file is only
+    re-hashed if its size or mtime differ from the recorded values.
+
+    * path
+      The JSON file in which the cache is persisted.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        self.is_dirty = False
+        self.load()
+
+    @classmethod
+    def for_directory(cls, directory):
+        """
+        Returns a cache persisted under the default cache directory for the given directory.
+        """
+        key = hashlib.sha1(os.path.abspath(directory).encode('utf8')).hexdigest()
+        return cls(os.path.join(DEFAULT_CACHE_DIR, f'{key}.json'))
+
+    def load(self):
+        try:
+            with open(self.path) as cache_file:
+                self.entries = json.load(cache_file)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def save(self):
+        if not self.is_dirty:
+            return
+        temp_path = self.path + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(temp_path, 'w') as cache_file:
+                json.dump(self.entries, cache_file)
+            os.replace(temp_path, self.path)
+        except OSError as err:
+            # The cache is merely an optimization: retried on the next save
+            logging.warning(f'Unable to save the fingerprint cache ({self.path}): {err}')
+            return
+        self.is_dirty = False
+
+    def update(self, path):
+        """
+        Returns a tuple of (previous hash, current hash) for the given path.
+        Either may be None if unknown, or if the file doesn't exist or can't be read.
+        """
+        entry = self.entries.get(path)
+        previous_hash = entry[2] if entry is not None else None
+        try:
+            stat = os.stat(path)
+            if entry is not None and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+                return previous_hash, previous_hash
+            current_hash = hash_file(path)
+        except OSError:
+            # Missing or unreadable (eg: removed since, or not permitted)
+            if entry is not None:
+                del self.entries[path]
+                self.is_dirty = True
+            return previous_hash, None
+        self.entries[path] = [stat.st_size, stat.st_mtime_ns, current_hash]
+        self.is_dirty = True
+        return previous_hash, current_hash
+
+    def get_content_changes(self, changes):
+        """
+        Returns the subset of the given ChangeSet for which the contents actually differ.
+
+        Created and modified files whose hash matches the cached value are dropped.
+        All other changes (deletions, moves, directories and files that couldn't be
+        hashed) are retained.
+        """
+        if changes.overflowed:
+            return changes
+        content_changes = ChangeSet()
+        for change in changes:
+            if change.is_directory:
+                content_changes.path_to_change[change.path] = change
+                continue
+            if change.change_type == ChangeType.MOVED:
+                self.update(change.original_path)
+                self.update(change.path)
+                content_changes.path_to_change[change.path] = change
+                continue
+            previous_hash, current_hash = self.update(change.path)
+            if (
+                change.change_type == ChangeType.DELETED or
+                current_hash is None or
+                previous_hash != current_hash
+            ):
+                content_changes.path_to_change[change.path] = change
+        self.save()
+        return content_changes
@@ -0,0 +1,245 @@
+from collections import OrderedDict
+
+from .task import BufferedTask
+
+
+class LatencyStats:
+    """
+    Accumulates observations of a duration (in seconds).
+    Exported as a Prometheus summary (sum and count), along with the latest observation.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.last = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.total += value
+        self.last = value
+
+
+class LoopLagProbe:
+    """
+    Measures the event loop's lag: the delay between when a periodic callback is
+    scheduled to run and when it actually runs.
+    """
+
+    # The interval (in seconds) between probes
+    INTERVAL = 0.5
+
+    def __init__(self, interval=INTERVAL):
+        self.interval = interval
+        self.loop = None
+        self.stats = LatencyStats()
+
+    def start(self, loop):
+        self.loop = loop
+        self.schedule()
+
+    def schedule(self):
+        expected = self.loop.time() + self.interval
+        self.loop.call_at(expected, self.on_probe, expected)
+
+    def on_probe(self, expected):
+        lag = max(self.loop.time() - expected, 0.0)
+        self.stats.observe(lag)
+        self.schedule()
+
+
+class MetricFamily:
+    def __init__(self, name, metric_type, description):
+        self.name = name
+        self.metric_type = metric_type
+        self.description = description
+        self.samples = []
+
+
+class MetricsWriter:
+    """
+    Accumulates metrics and renders them in the Prometheus text exposition format.
+    Samples are grouped by family regardless of the order in which they were added.
+    """
+
+    def __init__(self):
+        self.families = OrderedDict()
+
+    @staticmethod
+    def format_labels(labels):
+        if not labels:
+            return ''
+        pairs = []
+        for key, value in labels.items():
+            value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+            pairs.append(f'{key}="{value}"')
+        return '{' + ','.join(pairs) + '}'
+
+    def get_family(self, name, metric_type, description):
+        family = self.families.get(name)
+        if family is None:
+            family = self.families[name] = MetricFamily(name, metric_type, description)
+        return family
+
+    def add(self, name, value, description, *, labels=None, metric_type='gauge'):
+        family = self.get_family(name, metric_type, description)
+        family.samples.append(f'{name}{self.format_labels(labels)} {value}')
+
+    def add_latency(self, name, stats, description, *, labels=None):
+        family = self.get_family(name, 'summary', description)
+        formatted_labels = self.format_labels(labels)
+        family.samples.append(f'{name}_sum{formatted_labels} {stats.total}')
+        family.samples.append(f'{name}_count{formatted_labels} {stats.count}')
+        self.add(
+            f'{name}_last',
+            stats.last,
+            f'{description.rstrip(".")} (latest observation).',
+            labels=labels
+        )
+
+    def render(self):
+        lines = []
+        for family in self.families.values():
+            lines.append(f'# HELP {family.name} {family.description}')
+            lines.append(f'# TYPE {family.name} {family.metric_type}')
+            lines.extend(family.samples)
+        return '\n'.join(lines) + '\n'
+
+
+class MetricsCollector:
+    """
+    Collects a session's internal metrics on demand.
+
+    Everything is derived from counters that are maintained anyway (or sampled by the
+    loop lag probe every half a second), so collection has no ongoing cost beyond
+    the probe and is cheap enough to leave enabled.
+
+    Collecting doesn't reset anything: rates and averages are left to the scraper (eg: via
+    Prometheus' rate() over the counters), so that concurrent scrapers don't interfere.
+    """
+
+    def __init__(self, session):
+        self.session = session
+        self.loop_lag_probe = LoopLagProbe()
+
+    def start(self, loop):
+        self.loop_lag_probe.start(loop)
+
+    def collect(self, writer):
+        self.collect_loop_metrics(writer)
+        self.collect_task_metrics(writer)
+        self.collect_dispatch_metrics(writer)
+        session = self.session
+        for name, emitter in (
+            ('task_registry', session.task_registry),
+            ('task_status_monitor', session.task_status_monitor),
+        ):
+            writer.add(
+                'oxen_event_subscribers',
+                len(emitter.subscribers),
+                'The number of subscribers to an event emitter.',
+                labels={'emitter': name}
+            )
+        if session.output_store is not None:
+            stats = session.output_store.get_stats()
+            writer.add(
+                'oxen_output_store_pending_bytes',
+                stats['pending_bytes'],
+                'The output waiting to be persisted.'
+            )
+            writer.add(
+                'oxen_output_store_written_bytes_total',
+                stats['written_bytes'],
+                'The (compressed) output persisted during this run.',
+                metric_type='counter'
+            )
+        writer.add(
+            'oxen_scheduler_pending_tasks',
+            len(session.scheduler.pending),
+            'The number of tasks waiting to be started by the scheduler.'
+        )
+        writer.add(
+            'oxen_scheduler_running_tasks',
+            len(session.scheduler.running),
+            'The number of scheduled tasks currently running.'
+        )
+
+    def collect_loop_metrics(self, writer):
+        probe = self.loop_lag_probe
+        writer.add_latency(
+            'oxen_event_loop_lag_seconds',
+            probe.stats,
+            'The delay of periodic event loop probes relative to their scheduled time.'
+        )
+
+    def collect_dispatch_metrics(self, writer):
+        profiler = self.session.profiler
+        if profiler is None:
+            return
+        for name, stats in profiler.name_to_stats.items():
+            labels = {'subscriber': name}
+            writer.add_latency(
+                'oxen_event_dispatch_seconds',
+                stats,
+                'The time spent in an event subscriber\'s callback.',
+                labels=labels
+            )
+            writer.add(
+                'oxen_event_dispatch_max_seconds',
+                stats.max,
+                'The slowest invocation of an event subscriber\'s callback.',
+                labels=labels
+            )
+
+    def collect_task_metrics(self, writer):
+        for task in self.session.tasks:
+            labels = {'task': task.name, 'id': task.id}
+            writer.add(
+                'oxen_task_event_subscribers',
+                len(task.events.subscribers),
+                'The number of subscribers to a task\'s events.',
+                labels=labels
+            )
+            dropped = sum(queued.dropped for queued in task.events.subscriber_to_queue.values())
+            writer.add(
+                'oxen_task_event_dropped_total',
+                dropped,
+                'The number of task events dropped by full subscriber queues.',
+                labels=labels,
+                metric_type='counter'
+            )
+            if isinstance(task, BufferedTask):
+                self.collect_output_metrics(writer, task, labels)
+            for name, (value, description) in task.get_metrics().items():
+                if isinstance(value, LatencyStats):
+                    writer.add_latency(f'oxen_{name}', value, description, labels=labels)
+                else:
+                    writer.add(f'oxen_{name}', value, description, labels=labels)
+
+    def collect_output_metrics(self, writer, task, labels):
+        stats = task.output.get_stats()
+        writer.add(
+            'oxen_task_output_bytes_total',
+            stats['total_bytes'],
+            'The total output written by a task.',
+            labels=labels,
+            metric_type='counter'
+        )
+        writer.add(
+            'oxen_task_output_resident_bytes',
+            stats['resident_bytes'],
+            'The output held in memory for a task.',
+            labels=labels
+        )
+        writer.add(
+            'oxen_task_output_spilled_bytes',
+            stats['spilled_bytes'],
+            'The output spilled to disk for a task.',
+            labels=labels
+        )
+        writer.add(
+            'oxen_task_output_lines',
+            stats['lines'],
+            'The number of lines of output written by a task.',
+            labels=labels
+        )
@@ -0,0 +1,174 @@
+import os
+import threading
+import weakref
+
+
+class PathTrie:
+    """
+    Maps filesystem paths to values, supporting lookups by path prefix.
+    """
+
+    def __init__(self):
+        self.root = {}
+
+    @staticmethod
+    def split(path):
+        return [part for part in path.split(os.sep) if part]
+
+    def get_node(self, path, create=False):
+        node = self.root
+        for part in self.split(path):
+            children = node.setdefault('children', {}) if create else node.get('children', {})
+            if part not in children:
+                if not create:
+                    return None
+                children[part] = {}
+            node = children[part]
+        return node
+
+    def add(self, path, value):
+        self.get_node(path, create=True).setdefault('values', []).append(value)
+
+    def remove(self, path, value):
+        self.get_node(path)['values'].remove(value)
+
+    def match(self, path):
+        """
+        Yields (depth, value) for all values registered at prefixes of the given path,
+        where depth is the number of path components following the prefix.
+        """
+        parts = self.split(path)
+        node = self.root
+        for index in range(len(parts) + 1):
+            for value in node.get('values', ()):
+                yield len(parts) - index, value
+            if index == len(parts):
+                break
+            node = node.get('children', {}).get(parts[index])
+            if node is None:
+                break
+
+
+class ObserverService:
+    """
+    A single filesystem observer shared across all Watch tasks on an event loop.
+
+    Watched directories are deduplicated: a directory is only scheduled with the underlying
+    watchdog observer if it isn't already covered by a recursive watch on an ancestor.
+    Events are routed to the matching watches using a path trie on the observer thread,
+    and delivered to the event loop in batches (one hop per batch rather than per event).
+    Each watch's filters are applied on the observer thread, so ignored paths are never queued.
+    """
+
+    _services = weakref.WeakKeyDictionary()
+
+    def __init__(self, loop):
+        self.loop = loop
+        self.observer = None
+        self.trie = PathTrie()
+        # Maps each watch to its (path, recursive) subscription
+        self.subscriptions = {}
+        # Maps each scheduled path to its (watchdog handle, recursive)
+        self.scheduled = {}
+        self.lock = threading.Lock()
+        self.batch = []
+
+    @classmethod
+    def for_loop(cls, loop):
+        service = cls._services.get(loop)
+        if service is None:
+            service = cls._services[loop] = cls(loop)
+        return service
+
+    def subscribe(self, watch, path, *, recursive):
+        path = os.path.abspath(path)
+        with self.lock:
+            self.subscriptions[watch] = (path, recursive)
+            self.trie.add(path, watch)
+        self.reschedule()
+
+    def unsubscribe(self, watch):
+        with self.lock:
+            path, _ = self.subscriptions.pop(watch)
+            self.trie.remove(path, watch)
+        self.reschedule()
+
+    def get_required_paths(self):
+        """
+        Returns the minimal mapping of paths to schedule (to whether they're recursive)
+        that covers all subscriptions.
+        """
+        required = {}
+        for path, recursive in self.subscriptions.values():
+            required[path] = required.get(path, False) or recursive
+        recursive_paths = [path for path, recursive in required.items() if recursive]
+
+        def is_covered(path):
+            return any(
+                path != ancestor and path.startswith(ancestor.rstrip(os.sep) + os.sep)
+                for ancestor in recursive_paths
+            )
+
+        return {path: recursive for path, recursive in required.items() if not is_covered(path)}
+
+    def reschedule(self):
+        import watchdog.observers
+
+        required = self.get_required_paths()
+        for path, (handle, recursive) in list(self.scheduled.items()):
+            if required.get(path) != recursive:
+                self.observer.unschedule(handle)
+                del self.scheduled[path]
+        if required and self.observer is None:
+            self.observer = watchdog.observers.Observer()
+            self.observer.start()
+        for path, recursive in required.items():
+            if path not in self.scheduled:
+                handle = self.observer.schedule(self, path, recursive=recursive)
+                self.scheduled[path] = (handle, recursive)
+        if not required and self.observer is not None:
+            self.observer.stop()
+            self.observer.join()
+            self.observer = None
+
+    def get_matching_watches(self, path):
+        for depth, watch in self.trie.match(path):
+            _, recursive = self.subscriptions[watch]
+            # Non-recursive watches only observe the path itself and its immediate children
+            if recursive or depth <= 1:
+                yield watch
+
+    def dispatch(self, event):
+        """
+        Invoked by the watchdog observer thread.
+        """
+        paths = [event.src_path]
+        dest_path = getattr(event, 'dest_path', None)
+        if dest_path:
+            paths.append(dest_path)
+        with self.lock:
+            watches = set()
+            for path in paths:
+                watches.update(self.get_matching_watches(os.fsdecode(path)))
+            # Apply each watch's filters before anything is queued
+            watch_events = []
+            for watch in watches:
+                filtered_event = watch.filter_event(event)
+                if filtered_event is not None:
+                    watch_events.append((watch, filtered_event))
+            if not watch_events:
+                return
+            is_flush_pending = bool(self.batch)
+            self.batch.extend(watch_events)
+        if not is_flush_pending:
+            self.loop.call_soon_threadsafe(self.flush)
+
+    def flush(self):
+        with self.lock:
+            batch, self.batch = self.batch, []
+        watch_to_events = {}
+        for watch, event in batch:
+            watch_to_events.setdefault(watch, []).append(event)
+        for watch, events in watch_to_events.items():
+            if watch in self.subscriptions:
+                watch.dispatch_events(events)
@@ -0,0 +1,554 @@
+import bisect
+import mmap
+import os
+import shutil
+import tempfile
+import time
+import weakref
+
+from array import array
+from collections import OrderedDict
+
+DEFAULT_SEGMENT_SIZE = 64 * 1024 * 1024
+
+
+class OutputRetention:
+    """
+    Describes how much of a task's output is kept resident in memory.
+
+    Output that falls outside the retention limits is spilled to append-only
+    segment files on local disk, from which it can still be read back on demand.
+
+    * max_resident_bytes
+      Optional upper bound on the number of bytes held in memory.
+    * max_resident_age
+      Optional upper bound on how long (in seconds) output is held in memory.
+    * spill_dir
+      Optional directory for the segment files. Defaults to the system temp directory.
+    * segment_size
+      The size (in bytes) beyond which a new segment file is started.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_resident_bytes=None,
+        max_resident_age=None,
+        spill_dir=None,
+        segment_size=DEFAULT_SEGMENT_SIZE
+    ):
+        self.max_resident_bytes = max_resident_bytes
+        self.max_resident_age = max_resident_age
+        self.spill_dir = spill_dir
+        self.segment_size = segment_size
+
+
+class OutputBudget:
+    """
+    A memory budget shared across multiple output logs (eg: all tasks in a session).
+
+    Whenever the combined resident size exceeds the budget, output is spilled to disk until
+    the total is back below the low water mark (which avoids spilling on every single append).
+    The logs of finished tasks are evicted first, in their entirety (least recently finished
+    first). Only then are the oldest chunks of the logs with the most resident output spilled.
+    """
+
+    def __init__(self, max_bytes, *, low_water_mark=0.75):
+        self.max_bytes = max_bytes
+        self.low_water_mark = low_water_mark
+        self.logs = []
+        # The logs of finished tasks with resident output, in the order they finished
+        self.finished_logs = {}
+        self.resident_bytes = 0
+
+    def add(self, log):
+        assert log.budget is None
+        log.budget = self
+        self.logs.append(log)
+        self.resident_bytes += log.resident_bytes
+        if log.is_finished:
+            self.finished_logs[log] = None
+
+    def on_log_finished(self, log):
+        # Moves the log to the end (if it finished before)
+        self.finished_logs.pop(log, None)
+        self.finished_logs[log] = None
+
+    def on_log_active(self, log):
+        self.finished_logs.pop(log, None)
+
+    def enforce(self):
+        if self.resident_bytes <= self.max_bytes:
+            return
+        target = int(self.max_bytes * self.low_water_mark)
+        for log in list(self.finished_logs):
+            if self.resident_bytes <= target:
+                return
+            log.spill(0)
+            del self.finished_logs[log]
+        for log in sorted(self.logs, key=lambda log: log.resident_bytes, reverse=True):
+            excess = self.resident_bytes - target
+            if excess <= 0:
+                break
+            log.spill(max(log.resident_bytes - excess, 0))
+
+
+class OutputSegment:
+    """
+    An append-only file holding spilled output, read back using memory-mapped I/O.
+
+    Once sealed (ie: no longer written to), a segment doesn't hold on to a file descriptor.
+    Its file is reopened (read-only) to map it for reading. Since a mapping holds on to a
+    descriptor of its own, only the most recently read MAX_SEALED_MAPPINGS sealed
+    segments (across all logs) remain mapped.
+    """
+
+    MAX_SEALED_MAPPINGS = 64
+    # The mapped sealed segments, least recently read first
+    _sealed_mappings = OrderedDict()
+
+    def __init__(self, path, *, writable=True):
+        self.path = path
+        self.fd = None
+        if writable:
+            self.fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o600)
+            # Non-zero when reopening an existing segment
+            self.size = os.fstat(self.fd).st_size
+        else:
+            # An existing segment that's only read (it's neither created nor opened for writing)
+            self.size = os.stat(path).st_size
+        self.mapping = None
+
+    @property
+    def is_sealed(self):
+        return self.fd is None
+
+    def write(self, data):
+        assert not self.is_sealed
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self.fd, view):]
+        self.size += len(data)
+        return len(data)
+
+    def read(self, position, length):
+        if not length:
+            return b''
+        if self.mapping is None or len(self.mapping) < position + length:
+            # The segment has grown since it was last mapped
+            self.unmap()
+            self.mapping = self.map()
+        if self.is_sealed:
+            self.track_sealed_mapping()
+        return self.mapping[position:position + length]
+
+    def map(self):
+        if not self.is_sealed:
+            return mmap.mmap(self.fd, self.size, access=mmap.ACCESS_READ)
+        fd = os.open(self.path, os.O_RDONLY)
+        try:
+            return mmap.mmap(fd, self.size, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+
+    def track_sealed_mapping(self):
+        mappings = OutputSegment._sealed_mappings
+        mappings.pop(self, None)
+        mappings[self] = None
+        while len(mappings) > self.MAX_SEALED_MAPPINGS:
+            segment, _ = mappings.popitem(last=False)
+            segment.unmap()
+
+    def unmap(self):
+        OutputSegment._sealed_mappings.pop(self, None)
+        if self.mapping is not None:
+            self.mapping.close()
+            self.mapping = None
+
+    def seal(self):
+        """
+        Closes the segment for writing.
+        """
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+            # The current mapping (if any) is released upon the next read
+            self.unmap()
+
+    def close(self):
+        self.unmap()
+        self.seal()
+
+
+class OutputLog:
+    """
+    An append-only log of immutable text chunks.
+
+    Every chunk is tagged with its global character and byte offsets so that
+    readers can track a position within the log and retrieve only what was
+    written after it, without copying the entire history.
+
+    The oldest chunks may be spilled to disk based on the log's retention policy
+    (and the shared budget, if any). Spilled chunks are transparently read back.
+
+    The log also maintains an index of the character offset at which each line begins,
+    so that ranges of lines can be located without scanning the output.
+    """
+
+    # The empty chunk, used for joining chunks
+    EMPTY = ''
+    NEWLINE = '\n'
+
+    def __init__(self, retention=None):
+        self.retention = retention
+        self.budget = None
+        self.chunks = []
+        # The global offsets at which each chunk begins
+        self.offsets = []
+        self.byte_offsets = []
+        # The time at which each chunk was appended
+        self.timestamps = []
+        # The total number of characters/bytes written so far
+        self.length = 0
+        self.byte_length = 0
+        # Chunks preceding this index have been spilled to disk
+        self.first_resident = 0
+        # The (segment, position) for each spilled chunk
+        self.spill_locations = []
+        self.segments = []
+        self.spill_path = None
+        self.resident_bytes = 0
+        self.spilled_bytes = 0
+        # Optional writer that persists every chunk (see OutputStore)
+        self.store = None
+        # True once the task writing to this log has finished (see set_finished)
+        self.is_finished = False
+        # The character offset at which each line begins (8 bytes per line)
+        self.line_offsets = array('q', [0])
+
+    def __len__(self):
+        return self.length
+
+    def append(self, text):
+        if not text:
+            return
+        encoded = self.encode(text)
+        byte_size = len(encoded)
+        self.index_lines(text)
+        self.chunks.append(text)
+        self.offsets.append(self.length)
+        self.byte_offsets.append(self.byte_length)
+        self.timestamps.append(time.monotonic())
+        self.length += len(text)
+        self.byte_length += byte_size
+        self.update_resident_bytes(byte_size)
+        if self.store is not None:
+            self.store.append(encoded)
+        if self.retention is not None:
+            self.enforce_retention()
+        if self.budget is not None:
+            self.budget.enforce()
+
+    def index_lines(self, text):
+        line_offsets = self.line_offsets
+        index = text.find(self.NEWLINE)
+        while index != -1:
+            line_offsets.append(self.length + index + 1)
+            index = text.find(self.NEWLINE, index + 1)
+
+    def update_resident_bytes(self, delta):
+        self.resident_bytes += delta
+        if self.budget is not None:
+            self.budget.resident_bytes += delta
+
+    def enforce_retention(self):
+        """
+        Spills any chunks that exceed this log's retention limits.
+        """
+        retention = self.retention
+        if retention is None:
+            return
+        if retention.max_resident_age is not None:
+            expiry = time.monotonic() - retention.max_resident_age
+            index = bisect.bisect_left(self.timestamps, expiry, lo=self.first_resident)
+            if index > self.first_resident:
+                self.spill_chunks(index)
+        if (
+            retention.max_resident_bytes is not None and
+            self.resident_bytes > retention.max_resident_bytes
+        ):
+            self.spill(retention.max_resident_bytes)
+
+    def set_finished(self, is_finished):
+        """
+        Invoked as the task writing to this log finishes (or becomes active again).
+        Finished logs are the first to be evicted from the budget, and their last
+        segment is sealed (releasing its file descriptor).
+        """
+        if is_finished == self.is_finished:
+            return
+        self.is_finished = is_finished
+        if is_finished and self.segments:
+            self.segments[-1].seal()
+        if self.budget is not None:
+            if is_finished:
+                self.budget.on_log_finished(self)
+            else:
+                self.budget.on_log_active(self)
+
+    def spill(self, max_resident_bytes):
+        """
+        Spills the oldest chunks until at most `max_resident_bytes` remain in memory.
+        """
+        index = self.first_resident
+        resident_bytes = self.resident_bytes
+        while index < len(self.chunks) and resident_bytes > max_resident_bytes:
+            resident_bytes -= self.get_chunk_byte_size(index)
+            index += 1
+        self.spill_chunks(index)
+
+    def spill_chunks(self, stop):
+        """
+        Moves the resident chunks preceding the given index to disk.
+        """
+        if stop <= self.first_resident:
+            return
+        segment = self.get_spill_segment()
+        data = []
+        position = segment.size
+        for index in range(self.first_resident, stop):
+            encoded = self.encode(self.chunks[index])
+            data.append(encoded)
+            self.spill_locations.append((segment, position))
+            self.chunks[index] = None
+            position += len(encoded)
+        spilled_bytes = segment.write(b''.join(data))
+        if self.is_finished:
+            # Nothing further is expected to be written
+            segment.seal()
+        self.first_resident = stop
+        self.spilled_bytes += spilled_bytes
+        self.update_resident_bytes(-spilled_bytes)
+
+    def get_spill_segment(self):
+        if self.spill_path is None:
+            spill_dir = self.retention.spill_dir if self.retention is not None else None
+            self.spill_path = tempfile.mkdtemp(prefix='oxen-output-', dir=spill_dir)
+            # Remove the spilled segments once this log is no longer in use
+            weakref.finalize(self, OutputLog.remove_segments, self.segments, self.spill_path)
+        segment_size = (
+            self.retention.segment_size if self.retention is not None
+            else DEFAULT_SEGMENT_SIZE
+        )
+        last = self.segments[-1] if self.segments else None
+        if last is None or last.is_sealed or last.size >= segment_size:
+            if last is not None:
+                # Only the segment that's being written to holds on to a file descriptor
+                last.seal()
+            path = os.path.join(self.spill_path, f'{len(self.segments):06d}.segment')
+            self.segments.append(OutputSegment(path))
+        return self.segments[-1]
+
+    @staticmethod
+    def remove_segments(segments, spill_path):
+        for segment in segments:
+            segment.close()
+        shutil.rmtree(spill_path, ignore_errors=True)
+
+    def get_chunk_byte_size(self, index):
+        next_offset = (
+            self.byte_offsets[index + 1] if index + 1 < len(self.byte_offsets)
+            else self.byte_length
+        )
+        return next_offset - self.byte_offsets[index]
+
+    def get_chunk(self, index):
+        if index >= self.first_resident:
+            return self.chunks[index]
+        segment, position = self.spill_locations[index]
+        return self.decode(segment.read(position, self.get_chunk_byte_size(index)))
+
+    def get_encoded_chunk(self, index):
+        if index >= self.first_resident:
+            return self.encode(self.chunks[index])
+        segment, position = self.spill_locations[index]
+        return segment.read(position, self.get_chunk_byte_size(index))
+
+    def iter_bytes(self, start=0, stop=None):
+        """
+        Yields the (possibly partial) encoded chunks spanning the byte range [start, stop).
+        Spilled chunks are read back without being decoded.
+        """
+        stop = self.byte_length if stop is None else min(stop, self.byte_length)
+        if start >= stop:
+            return
+        index = max(bisect.bisect_right(self.byte_offsets, start) - 1, 0)
+        while index < len(self.chunks):
+            chunk_start = self.byte_offsets[index]
+            if chunk_start >= stop:
+                break
+            data = self.get_encoded_chunk(index)
+            if start > chunk_start or stop < chunk_start + len(data):
+                data = data[max(start - chunk_start, 0):stop - chunk_start]
+            yield data
+            index += 1
+
+    def find_chunk(self, offset):
+        """
+        Returns the index of the chunk containing the given character offset.
+        """
+        return bisect.bisect_right(self.offsets, offset) - 1
+
+    def iter_chunks(self, start=0, stop=None):
+        """
+        Yields the (possibly partial) chunks spanning the character range [start, stop).
+        """
+        stop = self.length if stop is None else min(stop, self.length)
+        if start >= stop:
+            return
+        index = max(self.find_chunk(start), 0)
+        while index < len(self.chunks):
+            chunk_start = self.offsets[index]
+            if chunk_start >= stop:
+                break
+            chunk = self.get_chunk(index)
+            if start > chunk_start or stop < chunk_start + len(chunk):
+                chunk = chunk[max(start - chunk_start, 0):stop - chunk_start]
+            yield chunk
+            index += 1
+
+    def read(self, start=0, stop=None):
+        """
+        Returns the text within the character range [start, stop).
+        """
+        return self.EMPTY.join(self.iter_chunks(start, stop))
+
+    def get_byte_offset(self, offset):
+        """
+        Converts a character offset into the corresponding byte offset.
+        """
+        if offset >= self.length:
+            return self.byte_length
+        index = self.find_chunk(offset)
+        prefix = self.get_chunk(index)[:offset - self.offsets[index]]
+        return self.byte_offsets[index] + len(self.encode(prefix))
+
+    @property
+    def line_count(self):
+        """
+        The number of lines written so far, including a trailing incomplete line (if any).
+        """
+        return len(self.line_offsets) - (self.line_offsets[-1] == self.length)
+
+    def get_line_offset(self, line):
+        """
+        Returns the character offset at which the given line begins.
+        Lines beyond the last one begin at the end of the log.
+        """
+        if line >= len(self.line_offsets):
+            return self.length
+        return self.line_offsets[max(line, 0)]
+
+    def find_line(self, offset):
+        """
+        Returns the index of the line containing the given character offset.
+        """
+        return bisect.bisect_right(self.line_offsets, offset) - 1
+
+    def read_lines(self, start=0, stop=None):
+        """
+        Returns the text of the lines within the range [start, stop).
+        """
+        return self.read(
+            self.get_line_offset(start),
+            None if stop is None else self.get_line_offset(stop)
+        )
+
+    @staticmethod
+    def encode(chunk):
+        return chunk.encode('utf8')
+
+    @staticmethod
+    def decode(data):
+        return data.decode('utf8')
+
+    def getvalue(self):
+        return self.read()
+
+    def cursor(self, offset=0):
+        return OutputCursor(self, offset)
+
+    def get_stats(self):
+        """
+        Returns counters describing how much of the output is resident vs. spilled.
+        """
+        return {
+            'total_bytes': self.byte_length,
+            'resident_bytes': self.resident_bytes,
+            'resident_chunks': len(self.chunks) - self.first_resident,
+            'spilled_bytes': self.spilled_bytes,
+            'spilled_chunks': self.first_resident,
+            'segments': len(self.segments),
+            'lines': self.line_count,
+            'line_index_bytes': self.line_offsets.itemsize * len(self.line_offsets),
+        }
+
+
+class BinaryOutputLog(OutputLog):
+    """
+    An OutputLog of raw byte chunks (character and byte offsets coincide).
+    """
+
+    EMPTY = b''
+    NEWLINE = b'\n'
+
+    @staticmethod
+    def encode(chunk):
+        return chunk
+
+    @staticmethod
+    def decode(data):
+        return bytes(data)
+
+
+class OutputCursor:
+    """
+    Tracks a read position within an OutputLog.
+    """
+
+    def __init__(self, log, offset=0):
+        self.log = log
+        self.offset = offset
+
+    @property
+    def pending(self):
+        """
+        The number of characters that have been written but not yet read.
+        """
+        return self.log.length - self.offset
+
+    def seek(self, offset):
+        assert 0 <= offset <= self.log.length
+        self.offset = offset
+
+    def read_chunks(self, max_length=None):
+        """
+        Returns the list of chunks written since the last read and advances the cursor.
+        If given, at most `max_length` characters are read.
+        """
+        stop = self.log.length
+        if max_length is not None:
+            stop = min(stop, self.offset + max_length)
+        chunks = list(self.log.iter_chunks(self.offset, stop))
+        self.offset = stop
+        return chunks
+
+    def read(self, max_length=None):
+        """
+        Returns the text written since the last read (or None if there's nothing new)
+        and advances the cursor. If given, at most `max_length` characters are read.
+        """
+        if self.offset == self.log.length:
+            return None
+        assert self.log.length > self.offset
+        return self.log.EMPTY.join(self.read_chunks(max_length))
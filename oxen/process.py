@@ -1,16 +1,150 @@
 import asyncio
+import codecs
+import fcntl
+import functools
 import logging
+import os
 import signal
+import subprocess
 
-from ptyprocess import PtyProcess
-
+from .child import ChildExitMonitor
 from .color import ColorText
-from .task import BufferedTask, TaskStatus, TaskAction, TaskEvent
+from .output import BinaryOutputLog, OutputLog
+from .ratelimit import OutputLimit, OutputLimiter
+from .resources import ResourceMonitor, ResourceSeries
+from .task import BufferedTask, TaskStatus, TaskAction, TaskActionError, TaskEvent
+
+
+class PipeChild:
+    """
+    A child process with piped stdout/stderr.
+
+    Exposes the subset of the PtyProcess interface used by Process.
+    """
+
+    # The pipe capacity requested from the kernel (where supported) to allow for larger reads
+    PIPE_SIZE = 1024 * 1024
+
+    def __init__(self, argv, cwd=None, env=None):
+        self.popen = subprocess.Popen(
+            argv,
+            cwd=cwd,
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        set_pipe_size = getattr(fcntl, 'F_SETPIPE_SZ', None)
+        for pipe in (self.popen.stdout, self.popen.stderr):
+            if set_pipe_size is not None:
+                try:
+                    fcntl.fcntl(pipe.fileno(), set_pipe_size, self.PIPE_SIZE)
+                except OSError:
+                    pass
+
+    @property
+    def pid(self):
+        return self.popen.pid
+
+    @property
+    def stdout_fd(self):
+        return self.popen.stdout.fileno()
+
+    @property
+    def stderr_fd(self):
+        return self.popen.stderr.fileno()
+
+    @property
+    def exitstatus(self):
+        code = self.popen.returncode
+        return code if (code is not None and code >= 0) else None
+
+    @property
+    def signalstatus(self):
+        code = self.popen.returncode
+        return -code if (code is not None and code < 0) else None
+
+    def isalive(self):
+        return self.popen.poll() is None
+
+    def terminate(self):
+        if self.isalive():
+            self.popen.terminate()
+
+    def kill(self):
+        if self.isalive():
+            self.popen.kill()
+
+    def close(self):
+        self.popen.stdout.close()
+        self.popen.stderr.close()
+
+
+class OutputReader:
+    """
+    Drains a non-blocking file descriptor using adaptively sized reads.
+
+    Reads start at MIN_BLOCK_SIZE and the block size doubles (up to max_block_size)
+    whenever a read fills the entire block.
+    """
+
+    MIN_BLOCK_SIZE = 4 * 1024
+
+    def __init__(self, fd, *, max_block_size, log=None):
+        self.fd = fd
+        self.max_block_size = max_block_size
+        # An optional log for this stream's output (in addition to the task's output)
+        self.log = log
+        self.block_size = self.MIN_BLOCK_SIZE
+        self.is_closed = False
+        # Multibyte sequences may straddle reads, so decode incrementally
+        self.decoder = codecs.getincrementaldecoder('utf8')(errors='replace')
+        os.set_blocking(fd, False)
+
+    def drain(self, max_size):
+        """
+        Returns the bytes read (up to roughly max_size) until the descriptor would block.
+        """
+        blocks = []
+        drained = 0
+        while drained < max_size:
+            try:
+                block = os.read(self.fd, self.block_size)
+            except BlockingIOError:
+                break
+            except OSError:
+                # The child end of a pty has been closed (EIO on Linux)
+                block = b''
+            if not block:
+                self.is_closed = True
+                break
+            blocks.append(block)
+            drained += len(block)
+            if len(block) < self.block_size:
+                # The descriptor has most likely been drained
+                if len(block) < self.block_size // 4:
+                    self.block_size = max(self.block_size // 2, self.MIN_BLOCK_SIZE)
+                break
+            self.block_size = min(self.block_size * 2, self.max_block_size)
+        return b''.join(blocks)
+
+    def drain_remaining(self):
+        """
+        Returns all the output that's left once the child has exited. Unlike drain, this
+        doesn't stop at the first short read, only once the descriptor would block or is closed.
+        """
+        blocks = []
+        while not self.is_closed:
+            block = self.drain(self.max_block_size)
+            if not block:
+                break
+            blocks.append(block)
+        return b''.join(blocks)
 
 
 class Process(BufferedTask):
     """
-    A task that executes a process within a pseudo-terminal.
+    A task that executes a process within a pseudo-terminal (or with piped output).
 
     * [argv]
       All positional arguments to the constructor are interpreted as the arguments to the process.
@@ -22,54 +156,133 @@ class Process(BufferedTask):
       Optional environment dictionary.
     * name
       Optional name for this task. If not provided, the command string is used as the name.
+    * retention
+      Optional OutputRetention limiting how much output is held in memory.
+    * pty
+      If false, the process is executed with its stdout and stderr connected to pipes rather
+      than a pseudo-terminal. Both are written to the task's output and are additionally
+      retained separately in the `stdout` and `stderr` logs.
+    * binary
+      If true, the `stdout` and `stderr` logs retain the raw bytes instead of decoded text.
+      Requires pty to be false (a pseudo-terminal's output isn't split into these logs).
+    * sample_interval
+      The interval (in seconds) at which the resource usage (CPU, RSS, I/O and threads)
+      of the process tree is sampled into `resources` (a ResourceSeries). Sampling is opt-in
+      (None, the default, disables it), since each sample scans the process tree.
+    * output_limit
+      Optional OutputLimit on the rate at which output is consumed. The limit can be adjusted
+      at runtime via the 'Rate Limit' action (see set_output_limit).
     """
 
-    BLOCK_SIZE = 1024
+    # The maximum size of a single read for pseudo-terminals and pipes, respectively
+    MAX_PTY_BLOCK_SIZE = 256 * 1024
+    MAX_PIPE_BLOCK_SIZE = 1024 * 1024
+    # The maximum number of bytes drained per readiness callback, so that
+    # a chatty process can't starve the rest of the event loop.
+    MAX_DRAIN_SIZE = 4 * 1024 * 1024
+    # The interval (in seconds) after which a piped process that ignored SIGTERM is killed
+    KILL_DELAY = 3.0
 
-    def __init__(self, *argv, shell=False, cwd=None, env=None, name=None):
+    def __init__(
+        self,
+        *argv,
+        shell=False,
+        cwd=None,
+        env=None,
+        name=None,
+        retention=None,
+        pty=True,
+        binary=False,
+        sample_interval=None,
+        output_limit=None
+    ):
+        if pty and binary:
+            raise ValueError('binary requires pty=False')
         self.argv = list(map(str, argv))
-        super().__init__(name=(name or ' '.join(self.argv)))
+        super().__init__(name=(name or ' '.join(self.argv)), retention=retention)
         # TODO(saumitro): Implement shell support
         self.shell = shell
         self.process = None
         self.cwd = cwd
         self.env = env
+        self.pty = pty
         self.future_process_exit = None
         self.future_restart = None
+        self.readers = []
+        self.stdout = None
+        self.stderr = None
+        if not pty:
+            log_class = BinaryOutputLog if binary else OutputLog
+            self.stdout = log_class(retention=retention)
+            self.stderr = log_class(retention=retention)
+        self.sample_interval = sample_interval
+        self.resources = ResourceSeries() if sample_interval is not None else None
+        self.output_limiter = OutputLimiter(output_limit) if output_limit is not None else None
+        # True if reading was suspended by the 'pause' output limit action
+        self.is_output_paused = False
+        # True if reading was suspended by the consumer of the output (see suspend_reading)
+        self.is_reading_suspended = False
+        # The timer for the next summary of the output dropped due to the output limit
+        self.summary_handle = None
+        # The timer for killing a piped process that was stopped (see KILL_DELAY)
+        self.kill_handle = None
 
     def start(self):
         assert (self.process is None) or (not self.process.isalive())
 
         # Make sure any previously registered readers are first removed so that
         # they aren't accidentally invoked for the new process
-        if self.process is not None:
-            self.loop.remove_reader(self.process.fd)
-
-        # Start the process
-        self.process = PtyProcess.spawn(
-            self.argv,
-            cwd=self.cwd,
-            env=self.env,
-        )
+        self.remove_readers()
 
-        # Monitor process output
-        self.loop.add_reader(self.process.fd, self.on_data_available)
+        # Start the process and monitor its output
+        if self.pty:
+            # Imported on first use, since it's only needed once a process is started
+            from ptyprocess import PtyProcess
+            self.process = PtyProcess.spawn(
+                self.argv,
+                cwd=self.cwd,
+                env=self.env,
+            )
+            self.readers = [OutputReader(self.process.fd, max_block_size=self.MAX_PTY_BLOCK_SIZE)]
+        else:
+            self.process = PipeChild(self.argv, cwd=self.cwd, env=self.env)
+            self.readers = [
+                OutputReader(
+                    self.process.stdout_fd,
+                    max_block_size=self.MAX_PIPE_BLOCK_SIZE,
+                    log=self.stdout
+                ),
+                OutputReader(
+                    self.process.stderr_fd,
+                    max_block_size=self.MAX_PIPE_BLOCK_SIZE,
+                    log=self.stderr
+                ),
+            ]
+        self.add_readers()
 
         # Monitor process exit
-        async def monitor_process_status(process):
-            while process.isalive():
-                await asyncio.sleep(0.5)
-            self.on_process_terminate(process)
-            self.future_process_exit = None
-        self.future_process_exit = asyncio.ensure_future(monitor_process_status(self.process))
+        self.future_process_exit = self.loop.create_future()
+        ChildExitMonitor.for_loop(self.loop).add(
+            self.process.pid,
+            functools.partial(self.on_process_exit, self.process, self.future_process_exit)
+        )
+        if self.resources is not None:
+            ResourceMonitor.for_loop(self.loop).add(self, self.process.pid, self.sample_interval)
 
         # Transition status
         self.events.publish(TaskEvent.STATUS_CHANGED)
 
     def stop(self):
-        # The force flag is treated as a last resort. PtyProcess first attempts
-        # to amicably terminate the process with SIGHUP/SIGINT.
-        self.process.terminate(force=True)
+        if self.process is None:
+            return
+        if self.pty:
+            # The force flag is treated as a last resort. PtyProcess first attempts
+            # to amicably terminate the process with SIGHUP/SIGINT.
+            self.process.terminate(force=True)
+        else:
+            self.process.terminate()
+            if self.kill_handle is None:
+                self.kill_handle = self.loop.call_later(self.KILL_DELAY, self.process.kill)
 
     def restart(self):
         if self.future_restart is not None:
@@ -84,19 +297,199 @@ class Process(BufferedTask):
 
         self.future_restart = asyncio.ensure_future(stop_then_start())
 
-    def on_data_available(self):
-        if not self.process.isalive():
+    def on_data_available(self, reader):
+        limiter = self.output_limiter
+        if limiter is None or not limiter.is_active:
+            data = reader.drain(self.MAX_DRAIN_SIZE)
+            if reader.is_closed:
+                self.loop.remove_reader(reader.fd)
+            self.write_decoded_output(reader, data)
             return
-        try:
-            self.write_output(self.process.read(self.BLOCK_SIZE).decode('utf8'))
-        except EOFError:
-            pass
+        data = reader.drain(limiter.get_read_size(self.MAX_DRAIN_SIZE))
+        if reader.is_closed:
+            self.loop.remove_reader(reader.fd)
+        self.write_limited_output(reader, data)
+
+    def write_limited_output(self, reader, data, final=False):
+        limiter = self.output_limiter
+        if limiter.action in ('drop', 'sample'):
+            data, is_exceeded = limiter.admit(data)
+            self.write_decoded_output(reader, data, final=final)
+            if is_exceeded and not final and self.summary_handle is None:
+                # The dropped output is summarized at intervals (rather than on every read)
+                self.summary_handle = self.loop.call_later(
+                    limiter.get_summary_delay(),
+                    self.write_limit_summary
+                )
+            return
+        # The remaining actions retain all of the output that's been read
+        self.write_decoded_output(reader, data, final=final)
+        delay = limiter.consume(data)
+        if delay <= 0 or final or reader.is_closed:
+            return
+        if limiter.action == 'throttle':
+            # Reading resumes once the output is back within the limits. Until then,
+            # the process blocks once it fills up the pty/pipe buffer.
+            self.loop.remove_reader(reader.fd)
+            self.loop.call_later(delay, self.resume_reader, reader)
+        elif limiter.action == 'pause':
+            self.pause_output()
+        elif limiter.action == 'kill':
+            self.remove_readers()
+            self.write_output(ColorText.red(
+                f'\n[Stopping: output rate limit exceeded ({limiter.limit.describe()})]\n'
+            ))
+            self.stop()
+
+    def write_limit_summary(self, force=False):
+        if self.summary_handle is not None:
+            self.summary_handle.cancel()
+            self.summary_handle = None
+        summary = self.output_limiter.get_summary(force=force)
+        if summary is not None:
+            self.write_output(summary)
+
+    def resume_reader(self, reader):
+        # The reader may have since been closed, removed or paused
+        if (
+            reader in self.readers and
+            not reader.is_closed and
+            not self.is_output_paused and
+            not self.is_reading_suspended
+        ):
+            self.loop.add_reader(reader.fd, self.on_data_available, reader)
+
+    def pause_output(self):
+        self.is_output_paused = True
+        for reader in self.readers:
+            self.loop.remove_reader(reader.fd)
+        self.write_output(ColorText.yellow(
+            f'\n[Output paused: rate limit exceeded ({self.output_limiter.limit.describe()}). '
+            'Use the Resume action to continue.]\n'
+        ))
+
+    def resume_output(self):
+        """
+        Resumes reading output, if it was suspended due to the output limit.
+        """
+        self.is_output_paused = False
+        if self.output_limiter is not None:
+            # Start over with full buckets
+            self.output_limiter.set_limit(self.output_limiter.limit)
+        self.add_readers()
+
+    def suspend_reading(self):
+        """
+        Stops reading the process's output until resume_reading is invoked (eg: while the
+        output's consumer catches up). The process blocks once it fills up the pty/pipe buffers.
+        """
+        self.is_reading_suspended = True
+        for reader in self.readers:
+            self.loop.remove_reader(reader.fd)
+
+    def resume_reading(self):
+        self.is_reading_suspended = False
+        self.add_readers()
+
+    def set_output_limit(
+        self,
+        *,
+        bytes_per_second=None,
+        lines_per_second=None,
+        burst=None,
+        action=None
+    ):
+        """
+        Adjusts the output limit at runtime. The given options (see OutputLimit) replace
+        those of the current limit, where zero disables a rate limit. Without any options,
+        the output limit is toggled on/off.
+
+        A limit can be set this way even if the process was created without one.
+        """
+        options = {
+            name: value for name, value in (
+                ('bytes_per_second', bytes_per_second),
+                ('lines_per_second', lines_per_second),
+                ('burst', burst),
+                ('action', action),
+            ) if value is not None
+        }
+        limiter = self.output_limiter
+        if limiter is None and not options:
+            return 'Output limit: none set'
+        if options:
+            settings = limiter.limit.get_options() if limiter is not None else {}
+            settings.update(options)
+            try:
+                limit = OutputLimit(**settings)
+            except ValueError as err:
+                raise TaskActionError(str(err)) from err
+            if limiter is None:
+                limiter = self.output_limiter = OutputLimiter(limit)
+            else:
+                limiter.set_limit(limit)
+                limiter.is_enabled = True
+        else:
+            limiter.is_enabled = not limiter.is_enabled
+        if self.process is not None and self.process.isalive():
+            self.resume_output()
+        description = limiter.limit.describe() if limiter.is_enabled else 'disabled'
+        self.write_output(ColorText.yellow(f'\n[Output limit: {description}]\n'))
+        return f'Output limit: {description}'
+
+    def write_decoded_output(self, reader, data, final=False):
+        text = reader.decoder.decode(data, final=final)
+        if reader.log is not None:
+            reader.log.append(data if isinstance(reader.log, BinaryOutputLog) else text)
+        if text:
+            self.write_output(text)
+
+    def add_readers(self):
+        if self.is_output_paused or self.is_reading_suspended:
+            return
+        for reader in self.readers:
+            if not reader.is_closed:
+                # Replaces the reader if it's already registered
+                self.loop.add_reader(reader.fd, self.on_data_available, reader)
+
+    def remove_readers(self):
+        for reader in self.readers:
+            self.loop.remove_reader(reader.fd)
+        self.readers = []
+
+    def on_process_exit(self, process, future_exit):
+        # Reap the process and capture its exit status
+        process.isalive()
+        if self.resources is not None and process == self.process:
+            ResourceMonitor.for_loop(self.loop).remove(self)
+        self.on_process_terminate(process)
+        if self.future_process_exit is future_exit:
+            self.future_process_exit = None
+        future_exit.set_result(None)
 
     def on_process_terminate(self, process):
         if process != self.process:
             logging.warn(f'Internal inconsistency: process changed before termination callback.')
             return
-        self.loop.remove_reader(self.process.fd)
+        # Collect any output that's still buffered in the pty/pipes
+        limiter = self.output_limiter
+        for reader in self.readers:
+            data = reader.drain_remaining()
+            if limiter is not None and limiter.is_active:
+                self.write_limited_output(reader, data, final=True)
+            else:
+                self.write_decoded_output(reader, data, final=True)
+        if limiter is not None:
+            # Any output dropped since the last summary is summarized right away
+            self.write_limit_summary(force=True)
+        self.remove_readers()
+        self.is_output_paused = False
+        if self.kill_handle is not None:
+            # No longer needed once the process has exited
+            self.kill_handle.cancel()
+            self.kill_handle = None
+        if not self.pty:
+            self.process.close()
         self.output_termination_message(self.get_status())
         self.events.publish(TaskEvent.STATUS_CHANGED)
 
@@ -115,10 +508,48 @@ class Process(BufferedTask):
     def get_actions(self):
         return [
             TaskAction(name='Stop', handler=self.stop),
-            TaskAction(name='Restart', handler=self.restart)
+            TaskAction(name='Restart', handler=self.restart),
+            # The output limit can be set at runtime, even if none was configured
+            TaskAction(name='Rate Limit', handler=self.set_output_limit),
+            TaskAction(name='Resume', handler=self.resume_output),
         ]
 
+    def get_resource_usage(self):
+        return self.resources.get_latest() if self.resources is not None else None
+
+    def get_metrics(self):
+        metrics = {}
+        usage = self.get_resource_usage()
+        if usage is not None:
+            metrics.update({
+                'process_cpu_percent': (
+                    usage['cpu_percent'],
+                    'The CPU usage of a process tree (100 per fully utilized core).'
+                ),
+                'process_rss_bytes': (usage['rss_bytes'], 'The resident memory of a process tree.'),
+                'process_threads': (usage['threads'], 'The number of threads in a process tree.'),
+            })
+        limiter = self.output_limiter
+        if limiter is not None:
+            metrics.update({
+                'process_output_limit_exceeded': (
+                    limiter.exceeded_count,
+                    'The number of times a process\'s output exceeded its rate limit.'
+                ),
+                'process_output_dropped_bytes': (
+                    limiter.total_dropped_bytes,
+                    'The output discarded due to a process\'s rate limit.'
+                ),
+                'process_output_paused': (
+                    int(self.is_output_paused),
+                    'Whether reading a process\'s output is paused due to its rate limit.'
+                ),
+            })
+        return metrics
+
     def get_status(self):
+        if self.process is None:
+            return TaskStatus.PENDING
         if self.process.isalive():
             return TaskStatus.ACTIVE
         if self.process.exitstatus == 0:
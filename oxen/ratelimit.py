@@ -0,0 +1,283 @@
+import time
+
+from .color import ColorText
+
+NEWLINE = b'\n'
+
+
+class TokenBucket:
+    """
+    Permits a sustained `rate` (units per second), with bursts of up to `capacity` units.
+    """
+
+    def __init__(self, rate, capacity, now):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = now
+
+    def refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def consume(self, amount):
+        """
+        Consumes the given amount, which may leave the bucket in debt (see get_delay).
+        """
+        self.tokens -= amount
+
+    def get_delay(self):
+        """
+        Returns the time (in seconds) until the bucket is out of debt.
+        """
+        return max(-self.tokens, 0) / self.rate
+
+
+class OutputLimit:
+    """
+    Limits the rate at which a process's output is consumed.
+
+    * bytes_per_second
+      Optional limit on the output's byte rate.
+    * lines_per_second
+      Optional limit on the output's line rate.
+    * burst
+      The duration (in seconds) of output at the limit that may be written at once.
+    * action
+      What to do with output beyond the limits:
+      - 'throttle': reading is suspended until the output is back within the limits.
+        The process blocks once the pty/pipe buffers fill up (real backpressure).
+      - 'drop': the excess output is discarded. A line summarizing the dropped output is
+        written at most once per OutputLimiter.SUMMARY_INTERVAL (and when the process exits).
+      - 'sample': like 'drop', except that a line of the excess output is retained at
+        regular intervals (see OutputLimiter.SAMPLE_INTERVAL) so progress remains visible.
+      - 'pause': reading is suspended until the task's Resume action is performed.
+      - 'kill': the process is stopped.
+    """
+
+    ACTIONS = ('throttle', 'drop', 'sample', 'pause', 'kill')
+
+    def __init__(
+        self,
+        *,
+        bytes_per_second=None,
+        lines_per_second=None,
+        burst=1.0,
+        action='throttle'
+    ):
+        if action not in self.ACTIONS:
+            raise ValueError(f'Unsupported output limit action: {action}')
+        for rate in (bytes_per_second, lines_per_second, burst):
+            if rate is not None and (isinstance(rate, bool) or not isinstance(rate, (int, float))):
+                raise ValueError(f'Invalid output limit: {rate!r} (expected a number)')
+        if (bytes_per_second or 0) < 0 or (lines_per_second or 0) < 0:
+            raise ValueError('The output limit rates must not be negative')
+        if burst <= 0:
+            raise ValueError('The output limit burst must be positive')
+        self.bytes_per_second = bytes_per_second or None
+        self.lines_per_second = lines_per_second or None
+        self.burst = burst
+        self.action = action
+
+    def get_options(self):
+        """
+        Returns the arguments from which an identical OutputLimit can be created.
+        """
+        return {
+            'bytes_per_second': self.bytes_per_second,
+            'lines_per_second': self.lines_per_second,
+            'burst': self.burst,
+            'action': self.action,
+        }
+
+    def describe(self):
+        limits = []
+        if self.bytes_per_second is not None:
+            limits.append(f'{self.bytes_per_second:g} bytes/s')
+        if self.lines_per_second is not None:
+            limits.append(f'{self.lines_per_second:g} lines/s')
+        return f'{", ".join(limits) or "unlimited"} ({self.action})'
+
+
+def format_size(size):
+    for unit in ('bytes', 'KB', 'MB'):
+        if size < 1024:
+            return f'{size:.4g} {unit}'
+        size /= 1024
+    return f'{size:.4g} GB'
+
+
+class OutputLimiter:
+    """
+    Applies an OutputLimit to the output of a process, as it's read.
+
+    The byte and line rates are each enforced by a TokenBucket. Output is admitted
+    in whole lines whenever it has to be cut short, so that the retained output remains
+    readable (and multibyte sequences aren't split).
+
+    The limiter can be disabled (and re-enabled) at runtime, and its limit replaced.
+    """
+
+    # The interval (in seconds) at which a line is retained from the excess output ('sample')
+    SAMPLE_INTERVAL = 1.0
+    # The minimum interval (in seconds) between summaries of the dropped output
+    SUMMARY_INTERVAL = 5.0
+
+    def __init__(self, limit, clock=time.monotonic):
+        self.clock = clock
+        self.is_enabled = True
+        self.dropped_bytes = 0
+        self.dropped_lines = 0
+        # The totals across the lifetime of the task
+        self.total_dropped_bytes = 0
+        self.exceeded_count = 0
+        self.last_summary_at = None
+        self.last_sample_at = None
+        self.set_limit(limit)
+
+    def set_limit(self, limit):
+        now = self.clock()
+        self.limit = limit
+        self.byte_bucket = self.line_bucket = None
+        if limit.bytes_per_second is not None:
+            rate = limit.bytes_per_second
+            self.byte_bucket = TokenBucket(rate, rate * limit.burst, now)
+        if limit.lines_per_second is not None:
+            rate = limit.lines_per_second
+            self.line_bucket = TokenBucket(rate, rate * limit.burst, now)
+
+    @property
+    def action(self):
+        return self.limit.action
+
+    @property
+    def buckets(self):
+        return [bucket for bucket in (self.byte_bucket, self.line_bucket) if bucket is not None]
+
+    @property
+    def is_active(self):
+        return self.is_enabled and bool(self.buckets)
+
+    def refill(self):
+        now = self.clock()
+        for bucket in self.buckets:
+            bucket.refill(now)
+        return now
+
+    def get_read_size(self, max_size):
+        """
+        Bounds the size of a read, so that the output consumed at once doesn't vastly
+        exceed the burst size.
+        """
+        if not self.is_active or self.byte_bucket is None:
+            return max_size
+        return min(max_size, max(int(self.byte_bucket.capacity), 1))
+
+    def consume(self, data):
+        """
+        Consumes all of the given data, returning the time (in seconds) until the output is
+        back within the limits (ie: how long reading should be suspended). Used by the
+        actions that don't discard output ('throttle', 'pause' and 'kill').
+        """
+        if not self.is_active:
+            return 0
+        self.refill()
+        self.charge(data)
+        delay = max(bucket.get_delay() for bucket in self.buckets)
+        if delay > 0:
+            self.exceeded_count += 1
+        return delay
+
+    def charge(self, data):
+        """
+        Consumes the given data from the buckets (possibly leaving them in debt).
+        """
+        if self.byte_bucket is not None:
+            self.byte_bucket.consume(len(data))
+        if self.line_bucket is not None:
+            self.line_bucket.consume(data.count(NEWLINE))
+
+    def get_admissible_size(self, data):
+        """
+        Returns the length of the prefix of the data that's within the limits.
+        """
+        max_bytes = self.byte_bucket.tokens if self.byte_bucket is not None else len(data)
+        max_lines = self.line_bucket.tokens if self.line_bucket is not None else len(data)
+        if len(data) <= max_bytes and data.count(NEWLINE) <= max_lines:
+            return len(data)
+        # Cut after the last newline that's within both limits
+        size = 0
+        lines = 0
+        index = data.find(NEWLINE)
+        while index != -1 and index + 1 <= max_bytes and lines + 1 <= max_lines:
+            size = index + 1
+            lines += 1
+            index = data.find(NEWLINE, size)
+        return size
+
+    def admit(self, data):
+        """
+        Returns the (prefix of the) data that's within the limits and whether any of it was
+        excluded. The excluded output is tallied for the summary (see get_summary).
+        """
+        if not self.is_active:
+            return data, False
+        now = self.refill()
+        size = self.get_admissible_size(data)
+        admitted, excess = data[:size], data[size:]
+        self.charge(admitted)
+        if not excess:
+            return admitted, False
+        self.exceeded_count += 1
+        if self.action == 'sample' and (
+            self.last_sample_at is None or now - self.last_sample_at >= self.SAMPLE_INTERVAL
+        ):
+            sample = self.get_last_line(excess)
+            if sample:
+                self.last_sample_at = now
+                admitted += sample
+                excess = excess[:len(excess) - len(sample)]
+        if not self.dropped_bytes:
+            # Summaries are written at intervals starting from the first drop
+            self.last_summary_at = now
+        self.dropped_bytes += len(excess)
+        self.dropped_lines += excess.count(NEWLINE)
+        self.total_dropped_bytes += len(excess)
+        return admitted, True
+
+    @staticmethod
+    def get_last_line(data):
+        end = data.rfind(NEWLINE)
+        if end == -1:
+            return b''
+        return data[data.rfind(NEWLINE, 0, end) + 1:end + 1]
+
+    def get_summary_delay(self):
+        """
+        Returns the time (in seconds) until the next summary is due, or None if no output
+        has been dropped since the previous summary.
+        """
+        if not self.dropped_bytes:
+            return None
+        return max(self.last_summary_at + self.SUMMARY_INTERVAL - self.clock(), 0)
+
+    def get_summary(self, *, force=False):
+        """
+        Returns a line summarizing the output dropped since the previous summary, if it's
+        due (or forced). Otherwise returns None.
+
+        The summary counts against the limits, so that summarizing can't add to the output
+        beyond what the limits permit.
+        """
+        delay = self.get_summary_delay()
+        if delay is None or (delay > 0 and not force):
+            return None
+        summary = ColorText.yellow(
+            f'\n[Output rate limit exceeded ({self.limit.describe()}): dropped '
+            f'{format_size(self.dropped_bytes)} ({self.dropped_lines} lines)]\n'
+        )
+        self.dropped_bytes = 0
+        self.dropped_lines = 0
+        self.last_summary_at = self.refill()
+        self.charge(summary.encode('utf8'))
+        return summary
@@ -0,0 +1,75 @@
+import json
+
+from collections import OrderedDict
+
+from .event import EventEmitter
+
+
+def get_task_info(task):
+    return {
+        'id': task.id,
+        'name': task.name,
+        'status': task.get_status().value,
+        'actions': [action.name for action in task.get_actions()],
+        'resources': task.get_resource_usage(),
+    }
+
+
+class TaskRegistry(EventEmitter):
+    """
+    Maintains a versioned snapshot of the info for a collection of tasks.
+
+    Tasks are marked dirty when their status changes (or their resource usage is sampled).
+    All changes within a single event loop iteration are coalesced: the info for just the
+    dirty tasks is recomputed, the version is bumped and subscribers are published a single
+    delta (the list of updated task infos). The JSON encoded snapshot and deltas are cached so that they
+    can be shared across all clients.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.loop = None
+        self.version = 0
+        self.id_to_info = OrderedDict()
+        self.dirty_tasks = OrderedDict()
+        self.cached_snapshot = None
+
+    def add(self, task):
+        task_id = task.id
+        self.id_to_info[task_id] = None
+        self.invalidate(task)
+
+    def invalidate(self, task):
+        """
+        Marks the given task's info as stale.
+        """
+        if not self.dirty_tasks:
+            self.loop.call_soon(self.flush)
+        self.dirty_tasks[task.id] = task
+
+    def flush(self):
+        if not self.dirty_tasks:
+            return
+        updated = []
+        for task_id, task in self.dirty_tasks.items():
+            info = get_task_info(task)
+            if info != self.id_to_info[task_id]:
+                self.id_to_info[task_id] = info
+                updated.append(info)
+        self.dirty_tasks.clear()
+        if not updated:
+            return
+        self.version += 1
+        self.cached_snapshot = None
+        self.publish(json.dumps({'version': self.version, 'updated': updated}))
+
+    def get_snapshot(self):
+        """
+        Returns the JSON encoded info for all tasks.
+        """
+        if self.cached_snapshot is None:
+            self.cached_snapshot = json.dumps({
+                'version': self.version,
+                'tasks': [info for info in self.id_to_info.values() if info is not None],
+            })
+        return self.cached_snapshot
@@ -0,0 +1,327 @@
+import asyncio
+import json
+import logging
+
+from collections import deque
+
+from .color import ColorText, status_ok
+from .task import BufferedTask, TaskAction, TaskEvent, TaskStatus
+
+# The limit (in bytes) for a single protocol message
+MESSAGE_SIZE_LIMIT = 64 * 1024 * 1024
+# The host for addresses that omit it (`:port`). Workers aren't authenticated, so accepting
+# them on other interfaces requires an explicit host (eg: `0.0.0.0:port`).
+DEFAULT_HOST = '127.0.0.1'
+
+
+def parse_address(address):
+    """
+    Parses an address of the form `host:port`, `:port` (see DEFAULT_HOST) or
+    `unix:/path/to/socket`. Returns either a (host, port) tuple or the unix socket path.
+    """
+    if address.startswith('unix:'):
+        return address[len('unix:'):]
+    host, _, port = address.rpartition(':')
+    return (host or DEFAULT_HOST, int(port))
+
+
+async def open_connection(address):
+    parsed = parse_address(address)
+    if isinstance(parsed, str):
+        return await asyncio.open_unix_connection(parsed, limit=MESSAGE_SIZE_LIMIT)
+    host, port = parsed
+    return await asyncio.open_connection(host, port, limit=MESSAGE_SIZE_LIMIT)
+
+
+async def start_server(address, client_connected):
+    parsed = parse_address(address)
+    if isinstance(parsed, str):
+        return await asyncio.start_unix_server(
+            client_connected, parsed, limit=MESSAGE_SIZE_LIMIT
+        )
+    host, port = parsed
+    return await asyncio.start_server(client_connected, host, port, limit=MESSAGE_SIZE_LIMIT)
+
+
+def send_message(writer, **message):
+    """
+    Messages are newline-delimited JSON objects.
+    """
+    writer.write(json.dumps(message).encode('utf8') + b'\n')
+
+
+class MessageWriter:
+    """
+    Writes messages to a stream, tracking whether the peer is keeping up.
+
+    Writes never block. Instead, the writer is congested once the transport has buffered
+    more than its high-water mark, and producers are expected to hold off until it's drained.
+    """
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.future_drain = None
+
+    def send(self, **message):
+        send_message(self.writer, **message)
+
+    @property
+    def is_congested(self):
+        transport = self.writer.transport
+        return transport.get_write_buffer_size() > transport.get_write_buffer_limits()[1]
+
+    def drained(self):
+        """
+        Returns a future that completes once the transport's buffer is back below its
+        low-water mark (or the connection is lost).
+
+        The future is shared by all callers, since StreamWriter.drain doesn't support
+        concurrent calls prior to Python 3.10.
+        """
+        if self.future_drain is None:
+            self.future_drain = asyncio.ensure_future(self.drain())
+        return self.future_drain
+
+    async def drain(self):
+        try:
+            await self.writer.drain()
+        except ConnectionError:
+            # Reported by the reading side of the connection
+            pass
+        finally:
+            self.future_drain = None
+
+    def close(self):
+        self.writer.close()
+
+
+async def receive_messages(reader):
+    """
+    Yields the messages received until the connection is closed.
+    """
+    while True:
+        line = await reader.readline()
+        if not line:
+            return
+        yield json.loads(line)
+
+
+class WorkerConnection:
+    """
+    The session's view of a connected worker agent.
+    """
+
+    def __init__(self, name, slots, writer):
+        self.name = name
+        self.slots = slots
+        self.writer = MessageWriter(writer)
+        self.id_to_running_tasks = {}
+
+    @property
+    def free_slots(self):
+        return self.slots - len(self.id_to_running_tasks)
+
+    def start_task(self, task):
+        self.id_to_running_tasks[task.id] = task
+        self.writer.send(
+            type='start',
+            task=task.id,
+            run=task.run,
+            name=task.name,
+            argv=task.argv,
+            cwd=task.cwd,
+            env=task.env,
+            pty=task.pty,
+            shell=task.shell,
+            output_limit=(
+                task.output_limit.get_options() if task.output_limit is not None else None
+            ),
+        )
+
+    def stop_task(self, task):
+        self.writer.send(type='stop', task=task.id)
+
+
+class WorkerPool:
+    """
+    Accepts connections from worker agents and places remote tasks on them.
+
+    Each task is placed on the worker with the most free slots. Tasks are queued
+    until a slot becomes available.
+    """
+
+    def __init__(self):
+        self.workers = []
+        self.queue = deque()
+        self.server = None
+        # All tasks ever placed
+        self.id_to_tasks = {}
+
+    async def listen(self, address):
+        self.server = await start_server(address, self.on_worker_connected)
+        status_ok('Workers', f'Accepting workers at {address}')
+
+    def submit(self, task):
+        self.queue.append(task)
+        self.place_tasks()
+
+    def cancel(self, task):
+        """
+        Removes a queued task. Returns true if the task was queued.
+        """
+        try:
+            self.queue.remove(task)
+            return True
+        except ValueError:
+            return False
+
+    def place_tasks(self):
+        while self.queue and self.workers:
+            worker = max(self.workers, key=lambda worker: worker.free_slots)
+            if worker.free_slots <= 0:
+                break
+            task = self.queue.popleft()
+            self.id_to_tasks[task.id] = task
+            task.on_placed(worker)
+            worker.start_task(task)
+
+    async def on_worker_connected(self, reader, writer):
+        worker = None
+        try:
+            async for message in receive_messages(reader):
+                if worker is None:
+                    if message.get('type') != 'register':
+                        logging.warning('Ignoring worker that failed to register.')
+                        break
+                    worker = WorkerConnection(message['name'], message['slots'], writer)
+                    self.workers.append(worker)
+                    status_ok('Worker', f'{worker.name} connected with {worker.slots} slots')
+                    self.place_tasks()
+                    continue
+                task = self.id_to_tasks.get(message['task'])
+                # Ignore any messages trailing a prior run of the task (eg: one that was
+                # rescheduled or restarted), whether on this or another worker
+                if task is None or task.worker is not worker or message.get('run') != task.run:
+                    continue
+                if message['type'] == 'output':
+                    task.write_output(message['data'])
+                elif message['type'] == 'status':
+                    status = TaskStatus(message['status'])
+                    if status != TaskStatus.ACTIVE:
+                        del worker.id_to_running_tasks[task.id]
+                    task.on_remote_status(status)
+                    self.place_tasks()
+        except (ConnectionError, ValueError) as err:
+            logging.warning(f'Lost connection to worker: {err}')
+        finally:
+            writer.close()
+            if worker is not None:
+                self.on_worker_lost(worker)
+
+    def on_worker_lost(self, worker):
+        self.workers.remove(worker)
+        for task in worker.id_to_running_tasks.values():
+            task.write_line(ColorText.red(f'\n[Lost connection to worker {worker.name}]\n'))
+            task.on_remote_status(TaskStatus.FAILED)
+        worker.id_to_running_tasks.clear()
+        self.place_tasks()
+
+
+class RemoteProcess(BufferedTask):
+    """
+    A task that executes a process on a worker agent connected to the session.
+
+    The arguments are those of Process, and are forwarded to the worker. The output and
+    status changes are streamed back from the worker. Since the stdout/stderr logs and
+    the resource usage aren't relayed back, `binary` and `sample_interval` aren't supported.
+    """
+
+    def __init__(
+        self,
+        *argv,
+        shell=False,
+        cwd=None,
+        env=None,
+        name=None,
+        retention=None,
+        pty=True,
+        binary=False,
+        sample_interval=None,
+        output_limit=None
+    ):
+        if binary:
+            raise ValueError(
+                "Remote processes don't support binary (their output is relayed as text)"
+            )
+        if sample_interval is not None:
+            raise ValueError(
+                "Remote processes don't support sample_interval (their resource usage isn't relayed)"
+            )
+        self.argv = list(map(str, argv))
+        super().__init__(name=(name or ' '.join(self.argv)), retention=retention)
+        self.shell = shell
+        self.cwd = cwd
+        self.env = env
+        self.pty = pty
+        # Applied on the worker, as the output is read
+        self.output_limit = output_limit
+        # The WorkerPool is provided by the session this task is added to
+        self.worker_pool = None
+        self.worker = None
+        # Incremented whenever the task is placed, to tell the messages of each run apart
+        self.run = 0
+        self.status = TaskStatus.PENDING
+        self.future_process_exit = None
+        self.future_restart = None
+
+    def start(self):
+        assert self.worker_pool is not None, 'Remote tasks must be added to a session.'
+        self.status = TaskStatus.PENDING
+        self.future_process_exit = self.loop.create_future()
+        self.write_line(ColorText.blue('[Waiting for a worker]'))
+        self.worker_pool.submit(self)
+        self.events.publish(TaskEvent.STATUS_CHANGED)
+
+    def on_placed(self, worker):
+        self.worker = worker
+        self.run += 1
+        self.write_line(ColorText.blue(f'[Running on {worker.name}]'))
+
+    def on_remote_status(self, status):
+        self.status = status
+        if status != TaskStatus.ACTIVE:
+            self.worker = None
+            future_exit, self.future_process_exit = self.future_process_exit, None
+            if future_exit is not None:
+                future_exit.set_result(None)
+        self.events.publish(TaskEvent.STATUS_CHANGED)
+
+    def stop(self):
+        if self.worker is not None:
+            self.worker.stop_task(self)
+        elif self.worker_pool.cancel(self):
+            self.write_line(ColorText.red('[Cancelled]'))
+            self.on_remote_status(TaskStatus.FAILED)
+
+    def restart(self):
+        if self.future_restart is not None:
+            return
+
+        async def stop_then_start():
+            if self.future_process_exit is not None:
+                future_exit = self.future_process_exit
+                self.stop()
+                await future_exit
+            self.start()
+            self.future_restart = None
+
+        self.future_restart = asyncio.ensure_future(stop_then_start())
+
+    def get_actions(self):
+        return [
+            TaskAction(name='Stop', handler=self.stop),
+            TaskAction(name='Restart', handler=self.restart)
+        ]
+
+    def get_status(self):
+        return self.status
@@ -0,0 +1,288 @@
+import os
+import time
+import weakref
+
+from array import array
+from collections import deque
+
+from .event import EventEmitter
+
+PROC_PATH = '/proc'
+CLOCK_TICKS = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+class ResourceSeries:
+    """
+    A fixed capacity ring buffer of resource usage samples for a process tree.
+
+    Each field is stored in its own typed array (8 bytes per sample), so a full series
+    of the default capacity occupies ~43KB regardless of how long the process runs.
+    """
+
+    # Maps each field to its array typecode
+    FIELDS = {
+        # The wall clock time of the sample
+        'time': 'd',
+        # The CPU usage since the previous sample (100 per fully utilized core)
+        'cpu_percent': 'd',
+        'rss_bytes': 'q',
+        # The cumulative bytes read/written (from/to storage) by the process tree
+        'read_bytes': 'q',
+        'write_bytes': 'q',
+        'threads': 'q',
+    }
+    # 15 minutes at the default sampling interval
+    CAPACITY = 900
+
+    def __init__(self, capacity=CAPACITY):
+        self.capacity = capacity
+        self.columns = {
+            field: array(typecode, [0]) * capacity
+            for field, typecode in self.FIELDS.items()
+        }
+        # The total number of samples appended so far
+        self.count = 0
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def append(self, **sample):
+        index = self.count % self.capacity
+        for field, column in self.columns.items():
+            column[index] = sample[field]
+        self.count += 1
+
+    def get_latest(self):
+        """
+        Returns the most recent sample (or None if there are none yet).
+        """
+        if not self.count:
+            return None
+        index = (self.count - 1) % self.capacity
+        return {field: column[index] for field, column in self.columns.items()}
+
+    def get_samples(self, since=None):
+        """
+        Returns the retained samples (oldest first) as a mapping of fields to lists of values.
+        If given, only the samples taken after the `since` time are included.
+        """
+        size = len(self)
+        start = self.count % self.capacity if self.count > self.capacity else 0
+        times = self.columns['time']
+        skip = 0
+        if since is not None:
+            # The samples are in chronological order, starting from `start`
+            low, high = 0, size
+            while low < high:
+                middle = (low + high) // 2
+                if times[(start + middle) % self.capacity] <= since:
+                    low = middle + 1
+                else:
+                    high = middle
+            skip = low
+        first = (start + skip) % self.capacity
+        stop = first + size - skip
+        samples = {}
+        for field, column in self.columns.items():
+            if stop <= self.capacity:
+                samples[field] = column[first:stop].tolist()
+            else:
+                samples[field] = column[first:].tolist() + column[:stop - self.capacity].tolist()
+        return samples
+
+
+def read_stat(pid):
+    """
+    Returns the (parent pid, cumulative CPU ticks, threads, RSS pages) of a process,
+    or None if it's gone.
+    """
+    try:
+        with open(f'{PROC_PATH}/{pid}/stat', 'rb') as stat_file:
+            data = stat_file.read()
+    except OSError:
+        return None
+    # The command name is parenthesized and may contain spaces or parentheses
+    fields = data[data.rfind(b')') + 2:].split()
+    # Field 4 onwards (see proc(5)): the CPU ticks include reaped children, so
+    # the tree's total doesn't drop when a descendant exits.
+    ticks = int(fields[11]) + int(fields[12]) + int(fields[13]) + int(fields[14])
+    return int(fields[1]), ticks, int(fields[17]), int(fields[21])
+
+
+def read_io(pid):
+    """
+    Returns the (read bytes, write bytes) of a process. Zero if unavailable.
+    """
+    read_bytes = write_bytes = 0
+    try:
+        with open(f'{PROC_PATH}/{pid}/io', 'rb') as io_file:
+            for line in io_file:
+                if line.startswith(b'read_bytes:'):
+                    read_bytes = int(line[11:])
+                elif line.startswith(b'write_bytes:'):
+                    write_bytes = int(line[12:])
+    except OSError:
+        pass
+    return read_bytes, write_bytes
+
+
+def sample_process_trees(root_pids):
+    """
+    Returns a mapping of each (live) root pid to the (CPU ticks, RSS bytes, read bytes,
+    write bytes, threads) totals for its process tree.
+
+    /proc is scanned once for all the trees, regardless of their number.
+    """
+    pid_to_stats = {}
+    parent_to_children = {}
+    for name in os.listdir(PROC_PATH):
+        if not name.isdigit():
+            continue
+        pid = int(name)
+        stats = read_stat(pid)
+        if stats is None:
+            continue
+        pid_to_stats[pid] = stats
+        parent_to_children.setdefault(stats[0], []).append(pid)
+    root_to_totals = {}
+    for root_pid in root_pids:
+        if root_pid not in pid_to_stats:
+            continue
+        ticks = rss = read_bytes = write_bytes = threads = 0
+        pending = deque([root_pid])
+        while pending:
+            pid = pending.popleft()
+            _, process_ticks, process_threads, rss_pages = pid_to_stats[pid]
+            process_read_bytes, process_write_bytes = read_io(pid)
+            ticks += process_ticks
+            rss += rss_pages * PAGE_SIZE
+            read_bytes += process_read_bytes
+            write_bytes += process_write_bytes
+            threads += process_threads
+            pending.extend(parent_to_children.get(pid, ()))
+        root_to_totals[root_pid] = (ticks, rss, read_bytes, write_bytes, threads)
+    return root_to_totals
+
+
+class ProcessTreeSampler:
+    """
+    The sampling state for a single process tree.
+    """
+
+    def __init__(self, pid, interval, started_at):
+        self.pid = pid
+        self.interval = interval
+        self.last_sampled_at = started_at
+        self.last_ticks = 0
+        # The I/O counters of a tree drop when a descendant exits, so the
+        # cumulative totals are accumulated from the (non-negative) deltas.
+        self.last_io = (0, 0)
+        self.read_bytes = 0
+        self.write_bytes = 0
+
+    def update(self, now, totals):
+        ticks, rss, read_bytes, write_bytes, threads = totals
+        elapsed = now - self.last_sampled_at
+        cpu_percent = 0.0
+        if elapsed > 0:
+            cpu_percent = max(ticks - self.last_ticks, 0) / CLOCK_TICKS / elapsed * 100
+        self.read_bytes += max(read_bytes - self.last_io[0], 0)
+        self.write_bytes += max(write_bytes - self.last_io[1], 0)
+        self.last_io = (read_bytes, write_bytes)
+        self.last_ticks = ticks
+        self.last_sampled_at = now
+        return {
+            'time': time.time(),
+            'cpu_percent': cpu_percent,
+            'rss_bytes': rss,
+            'read_bytes': self.read_bytes,
+            'write_bytes': self.write_bytes,
+            'threads': threads,
+        }
+
+
+class ResourceMonitor(EventEmitter):
+    """
+    Samples the process trees of all running processes on an event loop.
+
+    Rather than each process polling on its own, a single periodic pass samples all the
+    processes that are due, scanning /proc once (off the event loop). The pass runs at the
+    shortest sampling interval among the registered processes, and /proc is only scanned
+    if at least one process is due. After each pass, the list of sampled processes is
+    published.
+
+    Sampling is only supported on systems with a /proc filesystem (eg: Linux).
+    """
+
+    _monitors = weakref.WeakKeyDictionary()
+    IS_SUPPORTED = os.path.isdir(os.path.join(PROC_PATH, 'self'))
+
+    def __init__(self, loop):
+        super().__init__()
+        self.loop = loop
+        # Maps each registered Process to its ProcessTreeSampler
+        self.process_to_samplers = {}
+        self.pass_handle = None
+        self.future_sample = None
+        self.pass_count = 0
+
+    @classmethod
+    def for_loop(cls, loop):
+        monitor = cls._monitors.get(loop)
+        if monitor is None:
+            monitor = cls._monitors[loop] = cls(loop)
+        return monitor
+
+    @property
+    def interval(self):
+        return min(sampler.interval for sampler in self.process_to_samplers.values())
+
+    def add(self, process, pid, interval):
+        if not self.IS_SUPPORTED:
+            return
+        self.process_to_samplers[process] = ProcessTreeSampler(pid, interval, self.loop.time())
+        if self.pass_handle is None and self.future_sample is None:
+            self.pass_handle = self.loop.call_later(self.interval, self.sample)
+
+    def remove(self, process):
+        self.process_to_samplers.pop(process, None)
+
+    def sample(self):
+        self.pass_handle = None
+        if not self.process_to_samplers:
+            return
+        now = self.loop.time()
+        # Allow for timer jitter, so that processes sampled at the pass interval aren't skipped
+        slack = self.interval / 2
+        due = {
+            process: sampler for process, sampler in self.process_to_samplers.items()
+            if now - sampler.last_sampled_at >= sampler.interval - slack
+        }
+        if not due:
+            # The scan of /proc is skipped until at least one process is due
+            self.pass_handle = self.loop.call_later(self.interval, self.sample)
+            return
+        self.future_sample = self.loop.run_in_executor(
+            None,
+            sample_process_trees,
+            [sampler.pid for sampler in due.values()]
+        )
+        self.future_sample.add_done_callback(lambda future: self.on_sampled(future, due))
+
+    def on_sampled(self, future, due):
+        self.future_sample = None
+        self.pass_count += 1
+        root_to_totals = future.result()
+        now = self.loop.time()
+        sampled = []
+        for process, sampler in due.items():
+            totals = root_to_totals.get(sampler.pid)
+            # Skip processes that have since exited or been removed
+            if totals is not None and self.process_to_samplers.get(process) is sampler:
+                process.resources.append(**sampler.update(now, totals))
+                sampled.append(process)
+        if self.process_to_samplers:
+            self.pass_handle = self.loop.call_later(self.interval, self.sample)
+        if sampled:
+            self.publish(sampled)
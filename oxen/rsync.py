@@ -1,9 +1,341 @@
+import functools
+import os
+import tempfile
+import weakref
+
 from pathlib import Path
 
+from .changes import ChangeType
+from .color import ColorText
 from .process import Process
+from .task import BufferedTask, TaskEvent, TaskStatus, TaskAction
 from .watch import Watch
 
 
+def get_tree_size(path):
+    """
+    Returns the total size (in bytes) of the files at or under the given path.
+    Symlinks aren't followed.
+    """
+    try:
+        if not os.path.isdir(path) or os.path.islink(path):
+            return os.lstat(path).st_size
+    except FileNotFoundError:
+        return 0
+    total = 0
+    for dir_path, _, file_names in os.walk(path):
+        for file_name in file_names:
+            try:
+                total += os.lstat(os.path.join(dir_path, file_name)).st_size
+            except FileNotFoundError:
+                pass
+    return total
+
+
+def partition_entries(root, num_shards, shard_by):
+    """
+    Splits the top-level directories within root into (at most) the given number of shards.
+
+    With shard_by='size', shards are balanced by the total size of their directories
+    (largest first, each assigned to the currently smallest shard). With shard_by='directory',
+    directories are distributed round-robin.
+    """
+    with os.scandir(root) as entries:
+        names = sorted(
+            entry.name for entry in entries if entry.is_dir(follow_symlinks=False)
+        )
+    shards = [[] for _ in range(min(num_shards, len(names)))]
+    if shard_by == 'size':
+        sizes = [0] * len(shards)
+        name_to_size = {name: get_tree_size(os.path.join(root, name)) for name in names}
+        for name in sorted(names, key=name_to_size.get, reverse=True):
+            index = sizes.index(min(sizes))
+            shards[index].append(name)
+            sizes[index] += name_to_size[name]
+    elif shard_by == 'directory':
+        for index, name in enumerate(names):
+            shards[index % len(shards)].append(name)
+    else:
+        raise ValueError(f'Unsupported shard_by: {shard_by}')
+    return shards
+
+
+def write_files_from(paths):
+    """
+    Writes the given paths to a temporary file suitable for rsync's --files-from and --from0.
+    """
+    with tempfile.NamedTemporaryFile(
+        'wb',
+        prefix='oxen-rsync-',
+        suffix='.files',
+        delete=False
+    ) as files_from:
+        # NUL separated, since paths may contain newlines
+        files_from.write(b'\0'.join(os.fsencode(path) for path in paths))
+    return files_from.name
+
+
+def remove_files_from(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class RsyncHandler:
+    """
+    Creates the rsync task for a Watch's changes.
+
+    Where possible, only the changed paths are synced (passed to rsync via --files-from),
+    which spares rsync from scanning the entire source tree. A full sync is performed
+    if the watch was forced (eg: at startup), if the change set overflowed, or if the
+    changes include deletions or moves that need to be propagated via --delete.
+    Full syncs of a directory are split across multiple rsync processes if shards > 1.
+    No task is created for changes that don't need syncing (deletions, without --delete).
+    """
+
+    def __init__(self, source, dest, flags, *, shards=1, shard_by='size', max_concurrency=None):
+        self.source = str(source)
+        self.dest = str(dest)
+        self.flags = flags
+        self.shards = shards
+        self.shard_by = shard_by
+        self.max_concurrency = max_concurrency or shards
+        # Removes the --files-from file of each process that hasn't yet been released
+        self.cleanups = weakref.WeakKeyDictionary()
+        self.root = None
+        if os.path.isdir(self.source):
+            self.root = os.path.abspath(self.source)
+
+    def get_command(self, *extra_args, source=None, dest=None):
+        command = ['rsync', source or self.source, dest or self.dest]
+        command.extend('--' + flag for flag, is_set in self.flags.items() if is_set)
+        command.extend(extra_args)
+        return command
+
+    def get_incremental_paths(self, changes):
+        """
+        Returns the changed paths relative to the source directory, or None if
+        a full sync is required.
+        """
+        if self.root is None or changes.is_forced or changes.overflowed or not changes:
+            return None
+        paths = []
+        for change in changes:
+            if change.change_type in (ChangeType.DELETED, ChangeType.MOVED) and self.flags['delete']:
+                return None
+            if change.change_type == ChangeType.DELETED:
+                # Without --delete, deletions aren't propagated
+                continue
+            if change.is_directory and not self.flags['recursive']:
+                return None
+            paths.append(os.path.relpath(change.path, self.root))
+        return paths
+
+    def get_root_dest(self):
+        # rsync copies a source directory without a trailing separator into the destination
+        if self.source.endswith(os.sep):
+            return self.dest
+        return self.dest.rstrip('/') + '/' + os.path.basename(self.root)
+
+    def create_process(self, *extra_args, name='rsync', paths=None):
+        """
+        Returns an rsync process for the source directory. If paths are given, only
+        those (relative to the source directory) are synced.
+        """
+        files_from = None
+        if paths is not None:
+            files_from = write_files_from(paths)
+            extra_args += (f'--files-from={files_from}', '--from0')
+        try:
+            process = Process(
+                *self.get_command(*extra_args, source=self.root + os.sep, dest=self.get_root_dest()),
+                name=name
+            )
+        except BaseException:
+            if files_from is not None:
+                remove_files_from(files_from)
+            raise
+        if files_from is not None:
+            # The file is removed once the process exits (or is released). Failing that
+            # (eg: the process failed to spawn), it's removed once the process is discarded.
+            self.cleanups[process] = weakref.finalize(process, remove_files_from, files_from)
+            process.events.subscribe(functools.partial(self.on_process_event, process=process))
+        return process
+
+    def on_process_event(self, event, *, process):
+        if event == TaskEvent.STATUS_CHANGED and not process.is_active:
+            self.release(process)
+
+    def release(self, process):
+        """
+        Removes the --files-from file (if any) of the given process. Invoked once it exits,
+        or once it's certain not to be started. A process that's created but neither started
+        nor released keeps its file until it's garbage collected.
+        """
+        cleanup = self.cleanups.pop(process, None)
+        if cleanup is not None:
+            cleanup()
+
+    def __call__(self, changes):
+        paths = self.get_incremental_paths(changes)
+        if paths == []:
+            # Only deletions, which aren't propagated without --delete
+            return None
+        if paths is not None:
+            process = self.create_process(paths=paths)
+            process.write_line(f'Syncing {len(paths)} changed path(s)')
+            return process
+        if self.root is not None and self.shards > 1 and self.flags['recursive']:
+            return ShardedRsync(self)
+        return Process(*self.get_command(), name='rsync')
+
+
+class ShardedRsync(BufferedTask):
+    """
+    A full sync of a source directory, performed by multiple concurrent rsync processes.
+
+    The top-level directories are partitioned into shards (off the event loop, since sizing
+    them walks the tree), each of which is synced by its own rsync process. A final
+    non-recursive pass syncs the top-level files (and, with --delete, removes extraneous
+    top-level entries). The output of the processes is aggregated into this task's output.
+    """
+
+    def __init__(self, handler):
+        super().__init__(name='rsync')
+        self.handler = handler
+        self.queue = []
+        self.running = []
+        self.cursors = {}
+        # Partial lines of output, keyed by process
+        self.partial_lines = {}
+        self.last_writer = None
+        self.future_partition = None
+        self.is_started = False
+        self.is_stopped = False
+        self.has_failed = False
+
+    def start(self):
+        self.is_started = True
+        self.write_line(
+            f'Syncing {self.handler.root} using up to {self.handler.shards} shards '
+            f'(by {self.handler.shard_by})'
+        )
+        self.future_partition = self.loop.run_in_executor(
+            None,
+            partition_entries,
+            self.handler.root,
+            self.handler.shards,
+            self.handler.shard_by
+        )
+        self.future_partition.add_done_callback(self.on_partitioned)
+        self.events.publish(TaskEvent.STATUS_CHANGED)
+
+    def on_partitioned(self, future):
+        self.future_partition = None
+        if self.is_stopped:
+            self.finish()
+            return
+        try:
+            shards = future.result()
+        except OSError as err:
+            self.write_line(ColorText.red(f'Unable to partition {self.handler.root}: {err}'))
+            self.has_failed = True
+            self.finish()
+            return
+        for index, names in enumerate(shards):
+            self.queue.append(
+                self.handler.create_process(name=f'shard {index + 1}/{len(shards)}', paths=names)
+            )
+        # Top-level files and deletions. This runs last so that it settles the
+        # attributes of the top-level directories after the shards are done with them.
+        self.queue.append(self.handler.create_process('--dirs', '--no-recursive', name='top-level'))
+        self.start_next()
+
+    def start_next(self):
+        while self.queue and len(self.running) < self.handler.max_concurrency:
+            if len(self.queue) == 1 and self.running:
+                # The top-level pass waits for all shards to complete
+                break
+            process = self.queue.pop(0)
+            self.cursors[process] = process.output.cursor()
+            try:
+                self.start_subtask(process)
+            except OSError as err:
+                self.write_line(ColorText.red(f'Unable to start {process.name}: {err}'))
+                self.has_failed = True
+                self.handler.release(process)
+                del self.cursors[process]
+                continue
+            # Subscribing after the start ensures that the process isn't mistaken for
+            # finished if it exits before the initial status change is published.
+            self.running.append(process)
+            process.events.subscribe(functools.partial(self.on_process_event, process=process))
+        if not self.queue and not self.running:
+            self.finish()
+
+    def on_process_event(self, event, *, process):
+        if event == TaskEvent.OUTPUT_UPDATED:
+            self.write_process_output(process)
+        elif event == TaskEvent.STATUS_CHANGED:
+            if process not in self.running or process.is_active:
+                return
+            self.write_process_output(process, final=True)
+            self.running.remove(process)
+            del self.cursors[process]
+            if process.get_status() == TaskStatus.FAILED:
+                self.has_failed = True
+            self.start_next()
+
+    def write_process_output(self, process, final=False):
+        """
+        Forwards the process's output in blocks of complete lines, so that the output of
+        concurrent processes is never interleaved mid-line. Each block from a different
+        process than the previous one is preceded by the process's name.
+        """
+        text = self.partial_lines.pop(process, '') + (self.cursors[process].read() or '')
+        if not final:
+            end = text.rfind('\n') + 1
+            if end < len(text):
+                self.partial_lines[process] = text[end:]
+            text = text[:end]
+        if not text:
+            return
+        if process is not self.last_writer:
+            self.last_writer = process
+            self.write_line(ColorText.blue(f'[{process.name}]'))
+        self.write_output(text if text.endswith('\n') else text + '\n')
+
+    def discard_queue(self):
+        for process in self.queue:
+            self.handler.release(process)
+        self.queue = []
+
+    def finish(self):
+        self.discard_queue()
+        self.write_line(
+            ColorText.red('[Sync failed]') if self.has_failed else ColorText.green('[Sync complete]')
+        )
+        self.events.publish(TaskEvent.STATUS_CHANGED)
+
+    def stop(self):
+        self.is_stopped = True
+        self.has_failed = True
+        self.discard_queue()
+        for process in self.running:
+            process.stop()
+
+    def get_actions(self):
+        return [TaskAction(name='Stop', handler=self.stop)]
+
+    def get_status(self):
+        if not self.is_started:
+            return TaskStatus.PENDING
+        if self.future_partition is not None or self.queue or self.running:
+            return TaskStatus.ACTIVE
+        return TaskStatus.FAILED if self.has_failed else TaskStatus.FINISHED
+
+
 def auto_rsync(
     source,
     dest,
@@ -16,9 +348,18 @@ def auto_rsync(
     update=False,
     # If true, delete extraneous files from dest dirs
     delete=False,
-    compress=True
+    compress=True,
+    # Optional include/exclude patterns for the watch (see Watch). Unlike Watch, nothing is
+    # excluded by default: rsync transfers every file, so changes to any of them trigger a sync.
+    include=None,
+    exclude=(),
+    # Split full syncs across this many concurrent rsync processes (see ShardedRsync)
+    shards=1,
+    # Either 'size' (balance the shards by size) or 'directory' (round-robin)
+    shard_by='size',
+    # Optional limit on the number of shards synced at once. Defaults to all of them.
+    max_concurrency=None
 ):
-    command = ['rsync', source, dest]
     flag_map = {
         'archive': archive,
         'compress': compress,
@@ -27,9 +368,6 @@ def auto_rsync(
         'update': update,
         'verbose': verbose,
     }
-    for flag, is_set in flag_map.items():
-        if is_set:
-            command.append('--' + flag)
 
     # Establish the directory to watch for changes
     watch_dir = Path(source)
@@ -37,13 +375,25 @@ def auto_rsync(
         # Source is a file. Watch its parent directory.
         watch_dir = watch_dir.parent
 
+    watch_filters = {'exclude': exclude}
+    if include is not None:
+        watch_filters['include'] = include
+
     return Watch(
         # Watch the source path for changes
         path=watch_dir,
         # Sync the destination using rsync when changes are detected
-        handler=Process(*command, name='rsync'),
+        handler=RsyncHandler(
+            source,
+            dest,
+            flag_map,
+            shards=shards,
+            shard_by=shard_by,
+            max_concurrency=max_concurrency
+        ),
         # Ensure the destination is synced at start
         force_once=True,
         recursive=recursive,
-        name=name
+        name=name,
+        **watch_filters
     )
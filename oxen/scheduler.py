@@ -0,0 +1,124 @@
+from collections import OrderedDict
+
+from .color import ColorText
+from .task import BufferedTask, TaskStatus
+
+
+class ScheduledTask:
+    def __init__(self, task, depends_on, resources):
+        self.task = task
+        self.depends_on = depends_on
+        self.resources = resources
+
+
+class Scheduler:
+    """
+    Starts tasks as soon as all of their dependencies have finished successfully,
+    subject to a global concurrency limit and per-resource limits.
+
+    * max_concurrency
+      Optional upper bound on the number of scheduled tasks running at once.
+      Note that long-running tasks (like Watch) hold their slot indefinitely.
+    * resources
+      Optional dictionary mapping resource names to their capacity (eg: {'cpu': 8, 'io': 2}).
+    """
+
+    def __init__(self, *, max_concurrency=None, resources=None):
+        self.max_concurrency = max_concurrency
+        self.capacity = dict(resources or {})
+        self.available = dict(self.capacity)
+        self.id_to_entry = OrderedDict()
+        self.pending = OrderedDict()
+        self.running = set()
+        self.finished = set()
+        self.failed = set()
+        self.id_to_status = {}
+        self.start_task = None
+
+    def add(self, task, *, depends_on=(), resources=None):
+        for dependency in depends_on:
+            if dependency.id not in self.id_to_entry:
+                raise ValueError(
+                    f'Dependency "{dependency.name}" of "{task.name}" must be added first.'
+                )
+        resources = dict(resources or {})
+        for resource, amount in resources.items():
+            if amount > self.capacity.get(resource, 0):
+                raise ValueError(
+                    f'Task "{task.name}" requires {amount} {resource} '
+                    f'but the capacity is {self.capacity.get(resource, 0)}.'
+                )
+        entry = ScheduledTask(task, tuple(depends_on), resources)
+        self.id_to_entry[task.id] = entry
+        self.pending[task.id] = entry
+
+    def start(self, start_task):
+        """
+        Starts all tasks that are ready. The given function is used for starting tasks.
+        """
+        self.start_task = start_task
+        self.schedule()
+
+    def is_ready(self, entry):
+        if not all(dependency.id in self.finished for dependency in entry.depends_on):
+            return False
+        if self.max_concurrency is not None and len(self.running) >= self.max_concurrency:
+            return False
+        return all(
+            self.available[resource] >= amount for resource, amount in entry.resources.items()
+        )
+
+    def schedule(self):
+        for task_id, entry in list(self.pending.items()):
+            # Starting a task may recursively schedule others
+            if task_id not in self.pending or not self.is_ready(entry):
+                continue
+            del self.pending[task_id]
+            self.acquire(entry)
+            self.start_task(entry.task)
+
+    def acquire(self, entry):
+        self.running.add(entry.task.id)
+        for resource, amount in entry.resources.items():
+            self.available[resource] -= amount
+
+    def release(self, entry):
+        self.running.remove(entry.task.id)
+        for resource, amount in entry.resources.items():
+            self.available[resource] += amount
+
+    def on_task_status_changed(self, task):
+        task_id = task.id
+        status = task.get_status()
+        if self.id_to_status.get(task_id) == status:
+            # Status changes can be observed (and published) more than once
+            return
+        self.id_to_status[task_id] = status
+        if status in (TaskStatus.PENDING, TaskStatus.ACTIVE):
+            self.finished.discard(task_id)
+            self.failed.discard(task_id)
+            entry = self.id_to_entry.get(task_id)
+            if status == TaskStatus.ACTIVE and entry is not None and task_id not in self.running:
+                # The task was started externally (eg: restarted via a task action, or
+                # started ahead of its schedule). It's charged like any other running task,
+                # even if that exceeds the limits, so that nothing else starts until it's done.
+                self.pending.pop(task_id, None)
+                self.acquire(entry)
+            return
+        if status == TaskStatus.FINISHED:
+            self.finished.add(task_id)
+            self.failed.discard(task_id)
+        elif status == TaskStatus.FAILED:
+            self.failed.add(task_id)
+            self.finished.discard(task_id)
+            self.notify_blocked_dependents(task)
+        if task_id in self.running:
+            self.release(self.id_to_entry[task_id])
+        self.schedule()
+
+    def notify_blocked_dependents(self, failed_task):
+        for entry in self.pending.values():
+            if failed_task in entry.depends_on and isinstance(entry.task, BufferedTask):
+                entry.task.write_line(
+                    ColorText.yellow(f'[Waiting: dependency "{failed_task.name}" failed]')
+                )
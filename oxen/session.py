@@ -6,9 +6,15 @@ import sys
 from collections import OrderedDict
 
 from .color import status_ok
-from .event import EventEmitter
-from .task import TaskEvent
-from .webserver import WebApp
+from .event import DispatchProfiler, EventEmitter
+from .metrics import MetricsCollector
+from .output import OutputBudget
+from .registry import TaskRegistry
+from .remote import RemoteProcess, WorkerPool
+from .resources import ResourceMonitor
+from .scheduler import Scheduler
+from .store import OutputStore
+from .task import BufferedTask, TaskEvent
 
 
 class TaskStatusMonitor(EventEmitter):
@@ -27,39 +33,157 @@ class TaskStatusMonitor(EventEmitter):
 class Session:
     """
     Manages the execution and monitoring of a collection of tasks.
+
+    * name
+      Optional name for this session.
+    * retention
+      Optional default OutputRetention for tasks that don't specify their own.
+    * output_budget
+      Optional upper bound (in bytes) on the output held in memory across all tasks.
+      Output beyond this budget is spilled to disk.
+    * max_concurrency
+      Optional upper bound on the number of tasks running at once.
+    * resources
+      Optional dictionary mapping resource names to their capacity (eg: {'cpu': 8, 'io': 2}).
+      Tasks can declare their requirements when they're added.
+    * worker_address
+      Optional address (`host:port` or `unix:/path/to/socket`) at which worker agents
+      (started via `oxen worker`) can connect to execute RemoteProcess tasks. Workers aren't
+      authenticated (see the README), so `:port` only accepts them on the loopback interface.
+    * store_dir
+      Optional directory in which the output of tasks is persisted (see OutputStore),
+      so that the output of prior runs remains available after the session restarts.
+    * profile_events
+      If true, every event subscriber callback of this session's tasks (and their subtasks)
+      is timed (see DispatchProfiler). The timings are exported via /metrics and callbacks
+      that stall the event loop are logged.
     """
 
-    def __init__(self, name=None):
+    # The interval (in seconds) at which age-based output retention is enforced
+    RETENTION_SWEEP_INTERVAL = 5.0
+
+    def __init__(
+        self,
+        name=None,
+        *,
+        retention=None,
+        output_budget=None,
+        max_concurrency=None,
+        resources=None,
+        worker_address=None,
+        store_dir=None,
+        profile_events=False
+    ):
         self.name = name
+        # Shared by the event emitters of this session and its tasks, once started
+        self.profiler = DispatchProfiler() if profile_events else None
         self.id_to_tasks = OrderedDict()
-        self.webserver = WebApp(session=self)
+        # Created on start, so that building (or validating) a session doesn't import tornado
+        self.webserver = None
         self.task_status_monitor = TaskStatusMonitor()
+        self.task_registry = TaskRegistry()
+        self.task_status_monitor.subscribe(self.task_registry.invalidate)
+        self.scheduler = Scheduler(max_concurrency=max_concurrency, resources=resources)
+        self.task_status_monitor.subscribe(self.scheduler.on_task_status_changed)
+        self.worker_address = worker_address
+        self.worker_pool = WorkerPool()
+        self.retention = retention
+        self.output_budget = OutputBudget(output_budget) if output_budget is not None else None
+        self.output_store = OutputStore(store_dir) if store_dir is not None else None
+        self.metrics = MetricsCollector(self)
 
-    def add_task(self, task):
+    def add_task(self, task, *, depends_on=(), resources=None):
+        """
+        Adds a task to this session.
+
+        * depends_on
+          Tasks (already added to this session) that must finish successfully
+          before this task is started.
+        * resources
+          Optional dictionary mapping resource names to the amount required by this task.
+        """
+        self.scheduler.add(task, depends_on=depends_on, resources=resources)
         self.id_to_tasks[task.id] = task
+        if isinstance(task, RemoteProcess):
+            task.worker_pool = self.worker_pool
+        if isinstance(task, BufferedTask):
+            if task.output.retention is None:
+                task.output.retention = self.retention
+            if self.output_budget is not None:
+                self.output_budget.add(task.output)
+            if self.output_store is not None:
+                self.output_store.add(task)
 
     def __iadd__(self, task):
         self.add_task(task)
         return self
 
     def start_tasks(self, loop):
+        self.task_registry.loop = loop
+        if self.profiler is not None:
+            self.task_status_monitor.profiler = self.profiler
+            self.task_registry.profiler = self.profiler
         for task in self.tasks:
             task.loop = loop
-            task.start()
+            if self.profiler is not None:
+                task.events.profiler = self.profiler
             self.task_status_monitor.add(task)
-            status_ok('Started', task.name)
+            self.task_registry.add(task)
+        ResourceMonitor.for_loop(loop).subscribe(self.on_resources_sampled)
+        self.scheduler.start(self.start_task)
+
+    def on_resources_sampled(self, processes):
+        # Refresh the resource usage in the task list (subtasks aren't listed)
+        for process in processes:
+            if process.id in self.id_to_tasks:
+                self.task_registry.invalidate(process)
+
+    def start_task(self, task):
+        task.start()
+        status_ok('Started', task.name)
 
     def get_task_by_id(self, task_id):
         return self.id_to_tasks[task_id]
 
     def start(self, *, port=4242, address=''):
+        from .webserver import WebApp
         WebApp.setup()
         loop = asyncio.get_event_loop()
+        if self.worker_address is not None:
+            loop.run_until_complete(self.worker_pool.listen(self.worker_address))
         # Register all tasks
         self.start_tasks(loop)
+        self.sweep_output_retention(loop)
+        self.metrics.start(loop)
+        if self.output_store is not None:
+            self.output_store.start(loop)
         # Setup webserver
+        self.webserver = WebApp(session=self)
         self.webserver.listen(port=port, address=address)
-        loop.run_forever()
+        try:
+            loop.run_forever()
+        finally:
+            if self.output_store is not None:
+                # Persist the output that's still pending
+                self.output_store.close()
+
+    def sweep_output_retention(self, loop):
+        """
+        Periodically enforce retention so that idle tasks also age out their output.
+        """
+        for task in self.tasks:
+            if isinstance(task, BufferedTask):
+                task.output.enforce_retention()
+        loop.call_later(self.RETENTION_SWEEP_INTERVAL, self.sweep_output_retention, loop)
+
+    def get_output_stats(self):
+        """
+        Returns the resident vs. spilled output counters for each task.
+        """
+        return {
+            task.id: task.output.get_stats()
+            for task in self.tasks if isinstance(task, BufferedTask)
+        }
 
     @property
     def tasks(self):
@@ -0,0 +1,337 @@
+import bisect
+import concurrent.futures
+import hashlib
+import logging
+import os
+import re
+import shutil
+import struct
+import time
+import zlib
+
+from .output import DEFAULT_SEGMENT_SIZE, OutputSegment
+
+# Precedes every record: the wall clock time at which its output was written,
+# followed by its uncompressed and compressed sizes
+RECORD_HEADER = struct.Struct('<dII')
+SEGMENT_SUFFIX = '.segment'
+
+
+def get_segment_path(run_path, index):
+    return os.path.join(run_path, f'{index:06d}{SEGMENT_SUFFIX}')
+
+
+class StoredRun:
+    """
+    The persisted output of a single run of a task, read back using memory-mapped I/O.
+
+    A run is a sequence of segment files, each holding a sequence of zlib compressed
+    records (see RECORD_HEADER). The records are indexed by scanning their headers (one
+    per batch of output) when the run is first accessed. A record that was only partially
+    written (eg: because the session was killed) ends the run.
+
+    Provides `byte_length` and `iter_bytes` (like OutputLog) for serving the output.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.id = os.path.basename(path)
+        self.segments = []
+        # The uncompressed byte offset at which each record begins
+        self.record_offsets = []
+        # The (segment, position, compressed size, timestamp) for each record
+        self.records = []
+        self.byte_length = 0
+        self.is_indexed = False
+
+    @property
+    def started_at(self):
+        """
+        The wall clock time at which the run started (encoded in its id).
+        """
+        return int(self.id.split('-', 1)[0]) / 1000
+
+    def index(self):
+        if self.is_indexed:
+            return
+        self.is_indexed = True
+        index = 0
+        while os.path.exists(get_segment_path(self.path, index)):
+            # Prior runs are immutable (and the store may be read-only)
+            segment = OutputSegment(get_segment_path(self.path, index), writable=False)
+            self.segments.append(segment)
+            if not self.index_segment(segment):
+                break
+            index += 1
+
+    def index_segment(self, segment):
+        """
+        Indexes the records of the given segment. Returns False if it ends with a partial record.
+        """
+        position = 0
+        while position < segment.size:
+            if position + RECORD_HEADER.size > segment.size:
+                return False
+            timestamp, size, compressed_size = RECORD_HEADER.unpack(
+                segment.read(position, RECORD_HEADER.size)
+            )
+            position += RECORD_HEADER.size
+            if position + compressed_size > segment.size:
+                return False
+            self.record_offsets.append(self.byte_length)
+            self.records.append((segment, position, compressed_size, timestamp))
+            self.byte_length += size
+            position += compressed_size
+        return True
+
+    def get_record(self, index):
+        segment, position, compressed_size, _ = self.records[index]
+        return zlib.decompress(segment.read(position, compressed_size))
+
+    def iter_bytes(self, start=0, stop=None):
+        """
+        Yields the (possibly partial) records spanning the byte range [start, stop).
+        """
+        self.index()
+        stop = self.byte_length if stop is None else min(stop, self.byte_length)
+        if start >= stop:
+            return
+        index = max(bisect.bisect_right(self.record_offsets, start) - 1, 0)
+        while index < len(self.records):
+            record_start = self.record_offsets[index]
+            if record_start >= stop:
+                break
+            data = self.get_record(index)
+            if start > record_start or stop < record_start + len(data):
+                data = data[max(start - record_start, 0):stop - record_start]
+            yield data
+            index += 1
+
+    def read(self, start=0, stop=None):
+        return b''.join(self.iter_bytes(start, stop))
+
+    def close(self):
+        for segment in self.segments:
+            segment.close()
+
+
+class RunWriter:
+    """
+    Persists the output of a task's current run.
+
+    Output is buffered as it's appended and periodically written out as a single record by
+    the store's writer thread, so that neither compression nor disk I/O occur on the event loop.
+    """
+
+    def __init__(self, store, path):
+        self.store = store
+        self.path = path
+        self.pending = []
+        self.pending_bytes = 0
+        # The wall clock time at which the first pending chunk was appended
+        self.pending_since = None
+        self.segment = None
+        self.segment_count = 0
+        self.written_bytes = 0
+
+    def append(self, data):
+        if self.pending_since is None:
+            self.pending_since = time.time()
+        self.pending.append(data)
+        self.pending_bytes += len(data)
+        if self.pending_bytes >= self.store.MAX_BATCH_SIZE:
+            self.store.schedule_flush()
+
+    def take_batch(self):
+        """
+        Returns the (timestamp, data) of the pending output, or None if there's nothing pending.
+        """
+        if not self.pending:
+            return None
+        batch = (self.pending_since, b''.join(self.pending))
+        self.pending = []
+        self.pending_bytes = 0
+        self.pending_since = None
+        return batch
+
+    def write_record(self, timestamp, data):
+        """
+        Invoked on the store's writer thread.
+        """
+        compressed = zlib.compress(data, self.store.COMPRESSION_LEVEL)
+        segment = self.get_segment()
+        segment.write(RECORD_HEADER.pack(timestamp, len(data), len(compressed)) + compressed)
+        self.written_bytes += RECORD_HEADER.size + len(compressed)
+
+    def get_segment(self):
+        if self.segment is None:
+            os.makedirs(self.path, exist_ok=True)
+        elif self.segment.size >= self.store.segment_size:
+            self.segment.close()
+            self.segment = None
+        if self.segment is None:
+            self.segment = OutputSegment(get_segment_path(self.path, self.segment_count))
+            self.segment_count += 1
+        return self.segment
+
+    def close(self):
+        if self.segment is not None:
+            self.segment.close()
+            self.segment = None
+
+
+class OutputStore:
+    """
+    Persists the output of a session's tasks under a directory, so that the output
+    of prior runs remains available after the session restarts.
+
+    Every run of the session is assigned an id (derived from its start time), and each
+    task's output is written to `<path>/<task key>/<run id>/`. Task keys are derived from
+    the task names (rather than their ids, which depend on the order of creation).
+    Tasks that share a name are told apart by the order in which they were added.
+
+    * max_runs
+      The number of runs (including the current one) retained per task.
+      Older runs are removed when the store is started.
+    * segment_size
+      The size (in bytes) beyond which a new segment file is started.
+    """
+
+    # The interval (in seconds) at which pending output is written out
+    FLUSH_INTERVAL = 0.5
+    # Pending output beyond this size (in bytes) is written out without waiting for the interval
+    MAX_BATCH_SIZE = 1024 * 1024
+    # Favors speed: logs compress well even at the lowest level
+    COMPRESSION_LEVEL = 1
+    MAX_RUNS = 10
+
+    KEY_PATTERN = re.compile(r'[^\w.-]+')
+
+    def __init__(self, path, *, max_runs=MAX_RUNS, segment_size=DEFAULT_SEGMENT_SIZE):
+        self.path = os.path.abspath(path)
+        self.max_runs = max_runs
+        self.segment_size = segment_size
+        self.run_id = f'{int(time.time() * 1000):013d}-{os.getpid()}'
+        self.task_id_to_keys = {}
+        self.key_to_writers = {}
+        # Prior runs are immutable, so they're only indexed once
+        self.path_to_runs = {}
+        # A single thread, so that each task's records are written in order (created on start)
+        self.executor = None
+        self.loop = None
+        self.pending_flush = False
+
+    def get_key(self, name):
+        slug = self.KEY_PATTERN.sub('-', name).strip('-')[:64] or 'task'
+        digest = hashlib.sha1(name.encode('utf8')).hexdigest()[:8]
+        key = base_key = f'{slug}-{digest}'
+        count = 1
+        while key in self.key_to_writers:
+            count += 1
+            key = f'{base_key}.{count}'
+        return key
+
+    def add(self, task):
+        """
+        Persists the output of the given (buffered) task from now on.
+        """
+        key = self.get_key(task.name)
+        writer = RunWriter(self, os.path.join(self.path, key, self.run_id))
+        self.task_id_to_keys[task.id] = key
+        self.key_to_writers[key] = writer
+        task.output.store = writer
+
+    def get_run_ids(self, key):
+        """
+        Returns the ids of the prior runs of the task with the given key (newest first).
+        """
+        try:
+            names = os.listdir(os.path.join(self.path, key))
+        except FileNotFoundError:
+            return []
+        return sorted((name for name in names if name != self.run_id), reverse=True)
+
+    def prune_runs(self, key):
+        for run_id in self.get_run_ids(key)[self.max_runs - 1:]:
+            path = os.path.join(self.path, key, run_id)
+            run = self.path_to_runs.pop(path, None)
+            if run is not None:
+                run.close()
+            shutil.rmtree(path, ignore_errors=True)
+
+    def get_runs(self, task):
+        """
+        Returns the prior runs of the given task (newest first).
+        """
+        key = self.task_id_to_keys[task.id]
+        return [self.get_run(task, run_id) for run_id in self.get_run_ids(key)]
+
+    def get_run(self, task, run_id):
+        """
+        Returns the given prior run of a task. Raises KeyError if there's no such run.
+        """
+        key = self.task_id_to_keys[task.id]
+        if run_id not in self.get_run_ids(key):
+            raise KeyError(run_id)
+        path = os.path.join(self.path, key, run_id)
+        run = self.path_to_runs.get(path)
+        if run is None:
+            run = self.path_to_runs[path] = StoredRun(path)
+        return run
+
+    def start(self, loop):
+        # Deferred until now, so that adding tasks (eg: to validate a config) has no side effects
+        for key in self.key_to_writers:
+            self.prune_runs(key)
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix='oxen-store'
+        )
+        self.loop = loop
+        self.flush_periodically()
+
+    def flush_periodically(self):
+        self.flush()
+        self.loop.call_later(self.FLUSH_INTERVAL, self.flush_periodically)
+
+    def schedule_flush(self):
+        if self.loop is not None and not self.pending_flush:
+            self.pending_flush = True
+            self.loop.call_soon(self.flush)
+
+    def flush(self):
+        """
+        Hands all pending output over to the writer thread.
+        """
+        self.pending_flush = False
+        if self.executor is None:
+            # Not started
+            return
+        for writer in self.key_to_writers.values():
+            batch = writer.take_batch()
+            if batch is not None:
+                future = self.executor.submit(writer.write_record, *batch)
+                future.add_done_callback(self.on_written)
+
+    @staticmethod
+    def on_written(future):
+        if future.exception() is not None:
+            logging.error('Failed to persist output', exc_info=future.exception())
+
+    def close(self):
+        """
+        Writes out any pending output and waits for the writer thread to finish.
+        """
+        self.flush()
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+        for writer in self.key_to_writers.values():
+            writer.close()
+        for run in self.path_to_runs.values():
+            run.close()
+
+    def get_stats(self):
+        return {
+            'pending_bytes': sum(writer.pending_bytes for writer in self.key_to_writers.values()),
+            'written_bytes': sum(writer.written_bytes for writer in self.key_to_writers.values()),
+        }
@@ -1,11 +1,12 @@
 import enum
-import io
 import itertools
 
 from .event import EventEmitter
+from .output import OutputLog
 
 
 class TaskStatus(enum.Enum):
+    PENDING = 'pending'
     ACTIVE = 'active'
     FINISHED = 'finished'
     FAILED = 'failed'
@@ -16,6 +17,12 @@ class TaskEvent(enum.Enum):
     STATUS_CHANGED = 'status-changed'
 
 
+class TaskActionError(ValueError):
+    """
+    Raised for actions that aren't supported, or were given invalid arguments.
+    """
+
+
 class TaskAction:
     def __init__(self, name, handler):
         self.name = name
@@ -65,15 +72,35 @@ class Task:
         """
         raise NotImplementedError
 
-    def perform_action(self, action_name):
+    def get_resource_usage(self):
         """
-        Execute the given action, where action is one of the strings returned
-        the get_actions method.
+        Returns the latest resource usage sample (see ResourceSeries) for this task's
+        processes, or None if it isn't sampled.
+        """
+        return None
+
+    def get_metrics(self):
+        """
+        Returns a dictionary mapping metric names to (value, description) for any task
+        specific metrics. Values are either numbers or LatencyStats.
+        """
+        return {}
+
+    def get_action(self, action_name):
+        """
+        Returns the TaskAction with the given name (see get_actions).
         """
         for action in self.get_actions():
             if action.name == action_name:
-                return action.handler()
-        raise ValueError('Unsupported action: {}'.format(action_name))
+                return action
+        raise TaskActionError('Unsupported action: {}'.format(action_name))
+
+    def perform_action(self, action_name, **arguments):
+        """
+        Execute the given action, where action is one of the strings returned
+        the get_actions method. Any arguments are passed on to the action's handler.
+        """
+        return self.get_action(action_name).handler(**arguments)
 
     def start_subtask(self, task):
         """
@@ -81,6 +108,8 @@ class Task:
         """
         assert self.loop is not None
         task.loop = self.loop
+        if task.events.profiler is None:
+            task.events.profiler = self.events.profiler
         task.start()
 
     @property
@@ -90,15 +119,23 @@ class Task:
 
 class BufferedTask(Task):
     """
-    A task that stores its output in an in-memory buffer.
+    A task that stores its output in an in-memory log.
+
+    An optional OutputRetention bounds how much of the output is held in memory.
     """
 
-    def __init__(self, name):
+    def __init__(self, name, retention=None):
         super().__init__(name)
-        self.output = io.StringIO()
+        self.output = OutputLog(retention=retention)
+        self.events.subscribe(self.on_status_changed)
+
+    def on_status_changed(self, event):
+        if event == TaskEvent.STATUS_CHANGED:
+            status = self.get_status()
+            self.output.set_finished(status in (TaskStatus.FINISHED, TaskStatus.FAILED))
 
     def write_output(self, text):
-        self.output.write(text)
+        self.output.append(text)
         self.events.publish(TaskEvent.OUTPUT_UPDATED)
 
     def write_line(self, line):
@@ -106,3 +143,12 @@ class BufferedTask(Task):
 
     def get_output(self):
         return self.output.getvalue()
+
+    def start_subtask(self, task):
+        # Subtasks inherit the output limits of their owner unless configured otherwise
+        if isinstance(task, BufferedTask):
+            if task.output.retention is None:
+                task.output.retention = self.output.retention
+            if task.output.budget is None and self.output.budget is not None:
+                self.output.budget.add(task.output)
+        super().start_subtask(task)
@@ -1,11 +1,27 @@
 import functools
-import watchdog.observers
 
+from .changes import DEFAULT_EXCLUDE, ChangeSet, PathFilter, filter_event
 from .color import ColorText
-from .stream import StringStream
+from .fingerprint import FingerprintCache
+from .metrics import LatencyStats
+from .observer import ObserverService
 from .task import Task, BufferedTask, TaskEvent, TaskStatus, TaskAction
 
 
+class ActiveTask:
+    """
+    A running handler task, along with the changes it was invoked for.
+    """
+
+    def __init__(self, task, changes, started_at):
+        self.task = task
+        self.changes = changes
+        self.started_at = started_at
+        self.cursor = task.output.cursor()
+        self.is_interrupted = False
+        self.on_event = None
+
+
 class Watch(BufferedTask):
     """
     Watches a path and invokes a task whenever a change is detected.
@@ -14,81 +30,260 @@ class Watch(BufferedTask):
       The path to watch for changes.
     * handler
       Either a task instance that can be started multiple times, or a function that
-      that accepts a list of watchdog fs events and returns a task to execute.
+      that accepts a ChangeSet (the net change for each modified path) and returns a task
+      to execute (or None if there's nothing to be done for the changes).
     * recursive
       If true, the given path is recursively watched.
     * delay
       A debounce interval for accumulating changes (in seconds).
     * force_once
       If true, the handler is invoked unconditionally when the watch starts.
+    * retention
+      Optional OutputRetention limiting how much output is held in memory.
+      Handler tasks inherit it unless they specify their own.
+    * include
+      Optional list of gitignore-style patterns. If provided, only matching paths are watched.
+    * exclude
+      List of gitignore-style patterns for paths to ignore. By default, this covers VCS
+      metadata, caches and editor swap/backup files.
+    * ignore_file
+      Optional path (relative to the watched path) of a gitignore-style file with further
+      patterns to ignore (eg: '.gitignore').
+    * fingerprint
+      If true, the handler is only invoked if the contents of the changed files differ.
+      Content hashes are computed off the event loop and persisted in a cache, which is
+      stored under ~/.cache/oxen unless a path is given instead.
+    * policy
+      Determines what happens to changes detected while a handler task is running:
+      - 'queue': the changes are accumulated and the handler is invoked once the task completes.
+      - 'restart': the running task is stopped, and the handler is invoked with the changes
+        merged with those of the interrupted task once it has exited.
+      - 'parallel': the handler is invoked right away, with up to `max_parallel` tasks
+        running at once. This requires a handler function that returns a new task every time.
+    * max_parallel
+      The maximum number of concurrently running tasks for the 'parallel' policy.
     """
 
-    def __init__(self, path, *, handler, name, recursive=False, delay=1.0, force_once=False):
-        super().__init__(name)
+    POLICIES = ('queue', 'restart', 'parallel')
+
+    # The handler tasks' events are delivered asynchronously, so relaying their output doesn't
+    # hold up the process that produced it. Only OUTPUT_UPDATED and STATUS_CHANGED events are
+    # published and duplicates are merged, so the queue never grows past 2 events.
+    TASK_EVENT_QUEUE_SIZE = 2
+
+    def __init__(
+        self,
+        path,
+        *,
+        handler,
+        name,
+        recursive=False,
+        delay=1.0,
+        force_once=False,
+        retention=None,
+        include=None,
+        exclude=DEFAULT_EXCLUDE,
+        ignore_file=None,
+        fingerprint=False,
+        policy='queue',
+        max_parallel=4
+    ):
+        super().__init__(name, retention=retention)
+        if policy not in self.POLICIES:
+            raise ValueError(f'Unsupported policy: {policy}')
+        if policy == 'parallel' and isinstance(handler, Task):
+            raise ValueError('The parallel policy requires a handler function')
         self.path = str(path)
+        self.recursive = recursive
+        self.path_filter = PathFilter(
+            self.path,
+            include=include,
+            exclude=exclude,
+            ignore_file=ignore_file
+        )
         self.handler = (lambda _: handler) if isinstance(handler, Task) else handler
         self.delay = delay
         self.force_once = force_once
-        self.queue = []
+        self.fingerprints = None
+        if isinstance(fingerprint, str):
+            self.fingerprints = FingerprintCache(fingerprint)
+        elif fingerprint:
+            self.fingerprints = FingerprintCache.for_directory(self.path)
+        self.future_fingerprint = None
+        self.queue = ChangeSet()
+        # If true, the handler is invoked even if there are no changes
+        self.is_forced = False
+        self.policy = policy
+        self.max_parallel = max_parallel if policy == 'parallel' else 1
+        # True if a consume is either scheduled or waiting for a running task to complete
         self.pending_consume = False
-        self.active_task = None
-        self.active_task_stream = None
-        self.observer = watchdog.observers.Observer()
-        self.observer.schedule(self, self.path, recursive=recursive)
+        self.consume_handle = None
+        # Maps running handler tasks to their ActiveTask
+        self.active_tasks = {}
+        self.observer_service = None
+        # The loop time at which the oldest unhandled change was queued
+        self.queued_at = None
+        self.pending_since = None
+        # From the first queued change to the invocation of the handler
+        self.debounce_latency = LatencyStats()
+        # From the invocation of the handler to the completion of its task
+        self.handler_latency = LatencyStats()
 
     def start(self):
         self.write_line(f'{ColorText.green("Watching:")} {self.path}')
-        self.observer.start()
+        self.observer_service = ObserverService.for_loop(self.loop)
+        self.observer_service.subscribe(self, self.path, recursive=self.recursive)
         if self.force_once:
             self.write_line('Invoking task once unconditionally')
-            self.initiate_consume()
+            self.initiate_consume(force=True)
 
     def stop(self):
-        if self.active_task is not None:
-            self.active_task.stop()
-        self.observer.stop()
-        self.observer.join()
+        for active in list(self.active_tasks.values()):
+            active.task.stop()
+        if self.observer_service is not None:
+            self.observer_service.unsubscribe(self)
+            self.observer_service = None
 
     def get_status(self):
         return TaskStatus.ACTIVE
 
-    def dispatch(self, event):
-        self.queue.append(event)
+    def filter_event(self, event):
+        """
+        Invoked by the observer service (on the observer thread) to filter incoming events.
+        """
+        return filter_event(self.path_filter, event)
+
+    def dispatch_events(self, events):
+        """
+        Invoked by the observer service (on the event loop) with a batch of watchdog events.
+        """
+        if self.queued_at is None:
+            self.queued_at = self.loop.time()
+        self.queue.update(events)
         self.initiate_consume()
 
-    def initiate_consume(self, delay=None):
+    def initiate_consume(self, delay=None, force=False):
+        self.is_forced = self.is_forced or force
         if self.pending_consume:
             return
         self.pending_consume = True
         if delay is None:
             delay = self.delay
-        self.loop.call_soon_threadsafe(self.loop.call_later, delay, self.consume)
+        self.consume_handle = self.loop.call_later(delay, self.consume)
+
+    def resume_consume(self):
+        """
+        Resumes a consume that was waiting for a running task (or fingerprinting) to complete.
+        """
+        if self.pending_consume and self.consume_handle is None:
+            self.consume()
 
     def consume(self):
-        if self.active_task is not None:
-            # Wait for the task to complete. Events will keep queueing until then.
-            self.loop.call_later(self.delay, self.consume)
+        self.consume_handle = None
+        if self.future_fingerprint is not None:
+            # Resumed once fingerprinting completes. Events will keep queueing until then.
+            return
+        if len(self.active_tasks) >= self.max_parallel:
+            if self.policy == 'restart':
+                for active in self.active_tasks.values():
+                    if not active.is_interrupted:
+                        active.is_interrupted = True
+                        active.task.stop()
+            # Resumed once a task completes. Events will keep queueing until then.
             return
-        events, self.queue = self.queue, []
-        self.active_task = self.handler(events)
-        self.active_task_stream = StringStream.from_task(self.active_task)
-        self.active_task.events.subscribe(self.on_task_event)
-        self.start_subtask(self.active_task)
         self.pending_consume = False
+        changes, self.queue = self.queue, ChangeSet()
+        if self.pending_since is None:
+            self.pending_since = self.queued_at
+        self.queued_at = None
+        if not (changes or self.is_forced):
+            # All changes cancelled out (eg: a temporary file that was created then deleted)
+            self.pending_since = None
+            return
+        if self.fingerprints is not None and not self.is_forced:
+            # Hashing may be expensive, so it's performed off the event loop
+            self.future_fingerprint = self.loop.run_in_executor(
+                None,
+                self.fingerprints.get_content_changes,
+                changes
+            )
+            self.future_fingerprint.add_done_callback(self.on_fingerprinted)
+            return
+        self.run_handler(changes)
 
-    def on_task_event(self, event):
+    def on_fingerprinted(self, future):
+        self.future_fingerprint = None
+        changes = future.result()
+        if changes or self.is_forced:
+            self.run_handler(changes)
+        else:
+            self.pending_since = None
+        self.resume_consume()
+
+    def run_handler(self, changes):
+        changes.is_forced = self.is_forced
+        self.is_forced = False
+        now = self.loop.time()
+        if self.pending_since is not None:
+            self.debounce_latency.observe(now - self.pending_since)
+            self.pending_since = None
+        task = self.handler(changes)
+        if task is None:
+            return
+        active = ActiveTask(task, changes, started_at=now)
+        self.active_tasks[task] = active
+        self.start_subtask(task)
+        # Subscribing after the start ensures that the task isn't mistaken for
+        # finished if it exits before the initial status change is published.
+        active.on_event = functools.partial(self.on_task_event, active=active)
+        task.events.subscribe(
+            active.on_event,
+            queue_size=self.TASK_EVENT_QUEUE_SIZE,
+            policy='merge',
+            loop=self.loop
+        )
+
+    def on_task_event(self, event, *, active):
+        task = active.task
         if event == TaskEvent.OUTPUT_UPDATED:
-            self.write_output(self.active_task_stream.read())
+            fragment = active.cursor.read()
+            if fragment is not None:
+                self.write_output(fragment)
         elif event == TaskEvent.STATUS_CHANGED:
-            if not self.active_task.is_active:
-                self.active_task.events.unsubscribe(self.on_task_event)
-                self.active_task = None
-                self.active_task_stream = None
+            if task.is_active or self.active_tasks.get(task) is not active:
+                return
+            # Undelivered output updates are discarded upon unsubscribing
+            fragment = active.cursor.read()
+            if fragment is not None:
+                self.write_output(fragment)
+            task.events.unsubscribe(active.on_event)
+            del self.active_tasks[task]
+            self.handler_latency.observe(self.loop.time() - active.started_at)
+            if active.is_interrupted and task.get_status() == TaskStatus.FAILED:
+                # The interrupted task's changes are carried over to its replacement
+                active.changes.merge(self.queue)
+                self.queue = active.changes
+                self.is_forced = self.is_forced or active.changes.is_forced
+            self.resume_consume()
+
+    def get_metrics(self):
+        return {
+            'watch_queued_changes': (len(self.queue), 'The number of changed paths queued.'),
+            'watch_active_tasks': (len(self.active_tasks), 'The number of running handler tasks.'),
+            'watch_debounce_seconds': (
+                self.debounce_latency,
+                'The time from a change being detected to the handler being invoked.'
+            ),
+            'watch_handler_seconds': (
+                self.handler_latency,
+                'The time from the handler being invoked to the completion of its task.'
+            ),
+        }
 
     def get_actions(self):
         return [
             TaskAction(
                 name='Trigger',
-                handler=functools.partial(self.initiate_consume, delay=0)
+                handler=functools.partial(self.initiate_consume, delay=0, force=True)
             )
         ]
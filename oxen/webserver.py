@@ -1,18 +1,46 @@
+import bisect
 import errno
+import functools
+import inspect
 import logging
+import re
 import socket
+import zlib
 
 from pathlib import Path
 
 import tornado
+import tornado.ioloop
+import tornado.iostream
 import tornado.log
 import tornado.platform.asyncio
 import tornado.web
 import tornado.websocket
 
-from .color import status_ok
-from .stream import StringStream
-from .task import TaskEvent
+from .color import ColorText, status_ok
+from .metrics import MetricsWriter
+from .task import TaskActionError, TaskEvent
+
+# Pre-compressed messages are written through the (private) frame writer of tornado's
+# WebSocket protocol, which is only relied upon for the versions it was verified against.
+# Otherwise, all messages are compressed by tornado (see TaskOutputHandler.write_payload).
+SUPPORTS_PRECOMPRESSED_MESSAGES = (
+    tornado.version_info[0] == 6 and
+    hasattr(tornado.websocket.WebSocketProtocol13, '_write_frame')
+)
+# The zlib compression level for permessage-deflate messages
+COMPRESSION_LEVEL = 6
+
+
+def compress_message(payload, wbits):
+    """
+    Compresses a message for permessage-deflate, independently of any prior messages
+    (without context takeover), so that any permessage-deflate client can decompress it
+    regardless of what it negotiated.
+    """
+    compressor = zlib.compressobj(COMPRESSION_LEVEL, zlib.DEFLATED, -wbits)
+    data = compressor.compress(payload) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    return data[:-4]
 
 
 class DashboardHandler(tornado.web.RequestHandler):
@@ -24,62 +52,624 @@ class DashboardHandler(tornado.web.RequestHandler):
 
 
 class TaskInfoHandler(tornado.websocket.WebSocketHandler):
+    """
+    Sends the info for all tasks on connect, followed by updates whenever any task changes.
+
+    Clients that connect with `?deltas=1` are only sent the updated tasks (along with
+    the registry version). Otherwise, the full list of tasks is sent for every update.
+    """
+
+    # The currently open connections
+    connections = set()
+
     def initialize(self, session):
         self.session = session
+        self.send_deltas = False
 
     def open(self):
-        self.session.task_status_monitor.subscribe(self.on_task_status_update)
-        self.send_task_info()
+        self.connections.add(self)
+        self.send_deltas = self.get_query_argument('deltas', None) == '1'
+        self.session.task_registry.subscribe(self.on_task_registry_update)
+        self.write_message(self.session.task_registry.get_snapshot())
 
-    def on_task_status_update(self, _):
-        self.send_task_info()
+    def on_task_registry_update(self, delta):
+        self.write_message(delta if self.send_deltas else self.session.task_registry.get_snapshot())
 
-    def send_task_info(self):
-        self.write_message({'tasks': [self.get_task_info(task) for task in self.session.tasks]})
+    def on_close(self):
+        self.connections.discard(self)
+        self.session.task_registry.unsubscribe(self.on_task_registry_update)
 
-    def get_task_info(self, task):
-        return {
-            'id': task.id,
-            'name': task.name,
-            'status': task.get_status().value,
-            'actions': [action.name for action in task.get_actions()],
-        }
 
-    def on_close(self):
-        self.session.task_status_monitor.unsubscribe(self.on_task_status_update)
+class OutputFrame:
+    """
+    A fragment of a task's output, encoded once and shared by all subscribers.
+    """
+
+    def __init__(self, start, stop, text):
+        self.start = start
+        self.stop = stop
+        self.payload = text.encode('utf8')
+        # Compressed payloads, keyed by the window size (bits) negotiated by clients
+        self.compressed = {}
+
+    @property
+    def length(self):
+        return self.stop - self.start
+
+    def get_compressed(self, wbits):
+        """
+        Returns the payload compressed for permessage-deflate (see compress_message).
+        """
+        compressed = self.compressed.get(wbits)
+        if compressed is None:
+            compressed = self.compressed[wbits] = compress_message(self.payload, wbits)
+        return compressed
+
+
+class OutputBroadcast:
+    """
+    Fans a task's output out to all the clients streaming it.
+
+    Output updates are coalesced over a short window, then read and encoded into frames
+    once, regardless of the number of subscribers. Recent frames are retained so that
+    subscribers that are slightly behind (eg: due to a slow connection) can still be sent
+    the shared frames. Subscribers further behind read the output on their own until
+    they reach a frame boundary.
+    """
+
+    # The window (in seconds) over which output updates are coalesced
+    FLUSH_INTERVAL = 0.025
+    # The maximum size (in characters) of a single frame
+    MAX_FRAME_SIZE = 256 * 1024
+    # The amount of recent output (in characters) retained as frames
+    MAX_RETAINED_SIZE = 4 * 1024 * 1024
+
+    _broadcasts = {}
+
+    def __init__(self, task):
+        self.task = task
+        self.cursor = task.output.cursor(task.output.length)
+        self.frames = []
+        self.frame_starts = []
+        self.retained_size = 0
+        self.subscribers = set()
+        self.flush_handle = None
+
+    @classmethod
+    def subscribe(cls, task, subscriber):
+        broadcast = cls._broadcasts.get(task.id)
+        if broadcast is None:
+            broadcast = cls._broadcasts[task.id] = cls(task)
+            task.events.subscribe(broadcast.on_task_event)
+        broadcast.subscribers.add(subscriber)
+        return broadcast
+
+    def unsubscribe(self, subscriber):
+        self.subscribers.discard(subscriber)
+        if self.subscribers:
+            return
+        # Nobody's listening
+        self.task.events.unsubscribe(self.on_task_event)
+        if self.flush_handle is not None:
+            tornado.ioloop.IOLoop.current().remove_timeout(self.flush_handle)
+            self.flush_handle = None
+        del self._broadcasts[self.task.id]
+
+    @property
+    def offset(self):
+        """
+        The offset up to which output has been framed.
+        """
+        return self.cursor.offset
+
+    def on_task_event(self, event):
+        if event == TaskEvent.OUTPUT_UPDATED and self.flush_handle is None:
+            self.flush_handle = tornado.ioloop.IOLoop.current().call_later(
+                self.FLUSH_INTERVAL,
+                self.flush
+            )
+
+    def flush(self):
+        self.flush_handle = None
+        while self.cursor.pending > 0:
+            start = self.cursor.offset
+            text = self.cursor.read(max_length=self.MAX_FRAME_SIZE)
+            self.frames.append(OutputFrame(start, self.cursor.offset, text))
+            self.frame_starts.append(start)
+            self.retained_size += len(text)
+        # Discard the oldest frames beyond the retention limit
+        index = 0
+        while self.retained_size > self.MAX_RETAINED_SIZE and index < len(self.frames) - 1:
+            self.retained_size -= self.frames[index].length
+            index += 1
+        if index:
+            del self.frames[:index]
+            del self.frame_starts[:index]
+        for subscriber in list(self.subscribers):
+            subscriber.send_output_to_client()
+
+    def find_frame(self, offset):
+        """
+        Returns the index of the first retained frame starting at or after the given offset.
+        """
+        return bisect.bisect_left(self.frame_starts, offset)
 
 
 class TaskOutputHandler(tornado.websocket.WebSocketHandler):
-    def initialize(self, session):
+    """
+    Streams a task's output to a client.
+
+    By default, the entire output is replayed on connect. Instead, clients can start
+    following from a given line (`?line=K`), from the last N lines (`?tail=N`), or from
+    a character offset previously returned by TaskLinesHandler (`?offset=N`).
+
+    Live output is sent as frames shared with all other clients (see OutputBroadcast),
+    with permessage-deflate compression if the client supports it. Every message is then
+    compressed independently (see compress_message), whether it's a shared frame or not,
+    so that none of them depend on a compression history the client doesn't share.
+    The amount of output sent but not yet written to the client's socket is capped:
+    clients that fall too far behind skip ahead, with a marker noting the dropped output.
+    """
+
+    # The maximum size (in characters) of a single output message
+    MAX_MESSAGE_SIZE = OutputBroadcast.MAX_FRAME_SIZE
+    # The maximum amount of output (in characters) queued for writing to the client
+    MAX_PENDING_SIZE = 1024 * 1024
+    # Clients that fall further behind than this (in characters) skip ahead
+    MAX_BACKLOG_SIZE = 4 * 1024 * 1024
+
+    # The currently open connections
+    connections = set()
+
+    def initialize(self, session, compress=True):
         self.session = session
+        self.compress = compress
         self.task = None
-        self.stream = None
+        self.broadcast = None
+        self.offset = 0
+        # The output (in characters) sent but not yet written to the socket
+        self.pending_size = 0
+        self.is_flush_pending = False
+        # The window size (bits) for compressing messages on our own (see write_payload)
+        self.deflate_wbits = None
+        # The validated offset, line or tail query arguments (see prepare)
+        self.start_arguments = {}
+
+    def get_compression_options(self):
+        return {} if self.compress else None
+
+    def get_deflate_wbits(self):
+        """
+        Returns the server's window size (bits) for the permessage-deflate extension
+        negotiated with the client, or None if it wasn't negotiated.
+        """
+        header = self.request.headers.get('Sec-WebSocket-Extensions')
+        if not self.compress or not header:
+            return None
+        for offer in header.split(','):
+            params = [param.strip() for param in offer.split(';')]
+            if params[0] != 'permessage-deflate':
+                continue
+            # Like tornado, the first offer is accepted
+            for param in params[1:]:
+                name, _, value = param.partition('=')
+                if name.strip().lower() == 'server_max_window_bits' and value.strip():
+                    return int(value.strip().strip('"'))
+            return zlib.MAX_WBITS
+        return None
 
     def open(self, task_id):
+        self.connections.add(self)
+        if SUPPORTS_PRECOMPRESSED_MESSAGES:
+            self.deflate_wbits = self.get_deflate_wbits()
         self.task = self.session.get_task_by_id(int(task_id))
-        self.stream = StringStream.from_task(self.task)
-        self.task.events.subscribe(self.on_task_event)
+        self.offset = self.get_start_offset(self.task.output)
+        self.broadcast = OutputBroadcast.subscribe(self.task, self)
         self.send_output_to_client()
 
+    def prepare(self):
+        # Validated ahead of the upgrade, so that invalid arguments are answered with a 400
+        self.start_arguments = {}
+        for name in ('offset', 'line', 'tail'):
+            value = self.get_query_argument(name, None)
+            if value is not None:
+                try:
+                    self.start_arguments[name] = int(value)
+                except ValueError:
+                    raise tornado.web.HTTPError(400)
+
+    def get_start_offset(self, log):
+        arguments = self.start_arguments
+        if 'offset' in arguments:
+            return min(max(arguments['offset'], 0), log.length)
+        if 'line' in arguments:
+            return log.get_line_offset(arguments['line'])
+        if 'tail' in arguments:
+            return log.get_line_offset(log.line_count - arguments['tail'])
+        return 0
+
     def on_close(self):
+        self.connections.discard(self)
         self.unsubscribe()
 
-    def on_task_event(self, event):
-        if event == TaskEvent.OUTPUT_UPDATED:
-            self.send_output_to_client()
+    def schedule_flush(self):
+        if not self.is_flush_pending:
+            self.is_flush_pending = True
+            tornado.ioloop.IOLoop.current().add_callback(self.send_output_to_client)
+
+    def skip_backlog(self):
+        log = self.task.output
+        skip_to = self.broadcast.offset - self.MAX_BACKLOG_SIZE
+        dropped = log.get_byte_offset(skip_to) - log.get_byte_offset(self.offset)
+        self.offset = skip_to
+        return ColorText.yellow(f'\n[{dropped} bytes of output dropped]\n')
 
     def send_output_to_client(self):
-        new_fragment = self.stream.read()
-        if new_fragment is None:
-            return
+        self.is_flush_pending = False
+        broadcast = self.broadcast
         try:
-            self.write_message(new_fragment)
+            while (
+                self.task is not None and
+                self.offset < broadcast.offset and
+                self.pending_size < self.MAX_PENDING_SIZE
+            ):
+                index = broadcast.find_frame(self.offset)
+                if index < len(broadcast.frames) and broadcast.frame_starts[index] == self.offset:
+                    frame = broadcast.frames[index]
+                    self.offset = frame.stop
+                    self.write_frame(frame)
+                    continue
+                # Read on our own, up to the next frame boundary
+                prefix = ''
+                if broadcast.offset - self.offset > self.MAX_BACKLOG_SIZE:
+                    prefix = self.skip_backlog()
+                stop = (
+                    broadcast.frame_starts[index] if index < len(broadcast.frames)
+                    else broadcast.offset
+                )
+                stop = min(stop, self.offset + self.MAX_MESSAGE_SIZE)
+                fragment = prefix + self.task.output.read(self.offset, stop)
+                self.offset = stop
+                self.write_payload(fragment.encode('utf8'), len(fragment))
         except tornado.websocket.WebSocketClosedError:
             self.unsubscribe()
 
+    def write_frame(self, frame):
+        """
+        Sends a shared frame without re-encoding (or re-compressing) it for this client.
+        """
+        compressed = None
+        if self.deflate_wbits is not None:
+            compressed = frame.get_compressed(self.deflate_wbits)
+        self.write_payload(frame.payload, frame.length, compressed=compressed)
+
+    def write_payload(self, payload, size, *, compressed=None):
+        """
+        Sends a UTF-8 encoded message, which spans `size` characters of the output.
+
+        Once permessage-deflate is negotiated, tornado's write_message would compress messages
+        with context takeover. Mixing those with the pre-compressed frames would desync the
+        client's decompressor, so every message is instead compressed and written on our own.
+        """
+        if self.deflate_wbits is None:
+            # write_message passes the encoded payload through
+            self.track_write(self.write_message(payload), size)
+            return
+        connection = self.ws_connection
+        if connection is None or connection.is_closing():
+            raise tornado.websocket.WebSocketClosedError()
+        if compressed is None:
+            compressed = compress_message(payload, self.deflate_wbits)
+        try:
+            future_write = connection._write_frame(True, 0x1, compressed, flags=connection.RSV1)
+        except tornado.iostream.StreamClosedError:
+            raise tornado.websocket.WebSocketClosedError()
+        self.track_write(future_write, size)
+
+    def track_write(self, future_write, size):
+        self.pending_size += size
+        future_write.add_done_callback(functools.partial(self.on_message_written, size=size))
+
+    def on_message_written(self, future_write, *, size):
+        self.pending_size -= size
+        if future_write.cancelled() or future_write.exception() is not None:
+            self.unsubscribe()
+        elif self.task is not None and self.offset < self.broadcast.offset:
+            # Resume sending output that was held back due to the pending cap
+            self.schedule_flush()
+
     def unsubscribe(self):
         if self.task is not None:
-            self.task.events.unsubscribe(self.on_task_event)
+            self.broadcast.unsubscribe(self)
+            self.task = None
+
+
+class TaskLinesHandler(tornado.web.RequestHandler):
+    """
+    Returns a range of lines from a task's output, as JSON.
+
+    The range is given by either `?start=K&stop=M` (lines [K, M)) or `?tail=N` (the last
+    N lines), and is capped at MAX_LINES. The response includes the total line count and
+    the character offset following the returned text, from which TaskOutputHandler
+    can continue streaming (`/task-output/<id>?offset=...`).
+    """
+
+    # The maximum number of lines returned per request
+    MAX_LINES = 10000
+
+    def initialize(self, session):
+        self.session = session
+
+    def get(self, task_id):
+        try:
+            task = self.session.get_task_by_id(int(task_id))
+        except KeyError:
+            raise tornado.web.HTTPError(404)
+        log = task.output
+        line_count = log.line_count
+        try:
+            tail = self.get_query_argument('tail', None)
+            if tail is not None:
+                stop = line_count
+                start = max(stop - min(int(tail), self.MAX_LINES), 0)
+            else:
+                start = max(int(self.get_query_argument('start', 0)), 0)
+                stop = int(self.get_query_argument('stop', start + self.MAX_LINES))
+        except ValueError:
+            raise tornado.web.HTTPError(400)
+        stop = max(min(stop, start + self.MAX_LINES, line_count), start)
+        start_offset = log.get_line_offset(start)
+        stop_offset = log.get_line_offset(stop)
+        self.write({
+            'start': start,
+            'stop': stop,
+            'line_count': line_count,
+            'offset': stop_offset,
+            'text': log.read(start_offset, stop_offset),
+        })
+
+
+class TaskRawOutputHandler(tornado.web.RequestHandler):
+    """
+    Streams a task's output over plain HTTP (as UTF-8 text).
+
+    The output is written in blocks, awaiting each flush so that large logs are neither
+    copied into a single buffer nor allowed to stall the event loop. Only the output
+    written before the request arrived is included.
+
+    Supports:
+    - `?since=N` to only fetch the output following the byte offset N. The offset following
+      the returned output is provided in the X-Oxen-Offset header for subsequent requests.
+    - Single byte range requests (`Range: bytes=...`), which take precedence over `since`.
+    - gzip content encoding (for non-range requests).
+    """
+
+    # The (approximate) number of bytes written per flush
+    BLOCK_SIZE = 256 * 1024
+    RANGE_PATTERN = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+    def initialize(self, session):
+        self.session = session
+        self.output_length = 0
+
+    def compute_etag(self):
+        # The output is a moving target
+        return None
+
+    def parse_range(self, length):
+        """
+        Returns the requested (start, stop) byte range, or None if no (supported)
+        range was requested.
+        """
+        header = self.request.headers.get('Range')
+        if header is None:
+            return None
+        match = self.RANGE_PATTERN.match(header.strip())
+        if match is None or match.groups() == ('', ''):
+            # Multiple or malformed ranges are ignored
+            return None
+        first, last = match.groups()
+        if not first:
+            # A suffix range (the last N bytes)
+            start, stop = max(length - int(last), 0), length
+        else:
+            start = int(first)
+            stop = length if not last else min(int(last) + 1, length)
+        if start >= stop:
+            raise tornado.web.HTTPError(416)
+        return start, stop
+
+    def write_error(self, status_code, **kwargs):
+        if status_code == 416:
+            self.set_header('Content-Range', f'bytes */{self.output_length}')
+        super().write_error(status_code, **kwargs)
+
+    def get_log(self, task_id):
+        """
+        Returns the log to serve, which provides `byte_length` and `iter_bytes`.
+        """
+        try:
+            task = self.session.get_task_by_id(int(task_id))
+        except KeyError:
+            raise tornado.web.HTTPError(404)
+        return task.output
+
+    async def get(self, *args):
+        log = self.get_log(*args)
+        stop = self.output_length = log.byte_length
+        try:
+            start = min(max(int(self.get_query_argument('since', 0)), 0), stop)
+        except ValueError:
+            raise tornado.web.HTTPError(400)
+        byte_range = self.parse_range(stop)
+        self.set_header('Content-Type', 'text/plain; charset=utf-8')
+        self.set_header('Accept-Ranges', 'bytes')
+        compressor = None
+        if byte_range is not None:
+            start, stop = byte_range
+            self.set_status(206)
+            self.set_header('Content-Range', f'bytes {start}-{stop - 1}/{self.output_length}')
+        elif 'gzip' in self.request.headers.get('Accept-Encoding', ''):
+            compressor = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+            self.set_header('Content-Encoding', 'gzip')
+            self.set_header('Vary', 'Accept-Encoding')
+        if compressor is None:
+            self.set_header('Content-Length', stop - start)
+        self.set_header('X-Oxen-Offset', stop)
+
+        block = []
+        block_size = 0
+        try:
+            for data in log.iter_bytes(start, stop):
+                block.append(data)
+                block_size += len(data)
+                if block_size >= self.BLOCK_SIZE:
+                    await self.write_block(b''.join(block), compressor)
+                    block = []
+                    block_size = 0
+            if block:
+                await self.write_block(b''.join(block), compressor)
+        except tornado.iostream.StreamClosedError:
+            # The client went away
+            return
+        if compressor is not None:
+            self.write(compressor.flush())
+
+    async def write_block(self, data, compressor):
+        if compressor is not None:
+            data = compressor.compress(data)
+        if data:
+            self.write(data)
+            await self.flush()
+
+
+class TaskResourcesHandler(tornado.web.RequestHandler):
+    """
+    Returns the sampled resource usage of a task's process tree (see ResourceSeries),
+    with the values of each field listed oldest first.
+
+    Use `?since=T` to only fetch the samples taken after the (wall clock) time T, eg: the
+    time of the last sample previously fetched.
+    """
+
+    def initialize(self, session):
+        self.session = session
+
+    def get(self, task_id):
+        try:
+            task = self.session.get_task_by_id(int(task_id))
+        except KeyError:
+            raise tornado.web.HTTPError(404)
+        series = getattr(task, 'resources', None)
+        if series is None:
+            # Not a process, or sampling is disabled
+            raise tornado.web.HTTPError(404)
+        try:
+            since = self.get_query_argument('since', None)
+            since = float(since) if since is not None else None
+        except ValueError:
+            raise tornado.web.HTTPError(400)
+        self.write({
+            'interval': task.sample_interval,
+            'samples': series.get_samples(since=since),
+        })
+
+
+def get_stored_task(session, task_id):
+    """
+    Returns the task with the given id, if its output is persisted (see OutputStore).
+    """
+    if session.output_store is None:
+        raise tornado.web.HTTPError(404)
+    try:
+        task = session.get_task_by_id(int(task_id))
+    except KeyError:
+        raise tornado.web.HTTPError(404)
+    if task.id not in session.output_store.task_id_to_keys:
+        raise tornado.web.HTTPError(404)
+    return task
+
+
+class TaskRunsHandler(tornado.web.RequestHandler):
+    """
+    Lists the prior runs of a task (newest first), for sessions that persist their output.
+    The output of each run is served by TaskRunOutputHandler.
+    """
+
+    def initialize(self, session):
+        self.session = session
+
+    def get(self, task_id):
+        task = get_stored_task(self.session, task_id)
+        runs = self.session.output_store.get_runs(task)
+        for run in runs:
+            run.index()
+        self.write({
+            'runs': [
+                {'id': run.id, 'started_at': run.started_at, 'bytes': run.byte_length}
+                for run in runs
+            ],
+        })
+
+
+class TaskRunOutputHandler(TaskRawOutputHandler):
+    """
+    Streams the output of a prior run of a task (see TaskRawOutputHandler).
+    """
+
+    def get_log(self, task_id, run_id):
+        task = get_stored_task(self.session, task_id)
+        try:
+            run = self.session.output_store.get_run(task, run_id)
+        except KeyError:
+            raise tornado.web.HTTPError(404)
+        run.index()
+        return run
+
+
+class MetricsHandler(tornado.web.RequestHandler):
+    """
+    Reports oxen's internal metrics in the Prometheus text exposition format.
+    """
+
+    def initialize(self, session):
+        self.session = session
+
+    def get(self):
+        writer = MetricsWriter()
+        self.session.metrics.collect(writer)
+        for name, handler_class in (('tasks', TaskInfoHandler), ('output', TaskOutputHandler)):
+            writer.add(
+                'oxen_websocket_connections',
+                len(handler_class.connections),
+                'The number of open WebSocket connections.',
+                labels={'endpoint': name}
+            )
+        task_to_handlers = {}
+        for handler in TaskOutputHandler.connections:
+            if handler.task is not None:
+                task_to_handlers.setdefault(handler.task, []).append(handler)
+        for task, handlers in task_to_handlers.items():
+            labels = {'task': task.name, 'id': task.id}
+            writer.add(
+                'oxen_task_output_clients',
+                len(handlers),
+                'The number of clients streaming a task\'s output.',
+                labels=labels
+            )
+            writer.add(
+                'oxen_task_output_pending_chars',
+                sum(handler.pending_size for handler in handlers),
+                'The output sent to a task\'s clients but not yet written to their sockets.',
+                labels=labels
+            )
+        writer.add(
+            'oxen_output_broadcast_subscribers',
+            sum(len(broadcast.subscribers) for broadcast in OutputBroadcast._broadcasts.values()),
+            'The number of clients subscribed to shared output frames.'
+        )
+        self.set_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.write(writer.render())
 
 
 class TaskActionHandler(tornado.web.RequestHandler):
@@ -89,12 +679,31 @@ class TaskActionHandler(tornado.web.RequestHandler):
     def post(self):
         payload = tornado.escape.json_decode(self.request.body)
         task = self.session.get_task_by_id(payload['task'])
-        result = task.perform_action(payload['action'])
+        # Optional keyword arguments for the action (eg: the limits for 'Rate Limit')
+        arguments = payload.get('arguments') or {}
+        if not isinstance(arguments, dict):
+            raise tornado.web.HTTPError(400)
+        try:
+            action = task.get_action(payload['action'])
+            inspect.signature(action.handler).bind(**arguments)
+        except (TaskActionError, TypeError) as err:
+            raise tornado.web.HTTPError(400, str(err))
+        try:
+            result = action.handler(**arguments)
+        except TaskActionError as err:
+            # Rejected by the handler (any other error is reported as an internal one)
+            raise tornado.web.HTTPError(400, str(err))
         self.write(result or 'OK')
 
 
 class WebApp(tornado.web.Application):
-    def __init__(self, session):
+    """
+    * compress_output
+      If true, task output is streamed with permessage-deflate compression
+      (for clients that support it).
+    """
+
+    def __init__(self, session, *, compress_output=True):
         static_path = Path(__file__).parent / 'client' / 'static'
         template_path = static_path / 'templates'
         session_dict = {'session': session}
@@ -111,8 +720,33 @@ class WebApp(tornado.web.Application):
                 session_dict
             ),
             (
-                r'/task-output/(.*)',
+                r'/task-output/(\d+)',
                 TaskOutputHandler,
+                dict(session_dict, compress=compress_output)
+            ),
+            (
+                r'/task-output/(\d+)/raw',
+                TaskRawOutputHandler,
+                session_dict
+            ),
+            (
+                r'/task-output/(\d+)/runs',
+                TaskRunsHandler,
+                session_dict
+            ),
+            (
+                r'/task-output/(\d+)/runs/([\w-]+)',
+                TaskRunOutputHandler,
+                session_dict
+            ),
+            (
+                r'/task-lines/(\d+)',
+                TaskLinesHandler,
+                session_dict
+            ),
+            (
+                r'/task-resources/(\d+)',
+                TaskResourcesHandler,
                 session_dict
             ),
             (
@@ -120,6 +754,11 @@ class WebApp(tornado.web.Application):
                 TaskActionHandler,
                 session_dict
             ),
+            (
+                r'/metrics',
+                MetricsHandler,
+                session_dict
+            ),
             (
                 r'/static/(.*)',
                 tornado.web.StaticFileHandler,
@@ -0,0 +1,152 @@
+import asyncio
+import logging
+import os
+import socket
+
+from .color import status_ok
+from .process import Process
+from .ratelimit import OutputLimit
+from .remote import MessageWriter, open_connection, receive_messages
+from .task import TaskEvent, TaskStatus
+
+
+class WorkerTask:
+    """
+    A process executed on behalf of a session, whose output and status are relayed back.
+
+    Whenever the connection to the session is congested, reading the process's output is
+    suspended until the connection is drained (so a chatty process on a slow link blocks,
+    rather than growing the connection's buffer without bound).
+    """
+
+    def __init__(self, task_id, run, process, writer):
+        self.task_id = task_id
+        # The session's run number, included in every message
+        self.run = run
+        self.process = process
+        self.writer = writer
+        self.cursor = process.output.cursor()
+        self.last_status = None
+        self.pending_flush = False
+        process.events.subscribe(self.on_process_event)
+
+    def on_process_event(self, event):
+        if event == TaskEvent.OUTPUT_UPDATED:
+            # Coalesce output updates within a single event loop iteration
+            if not self.pending_flush:
+                self.pending_flush = True
+                self.process.loop.call_soon(self.flush_output)
+        elif event == TaskEvent.STATUS_CHANGED:
+            status = self.process.get_status()
+            if status == self.last_status:
+                return
+            self.last_status = status
+            # Make sure all output precedes the status change
+            self.flush_output()
+            self.send(type='status', status=status.value)
+
+    def flush_output(self):
+        self.pending_flush = False
+        fragment = self.cursor.read()
+        if fragment is not None:
+            self.send(type='output', data=fragment)
+            if self.writer.is_congested and not self.process.is_reading_suspended:
+                self.process.suspend_reading()
+                self.writer.drained().add_done_callback(self.on_drained)
+
+    def on_drained(self, future_drain):
+        self.process.resume_reading()
+
+    def send(self, **message):
+        self.writer.send(task=self.task_id, run=self.run, **message)
+
+
+class Worker:
+    """
+    An agent that executes processes on behalf of a session.
+
+    * address
+      The session's worker address (`host:port` or `unix:/path/to/socket`).
+    * slots
+      The number of processes this worker is willing to run concurrently.
+    * name
+      Optional name for this worker. Defaults to the hostname and pid.
+    * reconnect_delay
+      The interval (in seconds) between attempts to (re)connect to the session.
+    """
+
+    def __init__(self, address, *, slots=None, name=None, reconnect_delay=1.0):
+        self.address = address
+        self.slots = slots or os.cpu_count()
+        self.name = name or f'{socket.gethostname()}:{os.getpid()}'
+        self.reconnect_delay = reconnect_delay
+        self.id_to_tasks = {}
+
+    async def run(self):
+        while True:
+            try:
+                reader, writer = await open_connection(self.address)
+            except OSError as err:
+                logging.warning(f'Unable to connect to {self.address}: {err}')
+            else:
+                status_ok('Connected', self.address)
+                await self.serve(reader, writer)
+                logging.warning(f'Disconnected from {self.address}')
+            await asyncio.sleep(self.reconnect_delay)
+
+    async def serve(self, reader, writer):
+        writer = MessageWriter(writer)
+        writer.send(type='register', name=self.name, slots=self.slots)
+        try:
+            async for message in receive_messages(reader):
+                if message['type'] == 'start':
+                    self.start_task(message, writer)
+                elif message['type'] == 'stop':
+                    task = self.id_to_tasks.get(message['task'])
+                    if task is not None:
+                        task.process.stop()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            # Without a session to report to, there's no point in continuing
+            for task in self.id_to_tasks.values():
+                if task.process.is_active:
+                    task.process.stop()
+            self.id_to_tasks.clear()
+
+    def start_task(self, message, writer):
+        process = Process(
+            *message['argv'],
+            cwd=message['cwd'],
+            env=message['env'],
+            name=message['name'],
+            pty=message['pty'],
+            shell=message.get('shell', False),
+            output_limit=(
+                OutputLimit(**message['output_limit']) if message.get('output_limit') else None
+            ),
+            # The resource usage isn't relayed back to the session
+            sample_interval=None
+        )
+        process.loop = asyncio.get_event_loop()
+        task = WorkerTask(message['task'], message.get('run'), process, writer)
+        self.id_to_tasks[task.task_id] = task
+        process.events.subscribe(
+            lambda event: self.on_process_event(event, task=task)
+        )
+        status_ok('Starting', process.name)
+        try:
+            process.start()
+        except OSError as err:
+            task.send(type='output', data=f'{err}\n')
+            task.send(type='status', status=TaskStatus.FAILED.value)
+            self.id_to_tasks.pop(task.task_id)
+
+    def on_process_event(self, event, *, task):
+        if (
+            event == TaskEvent.STATUS_CHANGED and
+            not task.process.is_active and
+            self.id_to_tasks.get(task.task_id) is task
+        ):
+            del self.id_to_tasks[task.task_id]
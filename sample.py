@@ -10,7 +10,8 @@ def run():
         'python',
         '-c',
         'import time; [print(i) or time.sleep(0.5) for i in range(10)]',
-        name='Counter'
+        name='Counter',
+        sample_interval=1.0
     )
 
     session += Watch(
@@ -29,7 +29,16 @@ setup(
         ],
     },
     include_package_data=True,
-    install_requires=['tornado', 'watchdog'],
+    entry_points={
+        'console_scripts': ['oxen=oxen.cli:main'],
+    },
+    install_requires=[
+        'ptyprocess',
+        'tornado',
+        'watchdog',
+        # For reading TOML configs (see oxen.config) prior to Python 3.11
+        'tomli; python_version < "3.11"',
+    ],
     zip_safe=True,
     license='BSD'
 )
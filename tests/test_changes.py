@@ -0,0 +1,183 @@
+import os
+
+import pytest
+
+from oxen.changes import ChangeSet, ChangeType, PathFilter, filter_event
+
+
+class Event:
+    """
+    Stands in for a watchdog event.
+    """
+
+    def __init__(self, event_type, src_path, dest_path='', is_directory=False):
+        self.event_type = event_type
+        self.src_path = src_path
+        self.dest_path = dest_path
+        self.is_directory = is_directory
+
+
+ROOT = os.path.abspath('/watched')
+
+
+def path(*parts):
+    return os.path.join(ROOT, *parts)
+
+
+def get_changes(*events, **options):
+    changes = ChangeSet(**options)
+    changes.update(events)
+    return {change.path: change for change in changes}
+
+
+@pytest.mark.parametrize('relative_path, is_directory, accepted', [
+    ('src/main.py', False, True),
+    ('.git/HEAD', False, False),
+    ('.git', True, False),
+    ('src/__pycache__/main.cpython-311.pyc', False, False),
+    ('src/.main.py.swp', False, False),
+    ('src/main.py~', False, False),
+    ('4913', False, False),
+])
+def test_default_excludes(relative_path, is_directory, accepted):
+    path_filter = PathFilter(ROOT)
+    assert path_filter.accepts(path(relative_path), is_directory) == accepted
+
+
+def test_paths_outside_the_root_are_rejected():
+    path_filter = PathFilter(ROOT)
+    assert path_filter.accepts(ROOT, is_directory=True)
+    assert not path_filter.accepts(os.path.abspath('/elsewhere/main.py'))
+    assert not path_filter.accepts(os.path.abspath('/'), is_directory=True)
+
+
+def test_names_starting_with_dots_are_within_the_root():
+    path_filter = PathFilter(ROOT)
+    assert path_filter.accepts(path('..foo'))
+    assert path_filter.accepts(path('...', 'main.py'))
+
+
+def test_include_patterns():
+    path_filter = PathFilter(ROOT, include=['*.py', 'docs/**/*.md'])
+    assert path_filter.accepts(path('a', 'b', 'main.py'))
+    assert path_filter.accepts(path('docs', 'guide', 'intro.md'))
+    assert not path_filter.accepts(path('README.md'))
+    # Directories are accepted, since they may contain included paths
+    assert path_filter.accepts(path('build'), is_directory=True)
+
+
+def test_exclude_precedence_and_negation():
+    path_filter = PathFilter(ROOT, exclude=['*.log', '!keep.log', 'build/', '/dist'])
+    assert not path_filter.accepts(path('debug.log'))
+    assert path_filter.accepts(path('keep.log'))
+    assert not path_filter.accepts(path('src', 'build', 'out.o'))
+    # A trailing '/' only matches directories
+    assert path_filter.accepts(path('build'))
+    # A leading '/' anchors the pattern to the root
+    assert not path_filter.accepts(path('dist', 'app'))
+    assert path_filter.accepts(path('src', 'dist', 'app'))
+
+
+def test_ignore_file(tmp_path):
+    (tmp_path / '.oxenignore').write_text('# Comment\n\n*.tmp\n')
+    path_filter = PathFilter(tmp_path, exclude=(), ignore_file='.oxenignore')
+    assert not path_filter.accepts(str(tmp_path / 'scratch.tmp'))
+    assert path_filter.accepts(str(tmp_path / 'main.py'))
+
+
+def test_missing_ignore_file():
+    path_filter = PathFilter(ROOT, exclude=(), ignore_file='.missing')
+    assert path_filter.accepts(path('main.py'))
+
+
+def test_filter_event_reduces_moves_across_the_boundary():
+    path_filter = PathFilter(ROOT)
+    # An editor replacing a file with its swap file
+    event = filter_event(
+        path_filter,
+        Event('moved', path('.main.py.swp'), path('main.py'))
+    )
+    assert (event.event_type, event.src_path) == ('created', path('main.py'))
+    event = filter_event(path_filter, Event('moved', path('main.py'), path('main.py~')))
+    assert (event.event_type, event.src_path) == ('deleted', path('main.py'))
+    assert filter_event(path_filter, Event('modified', path('.git', 'index'))) is None
+
+
+def test_created_then_modified_is_created():
+    changes = get_changes(Event('created', path('a')), Event('modified', path('a')))
+    assert changes[path('a')].change_type == ChangeType.CREATED
+
+
+def test_created_then_deleted_is_dropped():
+    changes = ChangeSet()
+    changes.update([Event('created', path('a')), Event('deleted', path('a'))])
+    assert not changes
+    assert len(changes) == 0
+
+
+def test_deleted_then_created_is_modified():
+    changes = get_changes(Event('deleted', path('a')), Event('created', path('a')))
+    assert changes[path('a')].change_type == ChangeType.MODIFIED
+
+
+def test_directory_modifications_are_ignored():
+    changes = get_changes(Event('modified', path('dir'), is_directory=True))
+    assert not changes
+
+
+def test_moves_are_chained():
+    changes = get_changes(
+        Event('moved', path('a'), path('b')),
+        Event('moved', path('b'), path('c'))
+    )
+    assert list(changes) == [path('c')]
+    change = changes[path('c')]
+    assert change.change_type == ChangeType.MOVED
+    assert (change.src_path, change.dest_path) == (path('a'), path('c'))
+
+
+def test_moved_back_is_modified():
+    changes = get_changes(
+        Event('moved', path('a'), path('b')),
+        Event('moved', path('b'), path('a'))
+    )
+    assert changes[path('a')].change_type == ChangeType.MODIFIED
+
+
+def test_created_then_moved_is_created():
+    changes = get_changes(Event('created', path('a')), Event('moved', path('a'), path('b')))
+    assert list(changes) == [path('b')]
+    assert changes[path('b')].change_type == ChangeType.CREATED
+
+
+def test_moved_then_deleted_deletes_the_original():
+    changes = get_changes(Event('moved', path('a'), path('b')), Event('deleted', path('b')))
+    assert list(changes) == [path('a')]
+    assert changes[path('a')].change_type == ChangeType.DELETED
+
+
+def test_overflow():
+    changes = ChangeSet(max_paths=2)
+    changes.update(Event('modified', path(str(index))) for index in range(3))
+    assert changes.overflowed
+    assert changes
+    assert len(changes) == 0
+    changes.add(Event('modified', path('more')))
+    assert len(changes) == 0
+
+
+def test_merge():
+    changes = ChangeSet()
+    changes.add(Event('created', path('a')))
+    later = ChangeSet()
+    later.add(Event('deleted', path('a')))
+    later.add(Event('modified', path('b')))
+    later.is_forced = True
+    changes.merge(later)
+    assert changes.paths == [path('b')]
+    assert changes.is_forced
+    overflowed = ChangeSet(max_paths=0)
+    overflowed.add(Event('modified', path('c')))
+    changes.merge(overflowed)
+    assert changes.overflowed
+    assert len(changes) == 0
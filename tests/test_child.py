@@ -0,0 +1,70 @@
+import asyncio
+import os
+import subprocess
+
+import pytest
+
+from oxen.child import ChildExitMonitor
+
+EXIT_CODES = [0, 1, 3, 7]
+
+
+async def wait_for(predicate, timeout=10.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise TimeoutError
+        await asyncio.sleep(0.01)
+
+
+def spawn(exit_code, delay=0.0):
+    return subprocess.Popen(['sh', '-c', f'sleep {delay}; exit {exit_code}'])
+
+
+def disable_pidfds(monkeypatch):
+    # As on platforms (or kernels) without pidfd support
+    monkeypatch.delattr(os, 'pidfd_open', raising=False)
+
+
+def disable_sigchld(loop):
+    def add_signal_handler(*args):
+        raise RuntimeError('Not the main thread')
+
+    loop.add_signal_handler = add_signal_handler
+
+
+@pytest.mark.parametrize('backend', ['pidfd', 'sigchld', 'polling'])
+def test_exit_codes(backend, monkeypatch):
+    if backend == 'pidfd' and not hasattr(os, 'pidfd_open'):
+        pytest.skip('pidfds are unsupported')
+    if backend != 'pidfd':
+        disable_pidfds(monkeypatch)
+    monkeypatch.setattr(ChildExitMonitor, 'FALLBACK_POLL_INTERVAL', 0.01)
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        if backend == 'polling':
+            disable_sigchld(loop)
+        monitor = ChildExitMonitor(loop)
+        exit_codes = {}
+
+        def on_exit(child):
+            # The child is left for its owner to reap
+            exit_codes[child.pid] = child.wait()
+
+        # One child exits before it's registered
+        early = spawn(5)
+        await wait_for(lambda: ChildExitMonitor.has_exited(early.pid))
+        children = [spawn(exit_code, delay=0.05) for exit_code in EXIT_CODES]
+        for child in [early, *children]:
+            monitor.add(child.pid, lambda child=child: on_exit(child))
+        await wait_for(lambda: len(exit_codes) == len(children) + 1)
+        assert exit_codes[early.pid] == 5
+        assert [exit_codes[child.pid] for child in children] == EXIT_CODES
+        assert not monitor.pid_to_callback
+        assert monitor.is_sigchld_installed == (backend == 'sigchld')
+        if backend == 'polling':
+            # Polling stops once there are no children left
+            await wait_for(lambda: not monitor.is_polling)
+
+    asyncio.run(main())
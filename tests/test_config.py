@@ -0,0 +1,63 @@
+import os
+
+import pytest
+
+from oxen.config import SessionConfig, is_remote_path
+from oxen.store import OutputStore
+
+
+def get_rsync_paths(config):
+    task, _, _ = config.tasks[0]
+    return task.handler.source, task.handler.dest
+
+
+@pytest.mark.parametrize('path, is_remote', [
+    ('host:/srv/app', True),
+    ('deploy@host:app', True),
+    ('rsync://host/module', True),
+    ('/srv/app', False),
+    ('build/out', False),
+    ('./host:app', False),
+    (':app', False),
+])
+def test_is_remote_path(path, is_remote):
+    assert is_remote_path(path) == is_remote
+
+
+def test_rsync_paths(tmp_path):
+    config = SessionConfig(
+        {'tasks': [{'type': 'rsync', 'name': 'Sync', 'source': 'src', 'dest': 'build/out'}]},
+        base_dir=str(tmp_path)
+    )
+    assert get_rsync_paths(config) == (str(tmp_path / 'src'), str(tmp_path / 'build' / 'out'))
+
+
+def test_remote_rsync_dest_is_not_resolved(tmp_path):
+    (tmp_path / 'src').mkdir()
+    config = SessionConfig(
+        {'tasks': [
+            {'type': 'rsync', 'name': 'Sync', 'source': 'src', 'dest': 'deploy@host:/srv/app'}
+        ]},
+        base_dir=str(tmp_path)
+    )
+    assert get_rsync_paths(config) == (str(tmp_path / 'src'), 'deploy@host:/srv/app')
+    assert not config.warnings
+
+
+def test_building_has_no_side_effects(tmp_path):
+    store_dir = tmp_path / 'store'
+    prior_runs = store_dir / OutputStore(str(store_dir)).get_key('Counter')
+    for index in range(OutputStore.MAX_RUNS + 2):
+        (prior_runs / f'{index:013d}-1').mkdir(parents=True)
+    config = SessionConfig(
+        {
+            'session': {'store_dir': 'store', 'profile_events': True},
+            'tasks': [{'name': 'Counter', 'command': ['true']}],
+        },
+        base_dir=str(tmp_path)
+    )
+    assert len(os.listdir(prior_runs)) == OutputStore.MAX_RUNS + 2
+    assert config.session.output_store.executor is None
+    # Event profiling is only enabled once the session starts
+    task, _, _ = config.tasks[0]
+    assert task.events.profiler is None
@@ -0,0 +1,147 @@
+import asyncio
+
+import pytest
+
+from oxen.event import DispatchProfiler, EventEmitter
+from oxen.task import Task
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+def run_pending(loop):
+    # The queued deliveries are scheduled with call_soon
+    loop.run_until_complete(asyncio.sleep(0))
+
+
+def test_merge_policy(loop):
+    emitter = EventEmitter()
+    received = []
+    emitter.subscribe(received.append, queue_size=2, policy='merge', loop=loop)
+    for event in ('a', 'b', 'a', 'b'):
+        emitter.publish(event)
+    assert received == []
+    queued = emitter.subscriber_to_queue[received.append]
+    assert queued.dropped == 0
+    # Distinct events beyond the queue size drop the oldest
+    emitter.publish('c')
+    assert queued.dropped == 1
+    run_pending(loop)
+    assert received == ['b', 'c']
+
+
+def test_drop_policy(loop):
+    emitter = EventEmitter()
+    received = []
+    emitter.subscribe(received.append, queue_size=2, policy='drop', loop=loop)
+    for event in ('a', 'a', 'b'):
+        emitter.publish(event)
+    run_pending(loop)
+    assert received == ['a', 'b']
+    assert emitter.subscriber_to_queue[received.append].dropped == 1
+
+
+def test_unsupported_policy(loop):
+    with pytest.raises(ValueError):
+        EventEmitter().subscribe(print, queue_size=1, policy='block', loop=loop)
+
+
+def test_events_published_during_delivery_wait(loop):
+    emitter = EventEmitter()
+    received = []
+
+    def subscriber(event):
+        received.append(event)
+        if event == 'a':
+            emitter.publish('b')
+
+    emitter.subscribe(subscriber, queue_size=4, policy='drop', loop=loop)
+    emitter.publish('a')
+    queued = emitter.subscriber_to_queue[subscriber]
+    queued.deliver()
+    assert received == ['a']
+    assert list(queued.queue) == ['b']
+    assert queued.is_scheduled
+    run_pending(loop)
+    assert received == ['a', 'b']
+
+
+def test_unsubscribing_discards_queued_events(loop):
+    emitter = EventEmitter()
+    received = []
+    emitter.subscribe(received.append, queue_size=4, policy='drop', loop=loop)
+    emitter.publish('a')
+    emitter.unsubscribe(received.append)
+    run_pending(loop)
+    assert received == []
+    assert not emitter.subscribers
+    with pytest.raises(KeyError):
+        emitter.unsubscribe(received.append)
+
+
+def test_subscriptions_changed_during_publish(loop):
+    emitter = EventEmitter()
+    received = []
+
+    def first(event):
+        received.append(('first', event))
+        # Neither change affects the event being published
+        emitter.unsubscribe(first)
+        emitter.unsubscribe(second)
+        emitter.subscribe(third)
+
+    def second(event):
+        received.append(('second', event))
+
+    def third(event):
+        received.append(('third', event))
+
+    emitter.subscribe(first)
+    emitter.subscribe(second)
+    emitter.publish('a')
+    assert received == [('first', 'a'), ('second', 'a')]
+    emitter.publish('b')
+    assert received[2:] == [('third', 'b')]
+
+
+def test_profiler_is_per_emitter(loop):
+    profiled = EventEmitter()
+    profiled.profiler = DispatchProfiler()
+    other = EventEmitter()
+
+    def subscriber(event):
+        pass
+
+    def queued_subscriber(event):
+        pass
+
+    profiled.subscribe(subscriber)
+    profiled.subscribe(queued_subscriber, queue_size=1, loop=loop)
+    other.subscribe(subscriber)
+    profiled.publish('a')
+    other.publish('a')
+    run_pending(loop)
+    stats = profiled.profiler.name_to_stats
+    assert stats[subscriber.__qualname__].count == 1
+    # Queued subscribers are timed upon delivery
+    assert stats[queued_subscriber.__qualname__].count == 1
+
+
+def test_subtasks_inherit_the_profiler(loop):
+    class Owner(Task):
+        pass
+
+    class Subtask(Task):
+        def start(self):
+            pass
+
+    owner = Owner('owner')
+    owner.loop = loop
+    owner.events.profiler = DispatchProfiler()
+    subtask = Subtask('subtask')
+    owner.start_subtask(subtask)
+    assert subtask.events.profiler is owner.events.profiler
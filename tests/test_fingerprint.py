@@ -0,0 +1,111 @@
+import errno
+import os
+
+import pytest
+
+from oxen import fingerprint
+from oxen.changes import Change, ChangeSet, ChangeType
+from oxen.fingerprint import FingerprintCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return FingerprintCache(str(tmp_path / 'cache' / 'fingerprints.json'))
+
+
+def make_changes(*changes):
+    change_set = ChangeSet()
+    for change in changes:
+        change_set.path_to_change[change.path] = change
+    return change_set
+
+
+def touch(path, text):
+    """
+    Rewrites the file, bumping its mtime so that it's re-hashed.
+    """
+    stat = os.stat(path) if os.path.exists(path) else None
+    with open(path, 'w') as outfile:
+        outfile.write(text)
+    if stat is not None:
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+
+
+def test_unchanged_contents_are_dropped(tmp_path, cache):
+    path = str(tmp_path / 'main.py')
+    touch(path, 'print(1)')
+    changes = make_changes(Change(ChangeType.CREATED, path))
+    assert cache.get_content_changes(changes).paths == [path]
+    # Saved without the contents changing (eg: by an editor)
+    touch(path, 'print(1)')
+    changes = make_changes(Change(ChangeType.MODIFIED, path))
+    assert cache.get_content_changes(changes).paths == []
+    touch(path, 'print(2)')
+    assert cache.get_content_changes(changes).paths == [path]
+
+
+def test_cache_is_persisted(tmp_path, cache):
+    path = str(tmp_path / 'main.py')
+    touch(path, 'print(1)')
+    cache.get_content_changes(make_changes(Change(ChangeType.CREATED, path)))
+    reloaded = FingerprintCache(cache.path)
+    changes = make_changes(Change(ChangeType.MODIFIED, path))
+    assert reloaded.get_content_changes(changes).paths == []
+
+
+def test_unreadable_cache_is_reset(tmp_path):
+    path = tmp_path / 'fingerprints.json'
+    path.write_text('{not json')
+    assert FingerprintCache(str(path)).entries == {}
+
+
+def test_other_changes_are_retained(tmp_path, cache):
+    path = str(tmp_path / 'main.py')
+    touch(path, 'print(1)')
+    cache.get_content_changes(make_changes(Change(ChangeType.CREATED, path)))
+    os.remove(path)
+    directory = str(tmp_path / 'src')
+    os.mkdir(directory)
+    changes = make_changes(
+        Change(ChangeType.DELETED, path),
+        Change(ChangeType.MODIFIED, directory, is_directory=True),
+        Change(ChangeType.MOVED, str(tmp_path / 'b'), src_path=str(tmp_path / 'a')),
+    )
+    assert sorted(cache.get_content_changes(changes).paths) == sorted(changes.paths)
+    assert path not in cache.entries
+
+
+def test_overflowed_changes_are_returned_as_is(cache):
+    changes = ChangeSet()
+    changes.overflowed = True
+    assert cache.get_content_changes(changes) is changes
+
+
+def test_unreadable_files_are_changed(tmp_path, cache, monkeypatch):
+    path = str(tmp_path / 'main.py')
+    touch(path, 'print(1)')
+    cache.get_content_changes(make_changes(Change(ChangeType.CREATED, path)))
+
+    def hash_file(path):
+        raise OSError(errno.EIO, 'Input/output error', path)
+
+    monkeypatch.setattr(fingerprint, 'hash_file', hash_file)
+    touch(path, 'print(1)')
+    changes = make_changes(Change(ChangeType.MODIFIED, path))
+    assert cache.get_content_changes(changes).paths == [path]
+    # The entry is dropped, so that the file is hashed again once it's readable
+    assert path not in cache.entries
+    unknown_path = str(tmp_path / 'other.py')
+    touch(unknown_path, 'print(2)')
+    changes = make_changes(Change(ChangeType.CREATED, unknown_path))
+    assert cache.get_content_changes(changes).paths == [unknown_path]
+
+
+def test_unwritable_cache_is_skipped(tmp_path):
+    (tmp_path / 'cache').write_text('')
+    cache = FingerprintCache(str(tmp_path / 'cache' / 'fingerprints.json'))
+    path = str(tmp_path / 'main.py')
+    touch(path, 'print(1)')
+    changes = make_changes(Change(ChangeType.CREATED, path))
+    assert cache.get_content_changes(changes).paths == [path]
+    assert cache.is_dirty
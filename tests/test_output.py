@@ -0,0 +1,169 @@
+import os
+
+import pytest
+
+from oxen.output import BinaryOutputLog, OutputBudget, OutputLog, OutputRetention, OutputSegment
+
+
+@pytest.fixture
+def retention(tmp_path):
+    return OutputRetention(max_resident_bytes=10, spill_dir=str(tmp_path), segment_size=32)
+
+
+def write_numbered_lines(log, count):
+    text = ''.join(f'line {index}\n' for index in range(count))
+    for line in text.splitlines(keepends=True):
+        log.append(line)
+    return text
+
+
+def test_append_and_read_ranges():
+    log = OutputLog()
+    log.append('héllo ')
+    log.append('wörld\n')
+    assert len(log) == 12
+    assert log.getvalue() == 'héllo wörld\n'
+    assert log.read(3, 9) == 'lo wör'
+    assert log.read(9) == 'ld\n'
+    assert log.read(20) == ''
+    assert log.byte_length == 14
+    assert log.get_byte_offset(7) == 8
+    assert b''.join(log.iter_bytes(1, 9)) == 'héllo wörld\n'.encode('utf8')[1:9]
+
+
+def test_lines():
+    log = OutputLog()
+    log.append('a\nbb\n')
+    log.append('ccc')
+    assert log.line_count == 3
+    assert log.read_lines(1, 2) == 'bb\n'
+    assert log.read_lines(1) == 'bb\nccc'
+    assert log.find_line(3) == 1
+    assert log.get_line_offset(10) == len(log)
+    log.append('\n')
+    assert log.line_count == 3
+
+
+def test_spills_beyond_retention(retention):
+    log = OutputLog(retention=retention)
+    text = write_numbered_lines(log, 20)
+    stats = log.get_stats()
+    assert stats['resident_bytes'] <= retention.max_resident_bytes
+    assert stats['spilled_bytes'] == stats['total_bytes'] - stats['resident_bytes']
+    # Segments are started once the current one exceeds the segment size
+    assert stats['segments'] > 1
+    assert log.getvalue() == text
+    assert log.read(25, 75) == text[25:75]
+    assert log.read_lines(5, 8) == 'line 5\nline 6\nline 7\n'
+    assert b''.join(log.iter_bytes(3, 60)) == text.encode('utf8')[3:60]
+
+
+def test_spilled_multibyte_chunks(retention):
+    log = OutputLog(retention=retention)
+    for _ in range(10):
+        log.append('ünïcödé\n')
+    assert log.first_resident > 0
+    assert log.getvalue() == 'ünïcödé\n' * 10
+    assert log.get_byte_offset(9) == len('ünïcödé\nü'.encode('utf8'))
+
+
+def test_only_the_last_segment_is_writable(retention):
+    log = OutputLog(retention=retention)
+    write_numbered_lines(log, 40)
+    assert all(segment.is_sealed for segment in log.segments[:-1])
+    assert not log.segments[-1].is_sealed
+    log.set_finished(True)
+    assert all(segment.is_sealed for segment in log.segments)
+    # Sealed segments remain readable
+    assert log.read_lines(0, 1) == 'line 0\n'
+
+
+def test_finished_log_spills_into_a_new_segment(retention):
+    log = OutputLog(retention=retention)
+    write_numbered_lines(log, 5)
+    log.set_finished(True)
+    segment_count = len(log.segments)
+    log.set_finished(False)
+    text = log.getvalue() + write_numbered_lines(log, 5)
+    assert len(log.segments) > segment_count
+    assert log.getvalue() == text
+
+
+def test_spill_files_are_removed(retention):
+    log = OutputLog(retention=retention)
+    write_numbered_lines(log, 20)
+    spill_path = log.spill_path
+    assert os.listdir(spill_path)
+    del log
+    assert not os.path.exists(spill_path)
+
+
+def test_sealed_mappings_are_bounded(retention, monkeypatch):
+    monkeypatch.setattr(OutputSegment, 'MAX_SEALED_MAPPINGS', 2)
+    log = OutputLog(retention=retention)
+    write_numbered_lines(log, 80)
+    log.set_finished(True)
+    assert log.getvalue().startswith('line 0\n')
+    mapped = [segment for segment in log.segments if segment.mapping is not None]
+    assert len(mapped) == 2
+
+
+def test_read_only_segment(tmp_path):
+    path = str(tmp_path / 'segment')
+    with open(path, 'wb') as segment_file:
+        segment_file.write(b'persisted')
+    segment = OutputSegment(path, writable=False)
+    assert segment.is_sealed
+    assert segment.size == 9
+    assert segment.read(2, 5) == b'rsist'
+    segment.close()
+
+
+def test_budget_spills_the_largest_logs(tmp_path):
+    budget = OutputBudget(100, low_water_mark=0.5)
+    small = OutputLog(retention=OutputRetention(spill_dir=str(tmp_path)))
+    large = OutputLog(retention=OutputRetention(spill_dir=str(tmp_path)))
+    budget.add(small)
+    budget.add(large)
+    small.append('s' * 20)
+    for _ in range(9):
+        large.append('l' * 10)
+    assert budget.resident_bytes == small.resident_bytes + large.resident_bytes
+    assert budget.resident_bytes <= 50
+    assert small.resident_bytes == 20
+    assert large.getvalue() == 'l' * 90
+
+
+def test_budget_evicts_finished_logs_first(tmp_path):
+    budget = OutputBudget(100, low_water_mark=0.75)
+    finished = OutputLog(retention=OutputRetention(spill_dir=str(tmp_path)))
+    active = OutputLog(retention=OutputRetention(spill_dir=str(tmp_path)))
+    budget.add(finished)
+    budget.add(active)
+    finished.append('f' * 40)
+    active.append('a' * 50)
+    finished.set_finished(True)
+    active.append('a' * 20)
+    assert finished.resident_bytes == 0
+    assert active.resident_bytes == 70
+    assert finished.getvalue() == 'f' * 40
+
+
+def test_cursor():
+    log = OutputLog()
+    cursor = log.cursor()
+    assert cursor.read() is None
+    log.append('abc')
+    log.append('def')
+    assert cursor.pending == 6
+    assert cursor.read(max_length=4) == 'abcd'
+    assert cursor.read() == 'ef'
+    assert cursor.read() is None
+
+
+def test_binary_log(retention):
+    log = BinaryOutputLog(retention=retention)
+    for index in range(10):
+        log.append(b'\xff\x00 %d\n' % index)
+    assert log.read_lines(2, 3) == b'\xff\x00 2\n'
+    assert log.read(0, 3) == b'\xff\x00 '
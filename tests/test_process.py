@@ -0,0 +1,64 @@
+import asyncio
+import sys
+
+import pytest
+
+from oxen.process import Process
+from oxen.task import TaskStatus
+
+# Ignores SIGTERM, and reports once it's ready
+IGNORE_SIGTERM = '''
+import signal, sys, time
+signal.signal(signal.SIGTERM, signal.SIG_IGN)
+print('ready', flush=True)
+time.sleep(30)
+'''
+
+
+async def wait_for(predicate, timeout=10.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise TimeoutError
+        await asyncio.sleep(0.01)
+
+
+def create_process(*argv, **options):
+    process = Process(*argv, pty=False, **options)
+    process.loop = asyncio.get_running_loop()
+    return process
+
+
+def test_stopped_process_exits():
+    async def main():
+        process = create_process('sleep', '30')
+        process.start()
+        process.stop()
+        assert process.kill_handle is not None
+        await wait_for(lambda: process.get_status() == TaskStatus.FAILED)
+        # The pending kill is cancelled once the process exits
+        assert process.kill_handle is None
+        assert 'SIGTERM' in process.get_output()
+
+    asyncio.run(main())
+
+
+def test_process_ignoring_sigterm_is_killed(monkeypatch):
+    monkeypatch.setattr(Process, 'KILL_DELAY', 0.1)
+
+    async def main():
+        process = create_process(sys.executable, '-c', IGNORE_SIGTERM)
+        process.start()
+        await wait_for(lambda: 'ready' in process.get_output())
+        process.stop()
+        await wait_for(lambda: process.get_status() == TaskStatus.FAILED)
+        assert 'SIGKILL' in process.get_output()
+        assert process.kill_handle is None
+
+    asyncio.run(main())
+
+
+def test_binary_output_requires_pipes():
+    with pytest.raises(ValueError):
+        Process('cat', binary=True)
+    assert Process('cat', pty=False, binary=True).stdout.read() == b''
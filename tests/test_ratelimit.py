@@ -0,0 +1,147 @@
+import pytest
+
+from oxen.ratelimit import OutputLimit, OutputLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_token_bucket_starts_full():
+    bucket = TokenBucket(rate=10, capacity=20, now=0)
+    assert bucket.tokens == 20
+    assert bucket.get_delay() == 0
+
+
+def test_token_bucket_debt_delay():
+    bucket = TokenBucket(rate=10, capacity=20, now=0)
+    bucket.consume(25)
+    assert bucket.get_delay() == pytest.approx(0.5)
+
+
+def test_token_bucket_refill_is_capped():
+    bucket = TokenBucket(rate=10, capacity=20, now=0)
+    bucket.consume(15)
+    bucket.refill(1.0)
+    assert bucket.tokens == pytest.approx(15)
+    bucket.refill(100.0)
+    assert bucket.tokens == 20
+
+
+@pytest.mark.parametrize('options', [
+    {'action': 'explode'},
+    {'bytes_per_second': -1},
+    {'lines_per_second': '10'},
+    {'bytes_per_second': True},
+    {'burst': 0},
+])
+def test_output_limit_rejects_invalid_options(options):
+    with pytest.raises(ValueError):
+        OutputLimit(**options)
+
+
+def test_output_limit_options_round_trip():
+    limit = OutputLimit(bytes_per_second=100, burst=2.0, action='drop')
+    assert OutputLimit(**limit.get_options()).get_options() == limit.get_options()
+
+
+def test_output_limit_without_rates_is_inactive(clock):
+    limiter = OutputLimiter(OutputLimit(), clock=clock)
+    assert not limiter.is_active
+    assert limiter.admit(b'x' * 1000) == (b'x' * 1000, False)
+    assert limiter.consume(b'x' * 1000) == 0
+
+
+def test_throttle_delay(clock):
+    limiter = OutputLimiter(OutputLimit(bytes_per_second=100), clock=clock)
+    assert limiter.consume(b'x' * 100) == 0
+    assert limiter.consume(b'x' * 50) == pytest.approx(0.5)
+    assert limiter.exceeded_count == 1
+    clock.now = 0.5
+    assert limiter.consume(b'') == 0
+
+
+def test_line_limit_delay(clock):
+    limiter = OutputLimiter(OutputLimit(lines_per_second=2), clock=clock)
+    assert limiter.consume(b'a\nb\nc\nd\n') == pytest.approx(1.0)
+
+
+def test_read_size_is_bounded_by_burst(clock):
+    limiter = OutputLimiter(OutputLimit(bytes_per_second=100, burst=0.5), clock=clock)
+    assert limiter.get_read_size(4096) == 50
+    limiter.is_enabled = False
+    assert limiter.get_read_size(4096) == 4096
+
+
+def test_drop_admits_whole_lines(clock):
+    limiter = OutputLimiter(OutputLimit(bytes_per_second=10, action='drop'), clock=clock)
+    admitted, exceeded = limiter.admit(b'abcd\nefgh\nijkl\n')
+    assert admitted == b'abcd\nefgh\n'
+    assert exceeded
+    assert limiter.dropped_bytes == 5
+    assert limiter.dropped_lines == 1
+
+
+def test_drop_respects_line_limit(clock):
+    limiter = OutputLimiter(OutputLimit(lines_per_second=1, action='drop'), clock=clock)
+    admitted, exceeded = limiter.admit(b'a\nb\nc\n')
+    assert admitted == b'a\n'
+    assert exceeded
+    assert limiter.dropped_lines == 2
+
+
+def test_sample_retains_a_line_per_interval(clock):
+    limiter = OutputLimiter(OutputLimit(lines_per_second=1, action='sample'), clock=clock)
+    admitted, _ = limiter.admit(b'a\nb\nc\n')
+    assert admitted == b'a\nc\n'
+    clock.now = 0.1
+    admitted, _ = limiter.admit(b'd\ne\n')
+    assert admitted == b''
+    clock.now = 0.1 + OutputLimiter.SAMPLE_INTERVAL
+    admitted, _ = limiter.admit(b'f\ng\nh\nj\n')
+    assert admitted.endswith(b'j\n')
+
+
+def test_summary_is_throttled(clock):
+    limiter = OutputLimiter(OutputLimit(bytes_per_second=10, action='drop'), clock=clock)
+    assert limiter.get_summary_delay() is None
+    limiter.admit(b'x' * 9 + b'\n' + b'y' * 99 + b'\n')
+    assert limiter.get_summary_delay() == OutputLimiter.SUMMARY_INTERVAL
+    assert limiter.get_summary() is None
+    clock.now = OutputLimiter.SUMMARY_INTERVAL
+    summary = limiter.get_summary()
+    assert 'dropped 100 bytes (1 lines)' in summary
+    assert limiter.dropped_bytes == 0
+    assert limiter.get_summary() is None
+
+
+def test_forced_summary(clock):
+    limiter = OutputLimiter(OutputLimit(bytes_per_second=10, action='drop'), clock=clock)
+    limiter.admit(b'x' * 20 + b'\n')
+    assert limiter.get_summary(force=True) is not None
+    assert limiter.get_summary(force=True) is None
+
+
+def test_summary_counts_against_the_limits(clock):
+    limiter = OutputLimiter(OutputLimit(bytes_per_second=1000, action='drop'), clock=clock)
+    limiter.admit(b'x' * 2000 + b'\n')
+    clock.now = OutputLimiter.SUMMARY_INTERVAL
+    tokens = limiter.byte_bucket.capacity
+    summary = limiter.get_summary()
+    assert limiter.byte_bucket.tokens == tokens - len(summary.encode('utf8'))
+
+
+def test_set_limit_replaces_buckets(clock):
+    limiter = OutputLimiter(OutputLimit(bytes_per_second=10), clock=clock)
+    limiter.set_limit(OutputLimit(lines_per_second=5))
+    assert limiter.byte_bucket is None
+    assert limiter.line_bucket.capacity == 5
@@ -0,0 +1,175 @@
+import asyncio
+import sys
+
+import pytest
+
+from oxen.remote import (
+    RemoteProcess,
+    WorkerPool,
+    open_connection,
+    parse_address,
+    receive_messages,
+    send_message,
+)
+from oxen.task import TaskEvent, TaskStatus
+from oxen.worker import Worker
+
+
+async def wait_for(predicate, timeout=10.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise TimeoutError
+        await asyncio.sleep(0.01)
+
+
+def create_task(pool, *argv, **options):
+    task = RemoteProcess(*argv, **options)
+    task.loop = asyncio.get_running_loop()
+    task.worker_pool = pool
+    return task
+
+
+def run_with_worker(tmp_path, scenario, *, slots=2):
+    """
+    Runs the given scenario against a worker pool, with a worker connected over a
+    (loopback) unix socket.
+    """
+    address = f'unix:{tmp_path / "workers.sock"}'
+
+    async def main():
+        pool = WorkerPool()
+        await pool.listen(address)
+        worker = Worker(address, slots=slots, name='test-worker')
+        reader, writer = await open_connection(address)
+        future_serve = asyncio.ensure_future(worker.serve(reader, writer))
+        try:
+            await wait_for(lambda: pool.workers)
+            await scenario(pool, worker)
+        finally:
+            future_serve.cancel()
+            pool.server.close()
+            await pool.server.wait_closed()
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize('address, parsed', [
+    ('localhost:4243', ('localhost', 4243)),
+    (':4243', ('127.0.0.1', 4243)),
+    ('0.0.0.0:4243', ('0.0.0.0', 4243)),
+    ('unix:/tmp/oxen.sock', '/tmp/oxen.sock'),
+])
+def test_parse_address(address, parsed):
+    assert parse_address(address) == parsed
+
+
+def test_output_and_status_are_relayed(tmp_path):
+    async def scenario(pool, worker):
+        task = create_task(pool, sys.executable, '-c', 'print("hello")', pty=False)
+        statuses = []
+        task.events.subscribe(
+            lambda event: event == TaskEvent.STATUS_CHANGED and statuses.append(task.get_status())
+        )
+        task.start()
+        await wait_for(lambda: task.get_status() == TaskStatus.FINISHED)
+        assert 'hello' in task.get_output()
+        assert '[Running on test-worker]' in task.get_output()
+        assert statuses[-2:] == [TaskStatus.ACTIVE, TaskStatus.FINISHED]
+        assert pool.workers[0].free_slots == 2
+        assert not worker.id_to_tasks
+
+    run_with_worker(tmp_path, scenario)
+
+
+def test_failed_spawn(tmp_path):
+    async def scenario(pool, worker):
+        task = create_task(pool, str(tmp_path / 'missing'), pty=False)
+        task.start()
+        await wait_for(lambda: task.get_status() == TaskStatus.FAILED)
+        assert 'missing' in task.get_output()
+        assert pool.workers[0].free_slots == 2
+
+    run_with_worker(tmp_path, scenario)
+
+
+def test_stop(tmp_path):
+    async def scenario(pool, worker):
+        task = create_task(pool, 'sleep', '30')
+        task.start()
+        await wait_for(lambda: task.get_status() == TaskStatus.ACTIVE)
+        task.stop()
+        await wait_for(lambda: task.get_status() == TaskStatus.FAILED)
+        assert not worker.id_to_tasks
+
+    run_with_worker(tmp_path, scenario)
+
+
+def test_tasks_are_queued_until_a_slot_is_free(tmp_path):
+    async def scenario(pool, worker):
+        first = create_task(pool, 'sleep', '30')
+        second = create_task(pool, sys.executable, '-c', 'print("second")', pty=False)
+        first.start()
+        second.start()
+        await wait_for(lambda: first.get_status() == TaskStatus.ACTIVE)
+        assert second.get_status() == TaskStatus.PENDING
+        assert list(pool.queue) == [second]
+        first.stop()
+        await wait_for(lambda: second.get_status() == TaskStatus.FINISHED)
+        assert 'second' in second.get_output()
+
+    run_with_worker(tmp_path, scenario, slots=1)
+
+
+def test_restart_ignores_the_previous_run(tmp_path):
+    async def scenario(pool, worker):
+        task = create_task(pool, 'sleep', '30')
+        task.start()
+        await wait_for(lambda: task.get_status() == TaskStatus.ACTIVE)
+        task.restart()
+        await wait_for(lambda: task.run == 2 and task.get_status() == TaskStatus.ACTIVE)
+        # The exit of the first run mustn't be mistaken for that of the second
+        await asyncio.sleep(0.2)
+        assert task.get_status() == TaskStatus.ACTIVE
+        assert pool.workers[0].free_slots == 1
+        task.stop()
+        await wait_for(lambda: task.get_status() == TaskStatus.FAILED)
+
+    run_with_worker(tmp_path, scenario)
+
+
+def test_lost_worker_fails_its_tasks(tmp_path):
+    address = f'unix:{tmp_path / "workers.sock"}'
+
+    async def main():
+        pool = WorkerPool()
+        await pool.listen(address)
+        reader, writer = await open_connection(address)
+        send_message(writer, type='register', name='fake', slots=1)
+        task = create_task(pool, 'sleep', '30')
+        task.start()
+        messages = receive_messages(reader)
+        start = await messages.__anext__()
+        assert (start['type'], start['task'], start['run']) == ('start', task.id, 1)
+        assert start['argv'] == ['sleep', '30']
+        send_message(writer, type='status', task=task.id, run=1, status='active')
+        # Messages from another run are ignored
+        send_message(writer, type='output', task=task.id, run=0, data='stale\n')
+        send_message(writer, type='output', task=task.id, run=1, data='current\n')
+        await wait_for(lambda: 'current' in task.get_output())
+        assert 'stale' not in task.get_output()
+        writer.close()
+        await wait_for(lambda: task.get_status() == TaskStatus.FAILED)
+        assert 'Lost connection to worker fake' in task.get_output()
+        assert not pool.workers
+        pool.server.close()
+        await pool.server.wait_closed()
+
+    asyncio.run(main())
+
+
+def test_unsupported_options():
+    with pytest.raises(ValueError):
+        RemoteProcess('cat', binary=True)
+    with pytest.raises(ValueError):
+        RemoteProcess('cat', sample_interval=1.0)
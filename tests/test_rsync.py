@@ -0,0 +1,203 @@
+import asyncio
+import gc
+import os
+
+import pytest
+
+from oxen.changes import ChangeSet
+from oxen.rsync import RsyncHandler, ShardedRsync, auto_rsync, partition_entries
+from oxen.task import TaskStatus
+
+FLAGS = {
+    'archive': True,
+    'compress': False,
+    'delete': False,
+    'recursive': True,
+    'update': False,
+    'verbose': False,
+}
+
+# Records its arguments (and those of the --files-from file) to $RSYNC_LOG.
+# If $RSYNC_DELAY is set, it sleeps instead.
+FAKE_RSYNC = '''#!/bin/sh
+[ -n "$RSYNC_DELAY" ] && exec sleep "$RSYNC_DELAY"
+for arg in "$@"; do
+    case "$arg" in
+        --files-from=*) printf '%s\\n' "$* [$(tr '\\0' ',' < "${arg#--files-from=}")]" >> "$RSYNC_LOG"; exit 0;;
+    esac
+done
+printf '%s\\n' "$*" >> "$RSYNC_LOG"
+'''
+
+
+class Event:
+    """
+    Stands in for a watchdog event.
+    """
+
+    def __init__(self, event_type, src_path, is_directory=False):
+        self.event_type = event_type
+        self.src_path = src_path
+        self.dest_path = ''
+        self.is_directory = is_directory
+
+
+def get_files_from(process):
+    for arg in process.argv:
+        if arg.startswith('--files-from='):
+            return arg[len('--files-from='):]
+
+
+def write_tree(root, sizes):
+    for name, size in sizes.items():
+        os.makedirs(root / name)
+        (root / name / 'data').write_bytes(b'x' * size)
+    (root / 'top.txt').write_text('top')
+
+
+@pytest.fixture
+def fake_rsync(tmp_path, monkeypatch):
+    bin_dir = tmp_path / 'bin'
+    bin_dir.mkdir()
+    rsync = bin_dir / 'rsync'
+    rsync.write_text(FAKE_RSYNC)
+    rsync.chmod(0o755)
+    log = tmp_path / 'rsync.log'
+    monkeypatch.setenv('PATH', f'{bin_dir}{os.pathsep}{os.environ["PATH"]}')
+    monkeypatch.setenv('RSYNC_LOG', str(log))
+    return log
+
+
+def run_task(task):
+    async def main():
+        task.loop = asyncio.get_running_loop()
+        task.start()
+        while task.get_status() in (TaskStatus.PENDING, TaskStatus.ACTIVE):
+            await asyncio.sleep(0.01)
+
+    asyncio.run(main())
+
+
+def test_partition_by_size(tmp_path):
+    write_tree(tmp_path, {'a': 100, 'b': 60, 'c': 50, 'd': 10})
+    shards = partition_entries(tmp_path, 2, 'size')
+    assert sorted(map(sorted, shards)) == [['a', 'd'], ['b', 'c']]
+
+
+def test_partition_by_directory(tmp_path):
+    write_tree(tmp_path, {'a': 1, 'b': 1, 'c': 1})
+    assert partition_entries(tmp_path, 2, 'directory') == [['a', 'c'], ['b']]
+
+
+def test_partition_has_no_empty_shards(tmp_path):
+    write_tree(tmp_path, {'a': 1})
+    assert partition_entries(tmp_path, 4, 'size') == [['a']]
+
+
+def test_partition_rejects_unknown_strategies(tmp_path):
+    write_tree(tmp_path, {'a': 1})
+    with pytest.raises(ValueError):
+        partition_entries(tmp_path, 2, 'name')
+
+
+def test_sharded_sync(tmp_path, fake_rsync):
+    source = tmp_path / 'source'
+    write_tree(source, {'a': 100, 'b': 60, 'c': 50})
+    handler = RsyncHandler(source, tmp_path / 'dest', FLAGS, shards=2)
+    task = ShardedRsync(handler)
+    run_task(task)
+    assert task.get_status() == TaskStatus.FINISHED
+    assert '[Sync complete]' in task.get_output()
+    runs = fake_rsync.read_text().splitlines()
+    assert len(runs) == 3
+    shard_runs = sorted(run.rsplit(' ', 1)[-1] for run in runs[:2])
+    assert shard_runs == ['[a]', '[b,c]']
+    # The top-level pass runs last
+    assert '--dirs --no-recursive' in runs[2]
+
+
+def test_sharded_sync_failure(tmp_path, monkeypatch):
+    source = tmp_path / 'source'
+    write_tree(source, {'a': 1, 'b': 1})
+    monkeypatch.setenv('PATH', str(tmp_path / 'missing'))
+    task = ShardedRsync(RsyncHandler(source, tmp_path / 'dest', FLAGS, shards=2))
+    run_task(task)
+    assert task.get_status() == TaskStatus.FAILED
+    assert 'Unable to start' in task.get_output()
+
+
+def test_auto_rsync_watches_every_file(tmp_path):
+    # rsync transfers the files that a Watch ignores by default (eg: under .git)
+    watch = auto_rsync(tmp_path, tmp_path / 'dest', name='sync')
+    assert watch.path_filter.accepts(str(tmp_path / '.git' / 'HEAD'))
+    watch = auto_rsync(tmp_path, tmp_path / 'dest', name='sync', exclude=['.git/'])
+    assert not watch.path_filter.accepts(str(tmp_path / '.git' / 'HEAD'))
+
+
+def test_incremental_paths(tmp_path):
+    handler = RsyncHandler(tmp_path, tmp_path / 'dest', FLAGS)
+    changes = ChangeSet()
+    changes.add(Event('modified', str(tmp_path / 'a' / 'main.py')))
+    changes.add(Event('deleted', str(tmp_path / 'old.py')))
+    # Without --delete, deletions aren't propagated
+    assert handler.get_incremental_paths(changes) == [os.path.join('a', 'main.py')]
+    changes.is_forced = True
+    assert handler.get_incremental_paths(changes) is None
+
+
+def test_deletions_alone_arent_synced(tmp_path):
+    handler = RsyncHandler(tmp_path, tmp_path / 'dest', FLAGS)
+    changes = ChangeSet()
+    changes.add(Event('deleted', str(tmp_path / 'old.py')))
+    assert handler(changes) is None
+
+
+def test_deletions_require_a_full_sync(tmp_path):
+    handler = RsyncHandler(tmp_path, tmp_path / 'dest', dict(FLAGS, delete=True))
+    changes = ChangeSet()
+    changes.add(Event('deleted', str(tmp_path / 'old.py')))
+    assert handler.get_incremental_paths(changes) is None
+
+
+def test_files_from_is_removed_on_exit(tmp_path, fake_rsync):
+    handler = RsyncHandler(tmp_path, tmp_path / 'dest', FLAGS)
+    process = handler.create_process(paths=['a', 'b'])
+    files_from = get_files_from(process)
+    run_task(process)
+    assert fake_rsync.read_text().endswith('[a,b]\n')
+    assert not os.path.exists(files_from)
+
+
+def test_files_from_is_removed_on_failed_spawn(tmp_path, monkeypatch):
+    monkeypatch.setenv('PATH', str(tmp_path / 'missing'))
+    handler = RsyncHandler(tmp_path, tmp_path / 'dest', FLAGS)
+    process = handler.create_process(paths=['a'])
+    files_from = get_files_from(process)
+    with pytest.raises(OSError):
+        run_task(process)
+    del process
+    gc.collect()
+    assert not os.path.exists(files_from)
+
+
+def test_files_from_is_removed_when_stopped_before_starting(tmp_path, fake_rsync, monkeypatch):
+    monkeypatch.setenv('RSYNC_DELAY', '30')
+    source = tmp_path / 'source'
+    write_tree(source, {'a': 1, 'b': 1, 'c': 1})
+    handler = RsyncHandler(source, tmp_path / 'dest', FLAGS, shards=3, max_concurrency=1)
+    task = ShardedRsync(handler)
+    queued = []
+
+    async def main():
+        task.loop = asyncio.get_running_loop()
+        task.start()
+        while not task.running:
+            await asyncio.sleep(0.01)
+        queued.extend(get_files_from(process) for process in task.queue[:-1])
+        task.stop()
+        while task.get_status() == TaskStatus.ACTIVE:
+            await asyncio.sleep(0.01)
+
+    asyncio.run(main())
+    assert len(queued) == 2
+    assert not any(os.path.exists(files_from) for files_from in queued)
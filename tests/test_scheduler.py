@@ -0,0 +1,150 @@
+import pytest
+
+from oxen.scheduler import Scheduler
+from oxen.task import BufferedTask, TaskStatus
+
+
+class FakeTask(BufferedTask):
+    def __init__(self, name):
+        super().__init__(name)
+        self.status = TaskStatus.PENDING
+
+    def get_status(self):
+        return self.status
+
+
+class Harness:
+    """
+    Drives a scheduler the way a session does, recording the order in which tasks start.
+    """
+
+    def __init__(self, **options):
+        self.scheduler = Scheduler(**options)
+        self.started = []
+
+    def add(self, name, **options):
+        task = FakeTask(name)
+        self.scheduler.add(task, **options)
+        return task
+
+    def start_task(self, task):
+        self.started.append(task.name)
+        self.set_status(task, TaskStatus.ACTIVE)
+
+    def set_status(self, task, status):
+        task.status = status
+        self.scheduler.on_task_status_changed(task)
+
+    def start(self):
+        self.scheduler.start(self.start_task)
+
+
+def test_independent_tasks_start_in_order():
+    harness = Harness()
+    for name in 'abc':
+        harness.add(name)
+    harness.start()
+    assert harness.started == ['a', 'b', 'c']
+
+
+def test_dependents_wait_for_success():
+    harness = Harness()
+    build = harness.add('build')
+    harness.add('test', depends_on=[build])
+    harness.start()
+    assert harness.started == ['build']
+    harness.set_status(build, TaskStatus.FINISHED)
+    assert harness.started == ['build', 'test']
+
+
+def test_failed_dependency_blocks_dependents():
+    harness = Harness()
+    build = harness.add('build')
+    test = harness.add('test', depends_on=[build])
+    harness.start()
+    harness.set_status(build, TaskStatus.FAILED)
+    assert harness.started == ['build']
+    assert 'dependency "build" failed' in test.get_output()
+    # Retrying the dependency unblocks its dependents once it succeeds
+    harness.set_status(build, TaskStatus.ACTIVE)
+    harness.set_status(build, TaskStatus.FINISHED)
+    assert harness.started == ['build', 'test']
+
+
+def test_dependencies_must_be_added_first():
+    scheduler = Scheduler()
+    with pytest.raises(ValueError):
+        scheduler.add(FakeTask('test'), depends_on=[FakeTask('build')])
+
+
+def test_resources_beyond_capacity_are_rejected():
+    scheduler = Scheduler(resources={'cpu': 2})
+    with pytest.raises(ValueError):
+        scheduler.add(FakeTask('a'), resources={'cpu': 3})
+    with pytest.raises(ValueError):
+        scheduler.add(FakeTask('b'), resources={'gpu': 1})
+
+
+def test_max_concurrency():
+    harness = Harness(max_concurrency=2)
+    tasks = [harness.add(name) for name in 'abcd']
+    harness.start()
+    assert harness.started == ['a', 'b']
+    harness.set_status(tasks[1], TaskStatus.FINISHED)
+    assert harness.started == ['a', 'b', 'c']
+    harness.set_status(tasks[0], TaskStatus.FAILED)
+    assert harness.started == ['a', 'b', 'c', 'd']
+
+
+def test_resource_limits():
+    harness = Harness(resources={'cpu': 4})
+    big = harness.add('big', resources={'cpu': 3})
+    harness.add('medium', resources={'cpu': 2})
+    harness.add('small', resources={'cpu': 1})
+    harness.start()
+    # Tasks that fit start ahead of earlier ones that don't
+    assert harness.started == ['big', 'small']
+    assert harness.scheduler.available == {'cpu': 0}
+    harness.set_status(big, TaskStatus.FINISHED)
+    assert harness.started == ['big', 'small', 'medium']
+    assert harness.scheduler.available == {'cpu': 1}
+
+
+def test_repeated_status_changes_release_once():
+    harness = Harness(resources={'cpu': 1})
+    task = harness.add('a', resources={'cpu': 1})
+    harness.start()
+    harness.set_status(task, TaskStatus.FINISHED)
+    harness.set_status(task, TaskStatus.FINISHED)
+    assert harness.scheduler.available == {'cpu': 1}
+    assert not harness.scheduler.running
+
+
+def test_restarted_tasks_are_charged():
+    harness = Harness(max_concurrency=1, resources={'cpu': 1})
+    first = harness.add('first', resources={'cpu': 1})
+    second = harness.add('second', resources={'cpu': 1})
+    harness.start()
+    harness.set_status(first, TaskStatus.FINISHED)
+    assert harness.started == ['first', 'second']
+    # Restarted (eg: via its task action) while the other task holds the limits
+    harness.set_status(first, TaskStatus.ACTIVE)
+    assert harness.scheduler.running == {first.id, second.id}
+    assert harness.scheduler.available == {'cpu': -1}
+    harness.set_status(second, TaskStatus.FINISHED)
+    harness.set_status(first, TaskStatus.FINISHED)
+    assert not harness.scheduler.running
+    assert harness.scheduler.available == {'cpu': 1}
+
+
+def test_externally_started_tasks_leave_the_queue():
+    harness = Harness(max_concurrency=1)
+    first = harness.add('first')
+    second = harness.add('second')
+    harness.start()
+    harness.set_status(second, TaskStatus.ACTIVE)
+    assert second.id not in harness.scheduler.pending
+    harness.set_status(first, TaskStatus.FINISHED)
+    harness.set_status(second, TaskStatus.FINISHED)
+    assert harness.started == ['first']
+    assert not harness.scheduler.running
@@ -0,0 +1,103 @@
+import asyncio
+import os
+import zlib
+
+from oxen.store import RECORD_HEADER, OutputStore, StoredRun, get_segment_path
+from oxen.task import BufferedTask
+
+
+def add_task(store, name):
+    task = BufferedTask(name)
+    store.add(task)
+    return task, store.key_to_writers[store.task_id_to_keys[task.id]]
+
+
+def write_records(task, writer, records):
+    """
+    Writes each of the given chunks of output as a separate record (as the writer thread would).
+    """
+    for text in records:
+        task.write_output(text)
+        writer.write_record(*writer.take_batch())
+    writer.close()
+
+
+def create_prior_runs(store, key, count):
+    run_ids = [f'{index * 1000:013d}-1' for index in range(count)]
+    for run_id in run_ids:
+        os.makedirs(os.path.join(store.path, key, run_id))
+    return run_ids
+
+
+def test_round_trip_across_segments(tmp_path):
+    store = OutputStore(str(tmp_path), segment_size=64)
+    task, writer = add_task(store, 'build')
+    records = [f'line {index} ' * 4 + '\n' for index in range(10)]
+    write_records(task, writer, records)
+    run = StoredRun(writer.path)
+    assert run.read() == ''.join(records).encode('utf8')
+    assert run.byte_length == task.output.byte_length
+    assert len(run.segments) == writer.segment_count > 1
+    assert all(segment.is_sealed for segment in run.segments)
+    run.close()
+
+
+def test_ranges_spanning_records(tmp_path):
+    store = OutputStore(str(tmp_path))
+    task, writer = add_task(store, 'build')
+    write_records(task, writer, ['aaaa', 'bbbb', 'cccc'])
+    run = StoredRun(writer.path)
+    assert list(run.iter_bytes(2, 10)) == [b'aa', b'bbbb', b'cc']
+    assert run.read(4, 8) == b'bbbb'
+    assert run.read(11) == b'c'
+    assert run.read(12) == b''
+    assert run.read(6, 100) == b'bbcccc'
+    run.close()
+
+
+def test_partial_record_ends_the_run(tmp_path):
+    store = OutputStore(str(tmp_path))
+    task, writer = add_task(store, 'build')
+    write_records(task, writer, ['complete\n', 'truncated\n'])
+    path = get_segment_path(writer.path, 0)
+    os.truncate(path, os.path.getsize(path) - 3)
+    run = StoredRun(writer.path)
+    assert run.read() == b'complete\n'
+    run.close()
+    # Likewise for a partially written header
+    complete_size = RECORD_HEADER.size + len(zlib.compress(b'complete\n', store.COMPRESSION_LEVEL))
+    os.truncate(path, complete_size + RECORD_HEADER.size - 1)
+    run = StoredRun(writer.path)
+    assert run.read() == b'complete\n'
+    run.close()
+
+
+def test_prior_runs_are_pruned_on_start(tmp_path):
+    store = OutputStore(str(tmp_path), max_runs=3)
+    task, _ = add_task(store, 'build')
+    key = store.task_id_to_keys[task.id]
+    run_ids = create_prior_runs(store, key, 5)
+    assert store.get_run_ids(key) == run_ids[::-1]
+    loop = asyncio.new_event_loop()
+    try:
+        store.start(loop)
+        # Along with the current run, max_runs are retained
+        assert store.get_run_ids(key) == [run_ids[4], run_ids[3]]
+        assert sorted(os.listdir(os.path.join(store.path, key))) == run_ids[-2:]
+    finally:
+        store.close()
+        loop.close()
+
+
+def test_tasks_sharing_a_name_have_separate_keys(tmp_path):
+    store = OutputStore(str(tmp_path))
+    first, first_writer = add_task(store, 'build')
+    second, second_writer = add_task(store, 'build')
+    first_key = store.task_id_to_keys[first.id]
+    second_key = store.task_id_to_keys[second.id]
+    assert first_key != second_key
+    assert second_key == f'{first_key}.2'
+    write_records(first, first_writer, ['first\n'])
+    write_records(second, second_writer, ['second\n'])
+    assert StoredRun(first_writer.path).read() == b'first\n'
+    assert StoredRun(second_writer.path).read() == b'second\n'
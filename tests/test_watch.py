@@ -0,0 +1,159 @@
+import asyncio
+import os
+
+from oxen.task import BufferedTask, TaskEvent, TaskStatus
+from oxen.watch import Watch
+
+ROOT = os.path.abspath('/watched')
+
+
+class Event:
+    """
+    Stands in for a watchdog event.
+    """
+
+    def __init__(self, event_type, src_path, is_directory=False):
+        self.event_type = event_type
+        self.src_path = src_path
+        self.dest_path = ''
+        self.is_directory = is_directory
+
+
+class FakeTask(BufferedTask):
+    def __init__(self, changes):
+        super().__init__('handler')
+        self.changes = changes
+        self.status = TaskStatus.PENDING
+
+    def start(self):
+        self.set_status(TaskStatus.ACTIVE)
+
+    def stop(self):
+        self.set_status(TaskStatus.FAILED)
+
+    def set_status(self, status):
+        self.status = status
+        self.events.publish(TaskEvent.STATUS_CHANGED)
+
+    def get_status(self):
+        return self.status
+
+
+class Harness:
+    """
+    Drives a watch the way the observer service does, recording the tasks its handler creates.
+    """
+
+    def __init__(self, **options):
+        self.tasks = []
+        self.watch = Watch(ROOT, handler=self.create_task, name='watch', delay=0, **options)
+        self.watch.loop = asyncio.get_running_loop()
+
+    def create_task(self, changes):
+        if changes.paths == [os.path.join(ROOT, 'ignored')]:
+            # Nothing to be done
+            return None
+        task = FakeTask(changes)
+        self.tasks.append(task)
+        return task
+
+    def change(self, *names):
+        self.watch.dispatch_events([Event('modified', os.path.join(ROOT, name)) for name in names])
+
+    def get_paths(self, task):
+        return sorted(os.path.relpath(path, ROOT) for path in task.changes.paths)
+
+    async def settle(self):
+        # Consumes are scheduled, and task events are delivered, on later loop iterations
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+
+def run(scenario):
+    asyncio.run(scenario())
+
+
+def test_queue_merges_changes_while_a_task_runs():
+    async def scenario():
+        harness = Harness(policy='queue')
+        harness.change('a')
+        await harness.settle()
+        assert len(harness.tasks) == 1
+        harness.change('b')
+        await harness.settle()
+        harness.change('c', 'b')
+        await harness.settle()
+        # Held back until the running task completes
+        assert len(harness.tasks) == 1
+        assert harness.tasks[0].status == TaskStatus.ACTIVE
+        harness.tasks[0].set_status(TaskStatus.FINISHED)
+        await harness.settle()
+        assert len(harness.tasks) == 2
+        assert harness.get_paths(harness.tasks[1]) == ['b', 'c']
+
+    run(scenario)
+
+
+def test_restart_stops_the_active_task():
+    async def scenario():
+        harness = Harness(policy='restart')
+        harness.change('a')
+        await harness.settle()
+        first = harness.tasks[0]
+        harness.change('b')
+        await harness.settle()
+        assert first.status == TaskStatus.FAILED
+        assert len(harness.tasks) == 2
+        # The interrupted task's changes are carried over
+        assert harness.get_paths(harness.tasks[1]) == ['a', 'b']
+        assert list(harness.watch.active_tasks) == [harness.tasks[1]]
+
+    run(scenario)
+
+
+def test_restart_doesnt_carry_over_completed_changes():
+    async def scenario():
+        harness = Harness(policy='restart')
+        harness.change('a')
+        await harness.settle()
+        harness.tasks[0].set_status(TaskStatus.FINISHED)
+        await harness.settle()
+        harness.change('b')
+        await harness.settle()
+        assert harness.get_paths(harness.tasks[1]) == ['b']
+
+    run(scenario)
+
+
+def test_parallel_honours_its_limit():
+    async def scenario():
+        harness = Harness(policy='parallel', max_parallel=2)
+        for name in 'abc':
+            harness.change(name)
+            await harness.settle()
+        assert [harness.get_paths(task) for task in harness.tasks] == [['a'], ['b']]
+        assert all(task.status == TaskStatus.ACTIVE for task in harness.tasks)
+        harness.change('d')
+        await harness.settle()
+        assert len(harness.tasks) == 2
+        harness.tasks[0].set_status(TaskStatus.FINISHED)
+        await harness.settle()
+        assert len(harness.tasks) == 3
+        assert harness.get_paths(harness.tasks[2]) == ['c', 'd']
+        assert len(harness.watch.active_tasks) == 2
+
+    run(scenario)
+
+
+def test_handler_may_skip_changes():
+    async def scenario():
+        harness = Harness(policy='queue')
+        harness.change('ignored')
+        await harness.settle()
+        assert not harness.tasks
+        assert not harness.watch.active_tasks
+        harness.change('a')
+        await harness.settle()
+        assert [harness.get_paths(task) for task in harness.tasks] == [['a']]
+
+    run(scenario)
@@ -0,0 +1,117 @@
+import tornado.httpclient
+import tornado.testing
+import tornado.websocket
+
+from oxen.session import Session
+from oxen.task import BufferedTask, TaskStatus
+from oxen.webserver import WebApp
+
+
+class FakeTask(BufferedTask):
+    def get_status(self):
+        return TaskStatus.ACTIVE
+
+
+class WebAppTestCase(tornado.testing.AsyncHTTPTestCase):
+    def get_app(self):
+        self.session = Session()
+        self.task = FakeTask('fake')
+        self.task.write_output(''.join(f'line {index}\n' for index in range(5)))
+        self.session += self.task
+        return WebApp(self.session)
+
+    def get_websocket_url(self, path):
+        return self.get_url(path).replace('http://', 'ws://', 1)
+
+
+class TestTaskOutputHandler(WebAppTestCase):
+    @tornado.testing.gen_test
+    async def test_tail(self):
+        url = self.get_websocket_url(f'/task-output/{self.task.id}?tail=2')
+        connection = await tornado.websocket.websocket_connect(url)
+        assert await connection.read_message() == 'line 3\nline 4\n'
+        connection.close()
+
+    @tornado.testing.gen_test
+    async def test_invalid_start_arguments(self):
+        for query in ('offset=x', 'line=1.5', 'tail='):
+            url = self.get_websocket_url(f'/task-output/{self.task.id}?{query}')
+            try:
+                await tornado.websocket.websocket_connect(url)
+            except tornado.httpclient.HTTPClientError as error:
+                assert error.code == 400
+            else:
+                raise AssertionError(f'{query} was accepted')
+
+
+class TestTaskRawOutputHandler(WebAppTestCase):
+    def fetch_raw(self, query='', range_header=None):
+        headers = {'Range': range_header} if range_header is not None else {}
+        return self.fetch(
+            f'/task-output/{self.task.id}/raw{query}',
+            headers=headers,
+            decompress_response=False
+        )
+
+    @property
+    def output(self):
+        return self.task.get_output().encode('utf8')
+
+    def test_full_output(self):
+        response = self.fetch_raw()
+        assert response.code == 200
+        assert response.body == self.output
+        assert response.headers['X-Oxen-Offset'] == str(len(self.output))
+
+    def test_byte_range(self):
+        response = self.fetch_raw(range_header='bytes=7-13')
+        assert response.code == 206
+        assert response.body == self.output[7:14]
+        assert response.headers['Content-Range'] == f'bytes 7-13/{len(self.output)}'
+        # An open or overlong range ends with the output
+        response = self.fetch_raw(range_header='bytes=28-1000')
+        assert response.body == self.output[28:]
+        assert response.headers['Content-Range'] == f'bytes 28-34/{len(self.output)}'
+
+    def test_suffix_range(self):
+        response = self.fetch_raw(range_header='bytes=-7')
+        assert response.code == 206
+        assert response.body == b'line 4\n'
+        assert response.headers['Content-Range'] == f'bytes 28-34/{len(self.output)}'
+        response = self.fetch_raw(range_header='bytes=-1000')
+        assert response.body == self.output
+
+    def test_unsatisfiable_range(self):
+        response = self.fetch_raw(range_header=f'bytes={len(self.output)}-')
+        assert response.code == 416
+        assert response.headers['Content-Range'] == f'bytes */{len(self.output)}'
+        assert self.fetch_raw(range_header='bytes=5-2').code == 416
+
+    def test_malformed_ranges_are_ignored(self):
+        for header in ('bytes=-', 'bytes=a-b', 'bytes=0-1,4-5', 'lines=0-1'):
+            response = self.fetch_raw(range_header=header)
+            assert response.code == 200
+            assert response.body == self.output
+
+    def test_since(self):
+        response = self.fetch_raw('?since=28')
+        assert response.body == b'line 4\n'
+        self.task.write_output('line 5\n')
+        response = self.fetch_raw(f'?since={response.headers["X-Oxen-Offset"]}')
+        assert response.body == b'line 5\n'
+        assert self.fetch_raw('?since=1000').body == b''
+        assert self.fetch_raw('?since=x').code == 400
+        # A range takes precedence
+        assert self.fetch_raw('?since=28', range_header='bytes=0-5').body == b'line 0'
+
+    def test_unknown_task(self):
+        assert self.fetch('/task-output/1000/raw').code == 404
+
+
+class TestMetricsHandler(WebAppTestCase):
+    def test_scrapes_are_repeatable(self):
+        first = self.fetch('/metrics').body.decode('utf8')
+        assert f'oxen_task_output_bytes_total{{task="fake",id="{self.task.id}"}} 35' in first
+        assert 'oxen_event_loop_lag_seconds_count' in first
+        # Nothing is reset by a scrape
+        assert self.fetch('/metrics').body.decode('utf8') == first